@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# compares the per-frame overhead of running the camera trigger command line
+# for each frame with the persistent gphoto2 shell session. a fake gphoto2
+# stands in for the real one, it simulates camera detection and capture time
+
+import sys
+if (sys.hexversion & 0xFF000000) != 0x03000000:
+    print('Python 3.x required')
+    sys.exit(1)
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+
+DETECTION_TIME = float(os.environ.get('FAKE_GPHOTO2_DETECTION_TIME', '0.5'))
+CAPTURE_TIME = float(os.environ.get('FAKE_GPHOTO2_CAPTURE_TIME', '0.1'))
+
+def fake_capture(number):
+    time.sleep(CAPTURE_TIME)
+    print('New file is in location /capt{0:04}.jpg on the camera'.format(number), flush=True)
+
+def fake_gphoto2(args):
+    time.sleep(DETECTION_TIME)
+
+    if '--shell' not in args:
+        fake_capture(0)
+        return
+
+    number = 0
+
+    while True:
+        sys.stdout.write('gphoto2: {/tmp} /> ')
+        sys.stdout.flush()
+
+        line = sys.stdin.readline()
+
+        if len(line) == 0 or line.strip() == 'exit':
+            return
+
+        if line.strip() in ['capture-image', 'trigger-capture', 'capture-image-and-download']:
+            fake_capture(number)
+            number += 1
+        else:
+            print('*** Error: unknown command', flush=True)
+
+def benchmark(name, camera_trigger, count):
+    durations = []
+
+    for i in range(count):
+        start = time.monotonic()
+        camera_trigger.trigger()
+        durations.append(time.monotonic() - start)
+
+    camera_trigger.close()
+
+    # the first frame of the session includes the camera detection
+    print('{0}: first {1:.1f} ms, following {2:.1f} ms mean, overhead {3:.1f} ms per frame'
+          .format(name, durations[0] * 1000, sum(durations[1:]) * 1000 / (count - 1),
+                  (sum(durations[1:]) / (count - 1) - CAPTURE_TIME) * 1000))
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--fake-gphoto2':
+        fake_gphoto2(sys.argv[2:])
+        return
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=20)
+    args = parser.parse_args()
+
+    if args.count < 2:
+        parser.error('count has to be 2 or greater')
+
+    sys.path.insert(0, os.path.dirname(os.path.realpath(__file__)))
+
+    from starter_kit_camera_slider_demo.camera import ShellCameraTrigger, create_camera_trigger
+
+    tmpdir = tempfile.mkdtemp()
+
+    try:
+        gphoto2 = os.path.join(tmpdir, 'gphoto2')
+
+        with open(gphoto2, 'w') as f:
+            f.write('#!/bin/sh\nexec "{0}" "{1}" --fake-gphoto2 "$@"\n'.format(sys.executable, os.path.realpath(__file__)))
+
+        os.chmod(gphoto2, 0o755)
+
+        camera_trigger = '{0} --capture-image'.format(gphoto2)
+
+        print('fake gphoto2: {0:.0f} ms detection, {1:.0f} ms capture'.format(DETECTION_TIME * 1000, CAPTURE_TIME * 1000))
+
+        benchmark('command line', ShellCameraTrigger(camera_trigger), args.count)
+        benchmark('shell session', create_camera_trigger(camera_trigger), args.count)
+    finally:
+        shutil.rmtree(tmpdir)
+
+if __name__ == '__main__':
+    main()
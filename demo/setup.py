@@ -40,7 +40,7 @@ DESCRIPTION = 'Demo for Starter Kit: Camera Slider'
 packages = find_packages(include=[UNDERSCORE_NAME, '{0}.*'.format(UNDERSCORE_NAME)])
 
 package_data = {}
-image_patterns = ['*.bmp', '*.png', '*.jpg']
+image_patterns = ['*.bmp', '*.png', '*.jpg', '*.svg']
 
 for package in packages:
     package_path = os.path.join(*package.split('.'))
@@ -62,7 +62,8 @@ setup_arguments = {
     'description':  DESCRIPTION,
     'packages':     packages,
     'package_data': package_data,
-    'scripts':      ['{0}/{0}'.format(UNDERSCORE_NAME)]
+    'scripts':      ['{0}/{0}'.format(UNDERSCORE_NAME),
+                     '{0}/{0}_headless'.format(UNDERSCORE_NAME)]
 }
 
 setup(**setup_arguments)
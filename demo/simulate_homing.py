@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# runs the StallGuard homing against a simulated Silent Stepper Brick with
+# hard rail ends and compares the found range with the real one. the position
+# of the simulated stepper keeps counting while the cart is blocked, like the
+# real one does, so this also shows how much of the rail is lost to the margin
+# and to the steps the motor skipped before the stall was detected
+
+import sys
+if (sys.hexversion & 0xFF000000) != 0x03000000:
+    print('Python 3.x required')
+    sys.exit(1)
+
+import os
+import time
+import argparse
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--minimum-end', type=int, default=-20000)
+    parser.add_argument('--maximum-end', type=int, default=30000)
+    parser.add_argument('--position', type=int, nargs='+', default=[0])
+    parser.add_argument('--velocity', type=int, default=20000)
+    parser.add_argument('--stallguard-threshold', type=int, default=0)
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.dirname(os.path.realpath(__file__)))
+
+    from starter_kit_camera_slider_demo.slider import PositionTracker
+    from starter_kit_camera_slider_demo.homing import StallGuardHoming, HomingError
+    from starter_kit_camera_slider_demo.simulated_stepper import SimulatedSilentStepper
+
+    for position in args.position:
+        stepper = SimulatedSilentStepper(args.minimum_end, args.maximum_end, position)
+        homing = StallGuardHoming(stepper, PositionTracker(stepper), args.velocity, args.stallguard_threshold)
+        start = time.monotonic()
+
+        try:
+            minimum_position, maximum_position = homing.run()
+        except HomingError as e:
+            print('start {0}: failed after {1:.1f} s: {2}'.format(position, time.monotonic() - start, e))
+            continue
+
+        duration = time.monotonic() - start
+
+        # the simulated stepper knows how far its position is off the cart
+        offset = stepper.get_current_position() - stepper.get_cart_position()
+        usable = maximum_position - minimum_position
+        rail = args.maximum_end - args.minimum_end
+
+        print('start {0}: range {1} to {2}, real ends {3} to {4}, {5:.1f}% of the rail usable, {6:.1f} s'
+              .format(position, minimum_position - offset, maximum_position - offset,
+                      args.minimum_end, args.maximum_end, usable * 100.0 / rail, duration))
+
+if __name__ == '__main__':
+    main()
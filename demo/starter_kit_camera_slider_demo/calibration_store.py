@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+calibration_store.py: Stepper Calibration Store
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+
+import os
+import sqlite3
+
+import starter_kit_camera_slider_demo.config as config
+
+SCHEMA_VERSION = 2
+
+# raised by all methods of the store, callers don't have to import sqlite3
+CalibrationStoreError = sqlite3.Error
+
+class CalibrationStore(object):
+    # stepper calibrations keyed by UID and rail profile, so one Stepper Brick
+    # can be used with several rails. each record is a single row, reading or
+    # saving one calibration does not touch the others. records are cached
+    # after the first read. the devices last seen per host and port are kept
+    # here as well, so the GUI can show them before the enumeration is done
+    def __init__(self, filename):
+        self.filename = filename
+        self.cache = {}
+
+        dirname = os.path.dirname(filename)
+
+        if len(dirname) > 0 and not os.path.exists(dirname):
+            os.makedirs(dirname)
+
+        self.connection = sqlite3.connect(filename)
+
+        # the write-ahead log avoids rewriting database pages on every save
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        self.connection.execute('PRAGMA synchronous = NORMAL')
+
+        version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+        self.created = version == 0
+
+        if version < SCHEMA_VERSION:
+            with self.connection:
+                self.connection.execute('CREATE TABLE IF NOT EXISTS stepper_info ('
+                                        'uid TEXT NOT NULL, '
+                                        'profile TEXT NOT NULL, '
+                                        'minimum_position INTEGER NOT NULL, '
+                                        'maximum_position INTEGER NOT NULL, '
+                                        'current_position INTEGER NOT NULL, '
+                                        'PRIMARY KEY (uid, profile))')
+                self.connection.execute('CREATE TABLE IF NOT EXISTS device ('
+                                        'host TEXT NOT NULL, '
+                                        'port INTEGER NOT NULL, '
+                                        'uid TEXT NOT NULL, '
+                                        'connected_uid TEXT NOT NULL, '
+                                        'device_identifier INTEGER NOT NULL, '
+                                        'firmware_version TEXT NOT NULL, '
+                                        'PRIMARY KEY (host, port, uid))')
+                self.connection.execute('PRAGMA user_version = {0}'.format(SCHEMA_VERSION))
+
+    def get(self, uid, profile=config.DEFAULT_CALIBRATION_PROFILE):
+        # returns None if the stepper is not calibrated for this profile
+        key = (uid, profile)
+
+        if key not in self.cache:
+            row = self.connection.execute('SELECT minimum_position, maximum_position, current_position '
+                                          'FROM stepper_info WHERE uid = ? AND profile = ?', key).fetchone()
+
+            if row == None:
+                self.cache[key] = None
+            else:
+                stepper_info = config.StepperInfo()
+
+                stepper_info.uid = uid
+                stepper_info.minimum_position, stepper_info.maximum_position, stepper_info.current_position = row
+
+                self.cache[key] = stepper_info
+
+        return self.cache[key]
+
+    def put(self, stepper_info, profile=config.DEFAULT_CALIBRATION_PROFILE):
+        with self.connection:
+            self.connection.execute('INSERT OR REPLACE INTO stepper_info VALUES (?, ?, ?, ?, ?)',
+                                    (stepper_info.uid, profile, stepper_info.minimum_position,
+                                     stepper_info.maximum_position, stepper_info.current_position))
+
+        self.cache[(stepper_info.uid, profile)] = stepper_info
+
+    def put_many(self, stepper_infos, profile=config.DEFAULT_CALIBRATION_PROFILE):
+        with self.connection:
+            for stepper_info in stepper_infos:
+                self.connection.execute('INSERT OR REPLACE INTO stepper_info VALUES (?, ?, ?, ?, ?)',
+                                        (stepper_info.uid, profile, stepper_info.minimum_position,
+                                         stepper_info.maximum_position, stepper_info.current_position))
+
+                self.cache[(stepper_info.uid, profile)] = stepper_info
+
+    def remove(self, uid, profile=config.DEFAULT_CALIBRATION_PROFILE):
+        with self.connection:
+            self.connection.execute('DELETE FROM stepper_info WHERE uid = ? AND profile = ?', (uid, profile))
+
+        self.cache[(uid, profile)] = None
+
+    def get_devices(self, host, port):
+        # returns uid -> (connected_uid, device_identifier, firmware_version)
+        devices = {}
+
+        for uid, connected_uid, device_identifier, firmware_version in \
+                self.connection.execute('SELECT uid, connected_uid, device_identifier, firmware_version '
+                                        'FROM device WHERE host = ? AND port = ?', (host, port)):
+            devices[uid] = (connected_uid, device_identifier, tuple(int(part) for part in firmware_version.split('.')))
+
+        return devices
+
+    def put_devices(self, host, port, devices):
+        # replaces all devices of this host and port
+        with self.connection:
+            self.connection.execute('DELETE FROM device WHERE host = ? AND port = ?', (host, port))
+
+            for uid, (connected_uid, device_identifier, firmware_version) in devices.items():
+                self.connection.execute('INSERT INTO device VALUES (?, ?, ?, ?, ?, ?)',
+                                        (host, port, uid, connected_uid, device_identifier,
+                                         '.'.join(str(part) for part in firmware_version)))
+
+    def get_profiles(self, uid):
+        return [row[0] for row in self.connection.execute('SELECT profile FROM stepper_info WHERE uid = ? ORDER BY profile', (uid,))]
+
+    def close(self):
+        self.connection.close()
+
+def open_calibration_store():
+    store = CalibrationStore(config.get_calibration_filename())
+
+    # calibrations were stored in the config before, take them over once
+    if store.created:
+        store.put_many(config.get_stepper_infos(config.STEPPER_INFO_COUNT))
+
+    return store
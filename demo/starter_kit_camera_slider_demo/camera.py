@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+camera.py: Camera Trigger Backends
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+import os
+import re
+import shlex
+import codecs
+import threading
+import subprocess
+
+from starter_kit_camera_slider_demo.time_lapse import get_timestamp
+
+GPHOTO2_STARTUP_TIMEOUT = 10.0
+GPHOTO2_COMMAND_TIMEOUT = 60.0
+GPHOTO2_EXIT_TIMEOUT = 2.0
+
+# gphoto2 shows a prompt like "gphoto2: {/home/user} /> " after each command
+GPHOTO2_PROMPT = re.compile(r'gphoto2: \{[^}\n]*\} [^>\n]*> $')
+
+# gphoto2 command line actions that have an equivalent shell command
+GPHOTO2_SHELL_COMMANDS = {'--capture-image': 'capture-image',
+                          '--trigger-capture': 'trigger-capture',
+                          '--capture-image-and-download': 'capture-image-and-download'}
+
+class CameraTriggerError(Exception):
+    def __init__(self, returncode, output):
+        Exception.__init__(self, 'Camera trigger error {0}: {1}'.format(returncode, output))
+
+        self.returncode = returncode
+        self.output = output
+
+# all camera triggers take an optional sent function, that is called as soon
+# as the trigger command has gone out to the camera or the trigger device.
+# the exposure starts at that point, not when trigger is called
+
+class ShellCameraTrigger(object):
+    # runs the camera trigger command line in a new shell for each frame
+    def __init__(self, camera_trigger):
+        self.camera_trigger = camera_trigger
+
+    def trigger(self, sent=None):
+        process = subprocess.Popen(self.camera_trigger, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, shell=True)
+
+        if sent != None:
+            sent()
+
+        output = process.communicate()[0].decode('utf-8').strip()
+
+        if process.returncode != 0:
+            raise CameraTriggerError(process.returncode, output)
+
+        return output
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+class GPhoto2Session(object):
+    # a long-lived "gphoto2 --shell" child process. the camera is detected and
+    # opened once, afterwards each command only costs the camera's own latency.
+    # responses are framed by the shell prompt
+    def __init__(self, args):
+        self.args = args
+        self.process = None
+        self.reader_thread = None
+        self.condition = threading.Condition()
+        self.buffer = ''
+        self.eof = False
+
+    @property
+    def alive(self):
+        return self.process != None and self.process.poll() == None and not self.eof
+
+    def start(self):
+        self.buffer = ''
+        self.eof = False
+
+        try:
+            self.process = subprocess.Popen(self.args + ['--shell'], stdin=subprocess.PIPE,
+                                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
+        except OSError as e:
+            raise CameraTriggerError(-1, 'Could not start gphoto2: {0}'.format(e))
+
+        self.reader_thread = threading.Thread(target=self.read_loop, args=(self.process,))
+        self.reader_thread.daemon = True
+        self.reader_thread.start()
+
+        try:
+            self.wait_for_prompt(GPHOTO2_STARTUP_TIMEOUT)
+        except:
+            self.close()
+            raise
+
+    def read_loop(self, process):
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        fd = process.stdout.fileno()
+
+        while True:
+            try:
+                data = os.read(fd, 4096)
+            except OSError:
+                data = b''
+
+            with self.condition:
+                if process != self.process:
+                    return
+
+                if len(data) == 0:
+                    self.eof = True
+                else:
+                    self.buffer += decoder.decode(data)
+
+                self.condition.notify_all()
+
+            if len(data) == 0:
+                return
+
+    def wait_for_prompt(self, timeout):
+        deadline = get_timestamp() + timeout
+
+        with self.condition:
+            while True:
+                match = GPHOTO2_PROMPT.search(self.buffer)
+
+                if match != None:
+                    output = self.buffer[:match.start()]
+                    self.buffer = ''
+
+                    return output.strip()
+
+                if self.process == None:
+                    raise CameraTriggerError(-1, 'gphoto2 session was closed')
+
+                if self.eof:
+                    raise CameraTriggerError(-1, 'gphoto2 exited unexpectedly: ' + self.buffer.strip())
+
+                remaining = deadline - get_timestamp()
+
+                if remaining <= 0:
+                    raise CameraTriggerError(-1, 'gphoto2 did not respond within {0:.0f} seconds: {1}'.format(timeout, self.buffer.strip()))
+
+                self.condition.wait(remaining)
+
+    def execute(self, command, timeout=GPHOTO2_COMMAND_TIMEOUT, sent=None):
+        if not self.alive:
+            self.close()
+            self.start()
+
+        try:
+            self.process.stdin.write((command + '\n').encode('utf-8'))
+            self.process.stdin.flush()
+        except OSError as e:
+            self.close()
+            raise CameraTriggerError(-1, 'Could not send command to gphoto2: {0}'.format(e))
+
+        if sent != None:
+            sent()
+
+        try:
+            return self.wait_for_prompt(timeout)
+        except CameraTriggerError:
+            self.close()
+            raise
+
+    def close(self):
+        with self.condition:
+            process = self.process
+            self.process = None
+            self.condition.notify_all()
+
+        if process == None:
+            return
+
+        try:
+            process.stdin.write(b'exit\n')
+            process.stdin.close()
+        except OSError:
+            pass
+
+        try:
+            process.wait(GPHOTO2_EXIT_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+class GPhoto2CameraTrigger(object):
+    # sends the shell equivalent of the command line action to a persistent
+    # gphoto2 session. the session is (re)started on demand, so a failed
+    # session is replaced by a fresh one for the next frame. open and trigger
+    # might still be running in other threads when close is called, a closed
+    # trigger never starts a session again, otherwise the gphoto2 process
+    # would be left running and keep the camera busy
+    def __init__(self, args, command):
+        self.session = GPhoto2Session(args)
+        self.command = command
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def open(self):
+        # errors are not fatal here, the next trigger retries
+        with self.lock:
+            if not self.closed and not self.session.alive:
+                try:
+                    self.session.close()
+                    self.session.start()
+                except CameraTriggerError:
+                    pass
+
+    def trigger(self, sent=None):
+        with self.lock:
+            if self.closed:
+                raise CameraTriggerError(-1, 'Camera trigger was closed')
+
+            output = self.session.execute(self.command, sent=sent)
+
+            # gphoto2 reports errors as "*** Error ..." but stays in the shell
+            if '*** Error' in output:
+                self.session.close()
+
+                raise CameraTriggerError(1, output)
+
+            return output
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            self.session.close()
+
+def parse_gphoto2_trigger(camera_trigger):
+    # returns (args, shell command) if the camera trigger is a plain gphoto2
+    # call with a single supported action, otherwise None
+    try:
+        args = shlex.split(camera_trigger)
+    except ValueError:
+        return None
+
+    if len(args) < 2:
+        return None
+
+    name = os.path.basename(args[0]).lower()
+
+    if name not in ['gphoto2', 'gphoto2.exe']:
+        return None
+
+    actions = [arg for arg in args[1:] if arg in GPHOTO2_SHELL_COMMANDS]
+
+    if len(actions) != 1 or args[-1] != actions[0]:
+        return None
+
+    # everything between the executable and the action has to be an option
+    # such as --port or --camera, that is also valid for the shell
+    for arg in args[1:-1]:
+        if arg.startswith('--') and arg.split('=')[0] not in ['--port', '--camera', '--model', '--usbid', '--speed']:
+            return None
+
+    return args[:-1], GPHOTO2_SHELL_COMMANDS[actions[0]]
+
+def create_camera_trigger(camera_trigger):
+    parsed = parse_gphoto2_trigger(camera_trigger)
+
+    if parsed != None:
+        return GPhoto2CameraTrigger(parsed[0], parsed[1])
+
+    return ShellCameraTrigger(camera_trigger)
@@ -21,7 +21,9 @@ Free Software Foundation, Inc., 59 Temple Place - Suite 330,
 Boston, MA 02111-1307, USA.
 """
 
+import os
 import sys
+from contextlib import nullcontext
 from starter_kit_camera_slider_demo.config_common import *
 
 class HostInfo(object):
@@ -50,6 +52,17 @@ def set_stepper_info_strings(strings): pass
 def get_camera_trigger(): return DEFAULT_CAMERA_TRIGGER
 def set_camera_trigger(camera_trigger): pass
 
+def get_telemetry_directory(): return DEFAULT_TELEMETRY_DIRECTORY
+def set_telemetry_directory(telemetry_directory): pass
+
+def get_calibration_filename(): return os.path.join(os.path.expanduser('~'), 'starter_kit_camera_slider_demo_calibration.db')
+
+def get_calibration_profile(): return DEFAULT_CALIBRATION_PROFILE
+def set_calibration_profile(calibration_profile): pass
+
+# groups set_* calls into a single write of the config store
+def transaction(): return nullcontext()
+
 if sys.platform.startswith('linux') or sys.platform.startswith('freebsd'):
     from starter_kit_camera_slider_demo.config_linux import *
 elif sys.platform == 'darwin':
@@ -21,6 +21,11 @@ Free Software Foundation, Inc., 59 Temple Place - Suite 330,
 Boston, MA 02111-1307, USA.
 """
 
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+
 DEMO_VERSION = '1.1.1'
 
 HOST_INFO_COUNT = 1
@@ -37,3 +42,148 @@ DEFAULT_REMEMBER_SECRET = False
 DEFAULT_HOST_INFO = 'localhost|4223|0|0|'
 
 DEFAULT_CAMERA_TRIGGER = 'gphoto2 --capture-image'
+
+DEFAULT_TELEMETRY_DIRECTORY = os.path.join(os.path.expanduser('~'), 'Camera Slider Telemetry')
+
+DEFAULT_CALIBRATION_PROFILE = 'default'
+
+def write_file_atomically(filename, mode, write):
+    # write(f) writes the new content to a temporary file that then replaces
+    # the original file, so a crash leaves either the old or the new content
+    dirname = os.path.dirname(filename)
+
+    if not os.path.exists(dirname):
+        os.makedirs(dirname)
+
+    fd, temporary_filename = tempfile.mkstemp(prefix='.' + os.path.basename(filename) + '.', dir=dirname)
+
+    try:
+        with os.fdopen(fd, mode) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+
+        if os.path.exists(filename):
+            os.chmod(temporary_filename, stat.S_IMODE(os.stat(filename).st_mode))
+
+        os.replace(temporary_filename, filename)
+    except:
+        try:
+            os.remove(temporary_filename)
+        except OSError:
+            pass
+
+        raise
+
+    # make the rename itself durable
+    if hasattr(os, 'O_DIRECTORY'):
+        try:
+            dir_fd = os.open(dirname, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+class ConfigCache(object):
+    # keeps the whole config store in memory, so reading many values costs a
+    # single load. load returns the store contents and get_mtime its current
+    # modification time (None if it does not exist). the store is loaded again
+    # if it was changed from outside, e.g. by another instance of the demo.
+    #
+    # the backends change the cached values and report the changed keys. save
+    # writes them to the store, either right away or once at the end of the
+    # outermost transaction.
+    #
+    # checking the modification time costs about as much as reading a value
+    # from the store, so within a batch (and a transaction) it is checked only
+    # for the first value
+    def __init__(self, load, save, get_mtime):
+        self.load = load
+        self.save = save
+        self.get_mtime = get_mtime
+        self.values = None
+        self.mtime = None
+        self.changed_keys = set()
+        self.transaction_depth = 0
+        self.batch_depth = 0
+        self.checked = False
+
+    def get_values(self):
+        # staged changes must not be replaced by the store contents
+        if self.values != None and (len(self.changed_keys) > 0 or (self.batch_depth > 0 and self.checked)):
+            return self.values
+
+        mtime = self.get_mtime()
+
+        if self.values == None or mtime != self.mtime:
+            self.values = self.load()
+            # loading might touch the store, e.g. plutil on macOS
+            self.mtime = self.get_mtime()
+
+        self.checked = True
+
+        return self.values
+
+    def changed(self, key):
+        self.changed_keys.add(key)
+
+        if self.transaction_depth == 0:
+            self.commit()
+
+    def commit(self):
+        if len(self.changed_keys) == 0:
+            return
+
+        changed_keys = self.changed_keys
+        self.changed_keys = set()
+
+        try:
+            self.save(self.values, changed_keys)
+        except:
+            self.values = None
+            raise
+
+        self.mtime = self.get_mtime()
+
+    def invalidate(self):
+        self.values = None
+
+    @contextmanager
+    def batch(self):
+        if self.batch_depth == 0:
+            self.checked = False
+
+        self.batch_depth += 1
+
+        try:
+            yield
+        finally:
+            self.batch_depth -= 1
+
+    @contextmanager
+    def transaction(self):
+        # transactions can be nested, only the outermost one saves. if it
+        # ends with an exception then the staged changes are discarded
+        with self.batch():
+            self.transaction_depth += 1
+
+            try:
+                yield
+            except:
+                self.transaction_depth -= 1
+
+                if self.transaction_depth == 0:
+                    self.changed_keys = set()
+                    self.values = None
+
+                raise
+
+            self.transaction_depth -= 1
+
+            if self.transaction_depth == 0:
+                self.commit()
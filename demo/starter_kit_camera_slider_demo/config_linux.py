@@ -34,58 +34,75 @@ else:
     CONFIG_FILENAME = os.path.join(XDG_CONFIG_HOME, 'Tinkerforge/starter_kit_camera_slider_demo.conf')
 
 CONFIG_DIRNAME = os.path.dirname(CONFIG_FILENAME)
+CALIBRATION_FILENAME = os.path.join(CONFIG_DIRNAME, 'starter_kit_camera_slider_demo_calibration.db')
 
-def get_config_value(section, option, default):
+def get_config_mtime():
+    try:
+        return os.stat(CONFIG_FILENAME).st_mtime_ns
+    except OSError:
+        return None
+
+def load_config():
     scp = configparser.SafeConfigParser()
     scp.read(CONFIG_FILENAME)
 
+    return scp
+
+def save_config(scp, changed_keys):
+    write_file_atomically(CONFIG_FILENAME, 'w', scp.write)
+
+config_cache = ConfigCache(load_config, save_config, get_config_mtime)
+
+def transaction():
+    return config_cache.transaction()
+
+def get_config_value(section, option, default):
     try:
-        return scp.get(section, option)
+        return config_cache.get_values().get(section, option)
     except configparser.Error:
         return default
 
 def set_config_value(section, option, value):
-    scp = configparser.SafeConfigParser()
-    scp.read(CONFIG_FILENAME)
+    scp = config_cache.get_values()
 
     if not scp.has_section(section):
         scp.add_section(section)
+    elif scp.has_option(section, option) and scp.get(section, option, raw=True) == value:
+        return
 
     scp.set(section, option, value)
-
-    if not os.path.exists(CONFIG_DIRNAME):
-        os.makedirs(CONFIG_DIRNAME)
-
-    with open(CONFIG_FILENAME, 'w') as f:
-        scp.write(f)
+    config_cache.changed((section, option))
 
 def get_strings(category, prefix, max_count):
-    strings = []
+    # the store is checked for outside changes once, not once per value
+    with config_cache.batch():
+        strings = []
 
-    try:
-        count = int(get_config_value(category, '{0}Count'.format(prefix), '-1'))
-    except:
-        count = max_count
+        try:
+            count = int(get_config_value(category, '{0}Count'.format(prefix), '-1'))
+        except:
+            count = max_count
 
-    if count < 0 or count > max_count:
-        count = max_count
+        if count < 0 or count > max_count:
+            count = max_count
 
-    for i in range(count):
-        string = get_config_value(category, '{0}{1}'.format(prefix, i), None)
+        for i in range(count):
+            string = get_config_value(category, '{0}{1}'.format(prefix, i), None)
 
-        if string != None:
-            strings.append(str(string))
+            if string != None:
+                strings.append(str(string))
 
-    return strings
+        return strings
 
 def set_strings(category, prefix, strings):
     i = 0
 
-    for string in strings:
-        set_config_value(category, '{0}{1}'.format(prefix, i), str(string))
-        i += 1
+    with transaction():
+        for string in strings:
+            set_config_value(category, '{0}{1}'.format(prefix, i), str(string))
+            i += 1
 
-    set_config_value(category, '{0}Count'.format(prefix), str(i))
+        set_config_value(category, '{0}Count'.format(prefix), str(i))
 
 def get_host_info_strings(max_count):
     return get_strings('Connection', 'HostInfo', max_count)
@@ -104,3 +121,18 @@ def get_camera_trigger():
 
 def set_camera_trigger(camera_trigger):
     set_config_value('TimeLapse', 'CameraTrigger', str(camera_trigger))
+
+def get_telemetry_directory():
+    return get_config_value('TimeLapse', 'TelemetryDirectory', DEFAULT_TELEMETRY_DIRECTORY)
+
+def set_telemetry_directory(telemetry_directory):
+    set_config_value('TimeLapse', 'TelemetryDirectory', str(telemetry_directory))
+
+def get_calibration_filename():
+    return CALIBRATION_FILENAME
+
+def get_calibration_profile():
+    return get_config_value('Calibration', 'Profile', DEFAULT_CALIBRATION_PROFILE)
+
+def set_calibration_profile(calibration_profile):
+    set_config_value('Calibration', 'Profile', str(calibration_profile))
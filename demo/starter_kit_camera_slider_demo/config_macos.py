@@ -28,61 +28,77 @@ import subprocess
 
 CONFIG_FILENAME = os.path.expanduser('~/Library/Preferences/com.tinkerforge.starter_kit_camera_slider_demo.plist')
 CONFIG_DIRNAME = os.path.dirname(CONFIG_FILENAME)
+CALIBRATION_FILENAME = os.path.expanduser('~/Library/Application Support/Tinkerforge/starter_kit_camera_slider_demo_calibration.db')
 
-def get_plist_value(name, default):
+def get_plist_mtime():
+    try:
+        return os.stat(CONFIG_FILENAME).st_mtime_ns
+    except OSError:
+        return None
+
+def load_plist():
     if not os.path.exists(CONFIG_FILENAME):
-        return default
+        return {}
 
     try:
         subprocess.call(['plutil', '-convert', 'xml1', CONFIG_FILENAME])
-        return plistlib.readPlist(CONFIG_FILENAME)[name]
+        return plistlib.readPlist(CONFIG_FILENAME)
+    except:
+        return {}
+
+def save_plist(root, changed_keys):
+    write_file_atomically(CONFIG_FILENAME, 'wb', lambda f: plistlib.writePlist(root, f))
+
+plist_cache = ConfigCache(load_plist, save_plist, get_plist_mtime)
+
+def transaction():
+    return plist_cache.transaction()
+
+def get_plist_value(name, default):
+    try:
+        return plist_cache.get_values()[name]
     except:
         return default
 
 def set_plist_value(name, value):
-    root = {}
+    root = plist_cache.get_values()
 
-    if os.path.exists(CONFIG_FILENAME):
-        try:
-            subprocess.call(['plutil', '-convert', 'xml1', CONFIG_FILENAME])
-            root = plistlib.readPlist(CONFIG_FILENAME)
-        except:
-            pass
+    if name in root and root[name] == value:
+        return
 
     root[name] = value
-
-    if not os.path.exists(CONFIG_DIRNAME):
-        os.makedirs(CONFIG_DIRNAME)
-
-    plistlib.writePlist(root, CONFIG_FILENAME)
+    plist_cache.changed(name)
 
 def get_strings(prefix, max_count):
-    strings = []
+    # the store is checked for outside changes once, not once per value
+    with plist_cache.batch():
+        strings = []
 
-    try:
-        count = int(get_plist_value('{0}Count'.format(prefix), '-1'))
-    except:
-        count = max_count
+        try:
+            count = int(get_plist_value('{0}Count'.format(prefix), '-1'))
+        except:
+            count = max_count
 
-    if count < 0 or count > max_count:
-        count = max_count
+        if count < 0 or count > max_count:
+            count = max_count
 
-    for i in range(count):
-        string = get_plist_value('{0}{1}'.format(prefix, i), None)
+        for i in range(count):
+            string = get_plist_value('{0}{1}'.format(prefix, i), None)
 
-        if string != None:
-            strings.append(str(string))
+            if string != None:
+                strings.append(str(string))
 
-    return strings
+        return strings
 
 def set_strings(prefix, strings):
     i = 0
 
-    for string in strings:
-        set_plist_value('{0}{1}'.format(prefix, i), str(string))
-        i += 1
+    with transaction():
+        for string in strings:
+            set_plist_value('{0}{1}'.format(prefix, i), str(string))
+            i += 1
 
-    set_plist_value('{0}Count'.format(prefix), str(i))
+        set_plist_value('{0}Count'.format(prefix), str(i))
 
 def get_host_info_strings(max_count):
     return get_strings('HostInfo', max_count)
@@ -101,3 +117,18 @@ def get_camera_trigger():
 
 def set_camera_trigger(camera_trigger):
     set_plist_value('CameraTrigger', str(camera_trigger))
+
+def get_telemetry_directory():
+    return get_plist_value('TelemetryDirectory', DEFAULT_TELEMETRY_DIRECTORY)
+
+def set_telemetry_directory(telemetry_directory):
+    set_plist_value('TelemetryDirectory', str(telemetry_directory))
+
+def get_calibration_filename():
+    return CALIBRATION_FILENAME
+
+def get_calibration_profile():
+    return get_plist_value('CalibrationProfile', DEFAULT_CALIBRATION_PROFILE)
+
+def set_calibration_profile(calibration_profile):
+    set_plist_value('CalibrationProfile', str(calibration_profile))
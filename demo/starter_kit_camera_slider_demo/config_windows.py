@@ -21,66 +21,117 @@ Free Software Foundation, Inc., 59 Temple Place - Suite 330,
 Boston, MA 02111-1307, USA.
 """
 
+import os
 import logging
 import winreg
 
 from starter_kit_camera_slider_demo.config_common import *
 
 KEY_NAME = 'Software\\Tinkerforge\\Starter Kit Camera Slider Demo'
+CALIBRATION_FILENAME = os.path.join(os.getenv('APPDATA', os.path.expanduser('~')), 'Tinkerforge', 'starter_kit_camera_slider_demo_calibration.db')
 
-def get_registry_value(name, default):
+def get_registry_mtime():
+    # last write time of the key, in 100 nanoseconds since 1601
     try:
         reg = winreg.OpenKey(winreg.HKEY_CURRENT_USER, KEY_NAME)
     except WindowsError:
-        return default
+        return None
     else:
         try:
-            return winreg.QueryValueEx(reg, name)[0]
+            return winreg.QueryInfoKey(reg)[2]
         except:
-            return default
+            return None
         finally:
             winreg.CloseKey(reg)
 
-def set_registry_value(name, type_, value):
+def load_registry():
+    values = {}
+
     try:
-        reg = winreg.CreateKey(winreg.HKEY_CURRENT_USER, KEY_NAME)
+        reg = winreg.OpenKey(winreg.HKEY_CURRENT_USER, KEY_NAME)
     except WindowsError:
-        logging.warn('Could not create registry key: HKCU\\{0}'.format(KEY_NAME))
+        return values
     else:
         try:
-            winreg.SetValueEx(reg, name, 0, type_, value)
+            for i in range(winreg.QueryInfoKey(reg)[1]):
+                name, value, _ = winreg.EnumValue(reg, i)
+                values[name] = value
         except:
-            logging.warn('Could not set registry value: HKCU\\{0}\\{1}'.format(KEY_NAME, name))
+            pass
         finally:
             winreg.CloseKey(reg)
 
-def get_strings(prefix, max_count):
-    strings = []
+    return values
+
+# value name -> registry type of the values changed since the last save
+registry_types = {}
 
+def save_registry(values, changed_names):
+    # only the changed values are written, all of them with a single open key
     try:
-        count = int(get_registry_value('{0}Count'.format(prefix), '-1'))
-    except:
-        count = max_count
+        reg = winreg.CreateKey(winreg.HKEY_CURRENT_USER, KEY_NAME)
+    except WindowsError:
+        logging.warn('Could not create registry key: HKCU\\{0}'.format(KEY_NAME))
+        registry_cache.invalidate()
+        return
+
+    try:
+        for name in changed_names:
+            try:
+                winreg.SetValueEx(reg, name, 0, registry_types.pop(name, winreg.REG_SZ), values[name])
+            except:
+                logging.warn('Could not set registry value: HKCU\\{0}\\{1}'.format(KEY_NAME, name))
+    finally:
+        winreg.CloseKey(reg)
+
+registry_cache = ConfigCache(load_registry, save_registry, get_registry_mtime)
 
-    if count < 0 or count > max_count:
-        count = max_count
+def transaction():
+    return registry_cache.transaction()
 
-    for i in range(count):
-        string = get_registry_value('{0}{1}'.format(prefix, i), None)
+def get_registry_value(name, default):
+    return registry_cache.get_values().get(name, default)
 
-        if string != None:
-            strings.append(str(string))
+def set_registry_value(name, type_, value):
+    values = registry_cache.get_values()
 
-    return strings
+    if name in values and values[name] == value:
+        return
+
+    values[name] = value
+    registry_types[name] = type_
+    registry_cache.changed(name)
+
+def get_strings(prefix, max_count):
+    # the store is checked for outside changes once, not once per value
+    with registry_cache.batch():
+        strings = []
+
+        try:
+            count = int(get_registry_value('{0}Count'.format(prefix), '-1'))
+        except:
+            count = max_count
+
+        if count < 0 or count > max_count:
+            count = max_count
+
+        for i in range(count):
+            string = get_registry_value('{0}{1}'.format(prefix, i), None)
+
+            if string != None:
+                strings.append(str(string))
+
+        return strings
 
 def set_strings(prefix, strings):
     i = 0
 
-    for string in strings:
-        set_registry_value('{0}{1}'.format(prefix, i), winreg.REG_SZ, str(string))
-        i += 1
+    with transaction():
+        for string in strings:
+            set_registry_value('{0}{1}'.format(prefix, i), winreg.REG_SZ, str(string))
+            i += 1
 
-    set_registry_value('{0}Count'.format(prefix), winreg.REG_SZ, str(i))
+        set_registry_value('{0}Count'.format(prefix), winreg.REG_SZ, str(i))
 
 def get_host_info_strings(max_count):
     return get_strings('HostInfo', max_count)
@@ -99,3 +150,18 @@ def get_camera_trigger():
 
 def set_camera_trigger(camera_trigger):
     set_registry_value('CameraTrigger', winreg.REG_SZ, str(camera_trigger))
+
+def get_telemetry_directory():
+    return get_registry_value('TelemetryDirectory', DEFAULT_TELEMETRY_DIRECTORY)
+
+def set_telemetry_directory(telemetry_directory):
+    set_registry_value('TelemetryDirectory', winreg.REG_SZ, str(telemetry_directory))
+
+def get_calibration_filename():
+    return CALIBRATION_FILENAME
+
+def get_calibration_profile():
+    return get_registry_value('CalibrationProfile', DEFAULT_CALIBRATION_PROFILE)
+
+def set_calibration_profile(calibration_profile):
+    set_registry_value('CalibrationProfile', winreg.REG_SZ, str(calibration_profile))
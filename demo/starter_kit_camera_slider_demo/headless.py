@@ -0,0 +1,812 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+headless.py: Headless Time Lapse Runner for Starter Kit: Camera Slider
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+# this runner must not import PyQt or the generated UI, so it starts quickly
+# on small hosts like a RED Brick or a Raspberry Pi next to the rig
+
+import sys
+if (sys.hexversion & 0xFF000000) != 0x03000000:
+    print('Python 3.x required')
+    sys.exit(1)
+
+import os
+
+def prepare_package(package_name):
+    # from http://www.py2exe.org/index.cgi/WhereAmI
+    if hasattr(sys, 'frozen'):
+        program_path = os.path.dirname(os.path.realpath(sys.executable))
+    else:
+        program_path = os.path.dirname(os.path.realpath(__file__))
+
+    # allow the program to be directly started by calling 'headless.py'
+    # without '<package_name>' being in the path already
+    if package_name not in sys.modules:
+        head, tail = os.path.split(program_path)
+
+        if head not in sys.path:
+            sys.path.insert(0, head)
+
+        if not hasattr(sys, 'frozen'):
+            # load and inject in modules list, this allows to have the source in a
+            # directory named differently than '<package_name>'
+            sys.modules[package_name] = __import__(tail, globals(), locals())
+
+    return program_path
+
+program_path = prepare_package('starter_kit_camera_slider_demo')
+
+import json
+import time
+import signal
+import socket
+import sqlite3
+import argparse
+import threading
+from datetime import datetime
+
+from starter_kit_camera_slider_demo.tinkerforge.ip_connection import IPConnection, Error
+from starter_kit_camera_slider_demo.tinkerforge.brick_silent_stepper import BrickSilentStepper
+from starter_kit_camera_slider_demo.slider import MAX_VELOCITY, PositionTracker, create_stepper, configure_stepper, \
+                                                 update_stepper_info, position_stepper_to_display, \
+                                                 position_display_to_stepper
+from starter_kit_camera_slider_demo.camera import CameraTriggerError
+from starter_kit_camera_slider_demo.trigger_drivers import create_trigger
+from starter_kit_camera_slider_demo.telemetry import TimeLapseTelemetry, get_telemetry_filename
+from starter_kit_camera_slider_demo.time_lapse import TimeLapseSchedule, get_continuous_velocity, get_timestamp
+from starter_kit_camera_slider_demo.calibration_store import open_calibration_store
+from starter_kit_camera_slider_demo.homing import DEFAULT_STALLGUARD_THRESHOLD, StallGuardHoming, HomingError
+from starter_kit_camera_slider_demo.multi_axis import parse_joint_keyframes, evaluate_joint_path, plan_joint_path
+from starter_kit_camera_slider_demo.motion_path import INTERPOLATIONS, INTERPOLATION_LINEAR, MotionPathError, \
+                                                      parse_keyframes, evaluate_path, validate_path
+import starter_kit_camera_slider_demo.config as config
+
+ACTION_MOVE = 'move'
+ACTION_TIME_LAPSE = 'time-lapse'
+ACTION_HOME = 'home'
+
+MOTION_MODE_SHOOT_MOVE_SHOOT = 'shoot-move-shoot'
+MOTION_MODE_CONTINUOUS = 'continuous'
+
+# job file keys and their defaults, command line arguments use the same names
+# with dashes instead of underscores
+JOB_DEFAULTS = {'action': None,
+                'host': None,
+                'port': None,
+                'uid': None,
+                'profile': None,
+                'group': None,
+                'axes': None,
+                'joint_keyframes': '',
+                'position': None,
+                'image_count': 5,
+                'interval': 3,
+                'initial_delay': 0,
+                'start_position': 0,
+                'end_position': None,
+                'keyframes': '',
+                'interpolation': INTERPOLATION_LINEAR,
+                'motion_mode': MOTION_MODE_SHOOT_MOVE_SHOOT,
+                'camera_trigger': None,
+                'telemetry': None,
+                'velocity': 10000,
+                'acceleration': 65535,
+                'deceleration': 65535,
+                'stallguard_threshold': DEFAULT_STALLGUARD_THRESHOLD}
+
+WAIT_POLL_INTERVAL = 0.5
+DISCONNECT_STOP_TIMEOUT = 10.0
+
+class HeadlessError(Exception):
+    pass
+
+def log(message):
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    print(timestamp + ' - ' + message)
+    sys.stdout.flush()
+
+def sleep_until(deadline):
+    while True:
+        delay = deadline - get_timestamp()
+
+        if delay <= 0:
+            break
+
+        time.sleep(min(delay, 10.0))
+
+class HeadlessSlider(object):
+    # a slider connects its own IP Connection, unless it shares one with other
+    # sliders of a SliderGroup
+    def __init__(self, host, port, uid, profile, ipcon=None):
+        self.host = host
+        self.port = port
+        self.uid = uid
+        self.profile = profile
+        self.own_ipcon = ipcon == None
+        self.ipcon = IPConnection() if ipcon == None else ipcon
+        self.stepper = None
+        self.position_tracker = None
+        self.calibration_store = None
+        self.stepper_info = None
+        self.stopped = threading.Event()
+        self.stopped.set()
+        self.motion_start_time = None
+
+    def connect(self, require_calibration=True):
+        self.calibration_store = open_calibration_store()
+        self.stepper_info = self.calibration_store.get(self.uid, self.profile)
+
+        if self.stepper_info == None and require_calibration:
+            raise HeadlessError('Stepper Brick [{0}] is not calibrated for profile "{1}", calibrate it in the GUI first'.format(self.uid, self.profile))
+
+        if self.own_ipcon:
+            self.ipcon.connect(self.host, self.port)
+
+        self.stepper, _ = create_stepper(self.uid, self.ipcon)
+        self.position_tracker = PositionTracker(self.stepper)
+
+        # The constant is read from class instance rather from the
+        # class itself to support both Stepper and Silent Stepper Bricks.
+        self.stepper.register_callback(self.stepper.CALLBACK_NEW_STATE, self.cb_new_state)
+
+        configure_stepper(self.stepper)
+
+        if self.stepper_info != None:
+            update_stepper_info(self.stepper_info, self.position_tracker.get_current_position())
+
+    def disconnect(self):
+        if self.stepper != None:
+            try:
+                if not self.stopped.is_set():
+                    self.position_tracker.stop()
+                    self.stopped.wait(DISCONNECT_STOP_TIMEOUT)
+
+                self.stepper.disable()
+                self.stepper_info.current_position = self.position_tracker.get_current_position()
+            except (Error, socket.error):
+                pass
+
+            if self.stepper_info != None:
+                self.calibration_store.put(self.stepper_info, self.profile)
+
+        if self.calibration_store != None:
+            self.calibration_store.close()
+            self.calibration_store = None
+
+        if self.own_ipcon:
+            try:
+                self.ipcon.disconnect()
+            except (Error, socket.error):
+                pass
+
+    def cb_new_state(self, state_new, state_previous):
+        if state_new == self.stepper.STATE_STOP and state_previous != self.stepper.STATE_STOP:
+            # a long move is done in several segments
+            if not self.position_tracker.next_segment():
+                self.stopped.set()
+        elif state_new != self.stepper.STATE_STOP and state_previous == self.stepper.STATE_STOP and \
+             self.motion_start_time == None:
+            self.motion_start_time = get_timestamp()
+
+    @property
+    def motion_range(self):
+        return self.stepper_info.motion_range
+
+    def to_stepper(self, position):
+        return position_display_to_stepper(self.stepper_info, position)
+
+    def to_display(self, position):
+        return position_stepper_to_display(self.stepper_info, position)
+
+    def set_motion_parameters(self, velocity, acceleration, deceleration):
+        self.stepper.set_max_velocity(velocity)
+        self.stepper.set_speed_ramping(acceleration, deceleration)
+
+    def set_max_velocity(self, velocity):
+        self.stepper.set_max_velocity(velocity)
+
+    def get_current_position(self):
+        return self.position_tracker.get_current_position()
+
+    def prepare_move(self, target_position):
+        # returns False if the cart is at the target position already
+        if self.position_tracker.get_current_position() == target_position:
+            return False
+
+        self.stopped.clear()
+        self.motion_start_time = None
+        self.stepper.enable()
+
+        return True
+
+    def start_move(self, target_position):
+        if not self.prepare_move(target_position):
+            return False
+
+        self.position_tracker.set_target_position(target_position)
+
+        return True
+
+    def wait_stopped(self):
+        # wait in short slices, so SIGINT is handled promptly
+        while not self.stopped.wait(WAIT_POLL_INTERVAL):
+            pass
+
+        self.stepper.disable()
+
+    def move_to(self, target_position):
+        if self.start_move(target_position):
+            self.wait_stopped()
+
+def parse_slider(slider, default_host, default_port, default_profile):
+    # [<host>:<port>:]<uid>[@<profile>]
+    profile = default_profile
+
+    if '@' in slider:
+        slider, profile = slider.split('@', 1)
+
+    parts = slider.strip().split(':')
+
+    try:
+        if len(parts) == 1:
+            return default_host, default_port, parts[0], profile
+        elif len(parts) == 3:
+            return parts[0], int(parts[1]), parts[2], profile
+    except ValueError:
+        pass
+
+    raise HeadlessError('Invalid slider: {0}'.format(slider))
+
+class SliderGroup(object):
+    # moves several sliders, possibly connected to different Brick Daemons, to
+    # the same position as one. positions are display positions, each slider
+    # maps them to its own calibration. a move is prepared on all sliders
+    # first, then the target positions are sent back-to-back to keep the skew
+    # between the motion starts small
+    def __init__(self, sliders, default_host, default_port, default_profile):
+        self.ipcons = {}
+        self.sliders = []
+        self.moving_sliders = []
+        self.send_skews = []
+        self.start_skews = []
+
+        for slider in sliders:
+            host, port, uid, profile = parse_slider(slider, default_host, default_port, default_profile)
+
+            if (host, port) not in self.ipcons:
+                self.ipcons[(host, port)] = IPConnection()
+
+            self.sliders.append(HeadlessSlider(host, port, uid, profile, self.ipcons[(host, port)]))
+
+        if len(self.sliders) == 0:
+            raise HeadlessError('Slider group is empty')
+
+        # the camera trigger uses the connection of the first slider
+        self.host = self.sliders[0].host
+        self.port = self.sliders[0].port
+        self.ipcon = self.sliders[0].ipcon
+
+    def connect(self, require_calibration=True):
+        for host, port in self.ipcons:
+            self.ipcons[(host, port)].connect(host, port)
+
+        for slider in self.sliders:
+            slider.connect(require_calibration)
+
+    def disconnect(self):
+        for slider in self.sliders:
+            slider.disconnect()
+
+        for ipcon in self.ipcons.values():
+            try:
+                ipcon.disconnect()
+            except (Error, socket.error):
+                pass
+
+    @property
+    def motion_range(self):
+        return min([slider.motion_range for slider in self.sliders])
+
+    def to_stepper(self, position):
+        return position
+
+    def to_display(self, position):
+        return position
+
+    def set_motion_parameters(self, velocity, acceleration, deceleration):
+        for slider in self.sliders:
+            slider.set_motion_parameters(velocity, acceleration, deceleration)
+
+    def set_max_velocity(self, velocity):
+        for slider in self.sliders:
+            slider.set_max_velocity(velocity)
+
+    def get_current_position(self):
+        slider = self.sliders[0]
+
+        return slider.to_display(slider.get_current_position())
+
+    def start_move(self, target_position):
+        return self.start_moves([(slider, slider.to_stepper(target_position), None) for slider in self.sliders])
+
+    def start_moves(self, moves):
+        # moves is a (slider, stepper target position, motion parameters)
+        # tuple per slider. motion parameters can be None to keep the current
+        # ones, otherwise they are a (velocity, acceleration, deceleration)
+        # tuple. everything but the target positions is sent beforehand,
+        # including the position reads a relative target needs
+        targets = []
+
+        for slider, stepper_target_position, parameters in moves:
+            if slider.prepare_move(stepper_target_position):
+                if parameters != None:
+                    slider.set_motion_parameters(*parameters)
+
+                targets.append((slider, slider.position_tracker.prepare_target_position(stepper_target_position)))
+
+        # the Stepper Bricks have no shared start trigger, so the targets are
+        # sent back to back. each is a single request without response, the
+        # axes still start apart by the time to write one request per axis
+        # plus the difference in USB/network latency between the connections
+        send_times = []
+
+        for _, send in targets:
+            send()
+            send_times.append(get_timestamp())
+
+        self.moving_sliders = [slider for slider, _ in targets]
+
+        if len(send_times) > 1:
+            self.send_skews.append(send_times[-1] - send_times[0])
+
+        return len(targets) > 0
+
+    def wait_stopped(self):
+        for slider in self.sliders:
+            slider.wait_stopped()
+
+        # the new state callbacks tell when each stepper actually started
+        start_times = [slider.motion_start_time for slider in self.moving_sliders]
+
+        if len(start_times) > 1 and None not in start_times:
+            self.start_skews.append(max(start_times) - min(start_times))
+
+        self.moving_sliders = []
+
+    def move_to(self, target_position):
+        if self.start_move(target_position):
+            self.wait_stopped()
+
+    def log_skew(self):
+        for name, skews in [('Send', self.send_skews), ('Start', self.start_skews)]:
+            if len(skews) > 0:
+                log('{0} skew of {1} group moves: {2:.2f} ms mean, {3:.2f} ms max'
+                    .format(name, len(skews), sum(skews) * 1000 / len(skews), max(skews) * 1000))
+
+class MultiAxisRig(SliderGroup):
+    # sliders used as axes, e.g. slide, pan and tilt, each moving to its own
+    # position. pan and tilt heads are calibrated like a slider
+    def __init__(self, axes, default_host, default_port, default_profile):
+        SliderGroup.__init__(self, axes, default_host, default_port, default_profile)
+
+    @property
+    def axis_count(self):
+        return len(self.sliders)
+
+    @property
+    def motion_ranges(self):
+        return [slider.motion_range for slider in self.sliders]
+
+    def get_current_positions(self):
+        return [slider.to_display(slider.get_current_position()) for slider in self.sliders]
+
+    def move_joints_to(self, positions, parameters=None):
+        if parameters == None:
+            parameters = [None] * len(self.sliders)
+
+        if self.start_moves([(slider, slider.to_stepper(position), axis_parameters)
+                             for slider, position, axis_parameters in zip(self.sliders, positions, parameters)]):
+            self.wait_stopped()
+
+def trigger_camera(camera):
+    # returns exit code and output
+    try:
+        output = camera.trigger()
+        log('Camera trigger output: ' + output)
+
+        return 0, output
+    except CameraTriggerError as e:
+        log('Camera trigger error {0}: {1}'.format(e.returncode, e.output))
+
+        return e.returncode, e.output
+
+def get_time_lapse_positions(slider, job):
+    image_count = job['image_count']
+    end_position = job['end_position']
+
+    if end_position == None:
+        end_position = slider.motion_range
+
+    for position in [job['start_position'], end_position]:
+        if position < 0 or position > slider.motion_range:
+            raise HeadlessError('Position {0} is outside the motion range of {1} steps'.format(position, slider.motion_range))
+
+    keyframes = parse_keyframes(job['keyframes'])
+
+    for frame, position in keyframes:
+        if frame >= image_count or position < 0 or position > slider.motion_range:
+            raise HeadlessError('Keyframe {0}:{1} is outside the time lapse'.format(frame + 1, position))
+
+    keyframes += [(0, job['start_position']), (image_count - 1, end_position)]
+
+    return evaluate_path(keyframes, image_count, job['interpolation'])
+
+def run_move(slider, job):
+    position = job['position']
+
+    if position == None:
+        raise HeadlessError('No position given for move')
+
+    if position < 0 or position > slider.motion_range:
+        raise HeadlessError('Position {0} is outside the motion range of {1} steps'.format(position, slider.motion_range))
+
+    log('Moving cart to position {0} of {1}'.format(position, slider.motion_range))
+
+    slider.set_motion_parameters(job['velocity'], job['acceleration'], job['deceleration'])
+    slider.move_to(slider.to_stepper(position))
+
+    log('Move done')
+
+    if isinstance(slider, SliderGroup):
+        slider.log_skew()
+
+def run_home(slider, job):
+    # replaces the calibration of the profile with the found rail ends
+    if not isinstance(slider.stepper, BrickSilentStepper):
+        raise HeadlessError('Finding the rail ends requires a Silent Stepper Brick')
+
+    log('Finding rail ends of Silent Stepper Brick [{0}]'.format(slider.uid))
+
+    homing = StallGuardHoming(slider.stepper, slider.position_tracker, job['velocity'], job['stallguard_threshold'])
+    start_time = get_timestamp()
+    minimum_position, maximum_position = homing.run()
+    stepper_info = config.StepperInfo()
+
+    stepper_info.uid = slider.uid
+    stepper_info.minimum_position = minimum_position
+    stepper_info.maximum_position = maximum_position
+    stepper_info.current_position = slider.get_current_position()
+
+    slider.stepper_info = stepper_info
+
+    log('Found rail ends in {0:.1f} seconds, calibrated {1} steps of motion range for profile "{2}"'
+        .format(get_timestamp() - start_time, slider.motion_range, slider.profile))
+
+def run_time_lapse(slider, job):
+    image_count = job['image_count']
+    interval = job['interval']
+    camera_trigger = job['camera_trigger']
+    continuous = job['motion_mode'] == MOTION_MODE_CONTINUOUS
+    positions = get_time_lapse_positions(slider, job)
+
+    if continuous:
+        if len(job['keyframes']) > 0 or job['interpolation'] != INTERPOLATION_LINEAR:
+            raise HeadlessError('Keyframes and interpolations other than linear are not supported in continuous motion mode')
+
+        velocity = get_continuous_velocity(positions[0], positions[-1], image_count, interval)
+
+        if velocity > MAX_VELOCITY:
+            raise HeadlessError('Continuous motion requires {0} steps/s, but the maximum is {1} steps/s'
+                                .format(int(round(velocity)), MAX_VELOCITY))
+    else:
+        for image_index, duration in validate_path(positions, interval, job['velocity'], job['acceleration'], job['deceleration']):
+            log('Warning: move to image {0} requires {1:.1f} seconds, it will be captured late'.format(image_index + 1, duration))
+
+    schedule = TimeLapseSchedule([slider.to_stepper(position) for position in positions], interval, job['initial_delay'])
+
+    log('Moving cart to start position')
+
+    slider.set_motion_parameters(job['velocity'], job['acceleration'], job['deceleration'])
+    slider.move_to(schedule.get_position(0))
+
+    camera = create_trigger(camera_trigger, slider.ipcon, slider.host, slider.port)
+    telemetry = TimeLapseTelemetry(job['telemetry'])
+
+    log('Writing telemetry to ' + telemetry.filename)
+
+    try:
+        # start a persistent camera session now, so the camera detection does
+        # not delay the first image
+        camera.open()
+
+        log('Starting time lapse')
+
+        schedule.start()
+        telemetry.start(schedule.start_time)
+
+        if continuous:
+            # start the motion early by half the acceleration time, so the cart
+            # catches up with the constant velocity plan while accelerating
+            slider.set_max_velocity(max(int(round(velocity)), 1))
+            sleep_until(schedule.get_deadline(0) - velocity / (2.0 * job['acceleration']))
+            slider.start_move(schedule.get_position(image_count - 1))
+
+        for frame_index in range(image_count):
+            if continuous:
+                sleep_until(schedule.get_deadline(frame_index))
+                position = slider.get_current_position()
+                move_duration = None
+            else:
+                move_start_time = get_timestamp()
+                slider.move_to(schedule.get_position(frame_index))
+                move_duration = get_timestamp() - move_start_time
+                sleep_until(schedule.get_deadline(frame_index))
+                position = None
+
+            schedule.record_trigger(frame_index, position=position)
+
+            log('Triggering camera for image {0} of {1} at position {2}: {3}'
+                .format(frame_index + 1, image_count, slider.to_display(schedule.actual_positions[frame_index]), camera_trigger))
+
+            trigger_start = get_timestamp()
+            exit_code, output = trigger_camera(camera)
+
+            telemetry.record(frame_index, schedule.deadlines[frame_index], trigger_start, get_timestamp() - trigger_start,
+                             exit_code, slider.to_display(schedule.actual_positions[frame_index]), move_duration, output)
+    finally:
+        camera.close()
+        telemetry.close()
+
+    if continuous:
+        slider.wait_stopped()
+
+    count, mean_jitter, max_jitter = schedule.get_jitter_statistics()
+
+    log('Time lapse done')
+    log('Trigger jitter for {0} images: {1:.1f} ms mean, {2:.1f} ms max'.format(count, mean_jitter * 1000, max_jitter * 1000))
+
+    count, failure_count, p50_lateness, p99_lateness, p50_duration, p99_duration = telemetry.get_summary()
+
+    log('Camera trigger for {0} images: {1} failed, {2:.1f} ms p50 and {3:.1f} ms p99 lateness, {4:.1f} ms p50 and {5:.1f} ms p99 duration'
+        .format(count, failure_count, p50_lateness * 1000, p99_lateness * 1000, p50_duration * 1000, p99_duration * 1000))
+
+    if isinstance(slider, SliderGroup):
+        slider.log_skew()
+
+def run_multi_axis_time_lapse(rig, job):
+    # shoot-move-shoot only, the continuous motion mode cannot keep several
+    # axes in sync between the images
+    image_count = job['image_count']
+    interval = job['interval']
+    camera_trigger = job['camera_trigger']
+
+    if job['motion_mode'] == MOTION_MODE_CONTINUOUS:
+        raise HeadlessError('The continuous motion mode is not supported for multi-axis rigs')
+
+    keyframes = parse_joint_keyframes(job['joint_keyframes'], rig.axis_count)
+
+    for frame, positions in keyframes:
+        for position, motion_range in zip(positions, rig.motion_ranges):
+            if frame >= image_count or position < 0 or position > motion_range:
+                raise HeadlessError('Joint keyframe {0}:{1} is outside the time lapse'
+                                    .format(frame + 1, '/'.join([str(position) for position in positions])))
+
+    planning_start_time = get_timestamp()
+    joint_positions = evaluate_joint_path(keyframes, image_count, rig.axis_count, job['interpolation'])
+    limits = [(job['velocity'], job['acceleration'], job['deceleration'])] * rig.axis_count
+    plan = plan_joint_path(joint_positions, limits)
+
+    log('Planned {0} moves of {1} axes in {2:.1f} ms'.format(image_count - 1, rig.axis_count, (get_timestamp() - planning_start_time) * 1000))
+
+    for image_index in range(1, image_count):
+        if plan[image_index][0] > interval:
+            log('Warning: move to image {0} requires {1:.1f} seconds, it will be captured late'.format(image_index + 1, plan[image_index][0]))
+
+    # the schedule tracks the slide axis, the other axes follow the plan
+    schedule = TimeLapseSchedule([positions[0] for positions in joint_positions], interval, job['initial_delay'])
+
+    log('Moving axes to start position')
+
+    rig.move_joints_to(joint_positions[0], plan[0][1])
+
+    camera = create_trigger(camera_trigger, rig.ipcon, rig.host, rig.port)
+    telemetry = TimeLapseTelemetry(job['telemetry'])
+
+    log('Writing telemetry to ' + telemetry.filename)
+
+    try:
+        camera.open()
+
+        log('Starting time lapse')
+
+        schedule.start()
+        telemetry.start(schedule.start_time)
+
+        for frame_index in range(image_count):
+            move_start_time = get_timestamp()
+            rig.move_joints_to(joint_positions[frame_index], plan[frame_index][1])
+            move_duration = get_timestamp() - move_start_time
+            sleep_until(schedule.get_deadline(frame_index))
+
+            schedule.record_trigger(frame_index)
+
+            log('Triggering camera for image {0} of {1} at joint position {2}: {3}'
+                .format(frame_index + 1, image_count, '/'.join([str(position) for position in joint_positions[frame_index]]), camera_trigger))
+
+            trigger_start = get_timestamp()
+            exit_code, output = trigger_camera(camera)
+
+            telemetry.record(frame_index, schedule.deadlines[frame_index], trigger_start, get_timestamp() - trigger_start,
+                             exit_code, schedule.actual_positions[frame_index], move_duration, output)
+    finally:
+        camera.close()
+        telemetry.close()
+
+    count, mean_jitter, max_jitter = schedule.get_jitter_statistics()
+
+    log('Time lapse done')
+    log('Trigger jitter for {0} images: {1:.1f} ms mean, {2:.1f} ms max'.format(count, mean_jitter * 1000, max_jitter * 1000))
+
+    rig.log_skew()
+
+def load_job(args):
+    job = dict(JOB_DEFAULTS)
+
+    if args.job != None:
+        with open(args.job, 'r') as f:
+            job_file = json.load(f)
+
+        for key in job_file:
+            if key not in JOB_DEFAULTS:
+                raise HeadlessError('Unknown job file key: {0}'.format(key))
+
+            job[key] = job_file[key]
+
+    for key in JOB_DEFAULTS:
+        value = getattr(args, key)
+
+        if value != None:
+            job[key] = value
+
+    if job['action'] not in [ACTION_MOVE, ACTION_TIME_LAPSE, ACTION_HOME]:
+        raise HeadlessError('No action given, use "move", "time-lapse" or "home"')
+
+    if job['host'] == None or job['port'] == None:
+        host_info = config.get_host_infos(config.HOST_INFO_COUNT)[0]
+
+        if job['host'] == None:
+            job['host'] = host_info.host
+
+        if job['port'] == None:
+            job['port'] = host_info.port
+
+    for key in ['group', 'axes']:
+        if isinstance(job[key], str):
+            job[key] = job[key].split(',')
+
+    if job['uid'] == None and job['group'] == None and job['axes'] == None:
+        raise HeadlessError('No Stepper Brick UID, slider group or axes given')
+
+    if job['action'] == ACTION_HOME and (job['uid'] == None or job['group'] != None or job['axes'] != None):
+        raise HeadlessError('Finding the rail ends supports a single Stepper Brick given by --uid only, '
+                            'not combined with --group or --axes')
+
+    if job['axes'] != None:
+        if job['action'] != ACTION_TIME_LAPSE:
+            raise HeadlessError('Multi-axis rigs support the time-lapse action only')
+
+        if len(job['joint_keyframes']) == 0:
+            raise HeadlessError('No joint keyframes given for multi-axis rig')
+
+    if job['profile'] == None:
+        job['profile'] = config.get_calibration_profile()
+
+    if job['camera_trigger'] == None:
+        job['camera_trigger'] = config.get_camera_trigger()
+
+    if job['telemetry'] == None:
+        job['telemetry'] = get_telemetry_filename(config.get_telemetry_directory())
+
+    if job['image_count'] < 2:
+        raise HeadlessError('Image count must be 2 or greater')
+
+    return job
+
+def main():
+    parser = argparse.ArgumentParser(description='Headless time lapse runner for Starter Kit: Camera Slider. '
+                                                 'Uses the calibration and camera trigger stored by the GUI.')
+
+    parser.add_argument('action', nargs='?', choices=[ACTION_MOVE, ACTION_TIME_LAPSE, ACTION_HOME])
+    parser.add_argument('--job', help='JSON job file, its keys are the option names with underscores')
+    parser.add_argument('--host')
+    parser.add_argument('--port', type=int)
+    parser.add_argument('--uid', help='Stepper Brick UID')
+    parser.add_argument('--profile', help='calibration profile of the rail, defaults to the one selected in the GUI')
+    parser.add_argument('--group', help='sliders to move as one instead of --uid, comma separated [<host>:<port>:]<uid>[@<profile>]')
+    parser.add_argument('--axes', help='steppers of a multi-axis rig instead of --uid, e.g. slide, pan and tilt, same format as --group')
+    parser.add_argument('--joint-keyframes', help='image:position/position/..., ... with one position per axis, the first and last image are required')
+    parser.add_argument('--position', type=int, help='target position for move')
+    parser.add_argument('--image-count', type=int)
+    parser.add_argument('--interval', type=float, help='seconds')
+    parser.add_argument('--initial-delay', type=float, help='seconds')
+    parser.add_argument('--start-position', type=int)
+    parser.add_argument('--end-position', type=int, help='defaults to the end of the motion range')
+    parser.add_argument('--keyframes', help='image:position, ...')
+    parser.add_argument('--interpolation', choices=INTERPOLATIONS)
+    parser.add_argument('--motion-mode', choices=[MOTION_MODE_SHOOT_MOVE_SHOOT, MOTION_MODE_CONTINUOUS])
+    parser.add_argument('--camera-trigger')
+    parser.add_argument('--telemetry', help='per-image CSV file, defaults to a new file in the telemetry directory')
+    parser.add_argument('--velocity', type=int, help='steps/s')
+    parser.add_argument('--acceleration', type=int, help='steps/s²')
+    parser.add_argument('--deceleration', type=int, help='steps/s²')
+    parser.add_argument('--stallguard-threshold', type=int, help='-64 to 63, lower is more sensitive, for home')
+
+    args = parser.parse_args()
+
+    try:
+        job = load_job(args)
+    except (HeadlessError, MotionPathError, ValueError) as e:
+        print('error: {0}'.format(e))
+        return 1
+
+    try:
+        if job['axes'] != None:
+            slider = MultiAxisRig(job['axes'], job['host'], job['port'], job['profile'])
+        elif job['group'] != None:
+            slider = SliderGroup(job['group'], job['host'], job['port'], job['profile'])
+        else:
+            slider = HeadlessSlider(job['host'], job['port'], job['uid'], job['profile'])
+    except HeadlessError as e:
+        print('error: {0}'.format(e))
+        return 1
+
+    def shutdown(signal_number, frame):
+        raise KeyboardInterrupt()
+
+    signal.signal(signal.SIGTERM, shutdown)
+
+    try:
+        # finding the rail ends is the only action without a calibration
+        slider.connect(job['action'] != ACTION_HOME)
+
+        if job['action'] == ACTION_HOME:
+            run_home(slider, job)
+        elif job['action'] == ACTION_MOVE:
+            run_move(slider, job)
+        elif isinstance(slider, MultiAxisRig):
+            run_multi_axis_time_lapse(slider, job)
+        else:
+            run_time_lapse(slider, job)
+    except KeyboardInterrupt:
+        log('Aborting')
+    except (HeadlessError, MotionPathError, HomingError, Error, OSError, sqlite3.Error) as e:
+        log('Error: {0}'.format(e))
+        return 1
+    finally:
+        slider.disconnect()
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+homing.py: Sensorless Homing with StallGuard
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+
+# finds both rail ends of a Silent Stepper Brick by driving into them and
+# detecting the motor stall with StallGuard, no limit switches required.
+# StallGuard only works in spreadCycle mode above the Coolstep threshold, so
+# both thresholds are lowered below the homing velocity for the duration of
+# the homing. this module must not import PyQt, it is shared by the GUI and
+# the headless runner
+
+import time
+
+from starter_kit_camera_slider_demo.time_lapse import get_timestamp
+
+HOMING_ACCELERATION = 65535
+HOMING_DECELERATION = 65535
+
+# StallGuard reports nonsense while the motor accelerates, ignore stalls until
+# the homing velocity was (nearly) reached plus this time
+HOMING_SETTLE_VELOCITY = 0.95
+HOMING_SETTLE_TIME = 0.05
+
+HOMING_POLL_INTERVAL = 0.005
+
+# seconds to find one rail end
+HOMING_TIMEOUT = 120.0
+
+# steps the calibrated range stays away from each rail end
+HOMING_MARGIN = 1000
+
+DEFAULT_STALLGUARD_THRESHOLD = 0
+
+class HomingError(Exception):
+    pass
+
+def wait_for_standstill(stepper, deadline):
+    # also used after an abort, the error is only reported once the cart
+    # stands still
+    while stepper.get_current_velocity() != 0:
+        if get_timestamp() > deadline:
+            raise HomingError('Stepper did not stop')
+
+        time.sleep(HOMING_POLL_INTERVAL)
+
+class StallGuardHoming(object):
+    # runs in the calling thread and blocks until both ends are found. abort
+    # can be called from another thread
+    def __init__(self, stepper, position_tracker, velocity, stallguard_threshold=DEFAULT_STALLGUARD_THRESHOLD,
+                 margin=HOMING_MARGIN):
+        self.stepper = stepper
+        self.position_tracker = position_tracker
+        self.velocity = velocity
+        self.stallguard_threshold = stallguard_threshold
+        self.margin = margin
+        self.aborted = False
+
+    def abort(self):
+        self.aborted = True
+
+    def find_end(self, direction):
+        # returns the position at which the cart came to a standstill at the
+        # rail end. the motor keeps counting steps while it is blocked, those
+        # would shift the coordinates of the other end, so the stall ends with
+        # a full brake instead of a deceleration ramp. an abort is an
+        # emergency stop and ends with a full brake too
+        start_time = get_timestamp()
+        deadline = start_time + HOMING_TIMEOUT
+        settled_time = None
+        stalled = False
+
+        if direction > 0:
+            self.stepper.drive_forward()
+        else:
+            self.stepper.drive_backward()
+
+        try:
+            while True:
+                time.sleep(HOMING_POLL_INTERVAL)
+
+                if self.aborted:
+                    raise HomingError('Homing aborted')
+
+                now = get_timestamp()
+
+                if now > deadline:
+                    raise HomingError('No rail end found within {0:.0f} seconds'.format(HOMING_TIMEOUT))
+
+                if settled_time == None:
+                    if self.stepper.get_current_velocity() >= self.velocity * HOMING_SETTLE_VELOCITY:
+                        settled_time = now + HOMING_SETTLE_TIME
+
+                    continue
+
+                if now < settled_time:
+                    continue
+
+                if self.stepper.get_driver_status().motor_stalled:
+                    stalled = True
+                    break
+        finally:
+            if stalled or self.aborted:
+                self.position_tracker.full_brake()
+            else:
+                self.position_tracker.stop()
+
+            wait_for_standstill(self.stepper, get_timestamp() + HOMING_TIMEOUT)
+
+        return self.position_tracker.get_current_position()
+
+    def run(self):
+        # returns the minimum and maximum position, the minimum is the end
+        # reached by driving backward
+        basic_configuration = self.stepper.get_basic_configuration()
+        coolstep_configuration = self.stepper.get_coolstep_configuration()
+        max_velocity = self.stepper.get_max_velocity()
+        acceleration, deceleration = self.stepper.get_speed_ramping()
+        threshold = max(self.velocity // 2, 1)
+
+        try:
+            self.stepper.set_basic_configuration(basic_configuration.standstill_current,
+                                                 basic_configuration.motor_run_current,
+                                                 basic_configuration.standstill_delay_time,
+                                                 basic_configuration.power_down_time,
+                                                 threshold, # stealth threshold
+                                                 threshold, # coolstep threshold
+                                                 basic_configuration.classic_threshold,
+                                                 basic_configuration.high_velocity_chopper_mode)
+            self.stepper.set_coolstep_configuration(coolstep_configuration.minimum_stallguard_value,
+                                                    coolstep_configuration.maximum_stallguard_value,
+                                                    coolstep_configuration.current_up_step_width,
+                                                    coolstep_configuration.current_down_step_width,
+                                                    coolstep_configuration.minimum_current,
+                                                    self.stallguard_threshold,
+                                                    coolstep_configuration.stallguard_mode)
+            self.stepper.set_max_velocity(self.velocity)
+            self.stepper.set_speed_ramping(HOMING_ACCELERATION, HOMING_DECELERATION)
+            self.stepper.enable()
+
+            maximum_end = self.find_end(1)
+            minimum_end = self.find_end(-1)
+        finally:
+            self.stepper.set_basic_configuration(*basic_configuration)
+            self.stepper.set_coolstep_configuration(*coolstep_configuration)
+            self.stepper.set_max_velocity(max_velocity)
+            self.stepper.set_speed_ramping(acceleration, deceleration)
+
+        if maximum_end - minimum_end <= 2 * self.margin:
+            raise HomingError('Rail ends are only {0} steps apart, check the StallGuard threshold'
+                              .format(maximum_end - minimum_end))
+
+        return minimum_end + self.margin, maximum_end - self.margin
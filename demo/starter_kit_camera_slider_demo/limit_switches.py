@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+limit_switches.py: IO-4 Limit Switches
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+
+# two normally open limit switches between the IO-4 pins and ground, pin 0 at
+# the minimum (backward) end and pin 1 at the maximum (forward) end of the
+# rail. the pins are inputs with pull-up, a closed switch reads low. the
+# interrupt callback is handled directly in the callback thread of the IP
+# Connection and brakes the stepper from there, without waiting for the Qt
+# event loop or any other queue. this module must not import PyQt, it is
+# shared by the GUI and the headless runner
+
+import threading
+
+from starter_kit_camera_slider_demo.time_lapse import get_timestamp
+from starter_kit_camera_slider_demo.homing import HomingError, HOMING_POLL_INTERVAL, HOMING_TIMEOUT, wait_for_standstill
+
+MINIMUM_SWITCH_PIN = 0
+MAXIMUM_SWITCH_PIN = 1
+
+MINIMUM_SWITCH_MASK = 1 << MINIMUM_SWITCH_PIN
+MAXIMUM_SWITCH_MASK = 1 << MAXIMUM_SWITCH_PIN
+SWITCH_MASK = MINIMUM_SWITCH_MASK | MAXIMUM_SWITCH_MASK
+
+# ms, the first change is reported right away, further changes of a bouncing
+# switch at most once per period
+DEBOUNCE_PERIOD = 10
+
+# steps the calibrated range stays away from each switch
+LIMIT_SWITCH_MARGIN = 200
+
+def get_switch_names(mask):
+    names = []
+
+    if (mask & MINIMUM_SWITCH_MASK) != 0:
+        names.append('minimum')
+
+    if (mask & MAXIMUM_SWITCH_MASK) != 0:
+        names.append('maximum')
+
+    return ' and '.join(names)
+
+class LimitSwitches(object):
+    # triggered is called from the callback thread as triggered(mask,
+    # latency) after the stepper was braked, latency is the time from the
+    # arrival of the interrupt callback to the sent brake request. the time
+    # the interrupt spent on its way from the Bricklet is not included
+    def __init__(self, io4, position_tracker, triggered=None):
+        self.io4 = io4
+        self.position_tracker = position_tracker
+        self.triggered = triggered
+        self.lock = threading.Lock()
+        self.closed_mask = 0
+        self.condition = threading.Condition(self.lock)
+        self.trigger_count = 0
+        self.latencies = []
+
+    def start(self):
+        self.io4.set_configuration(SWITCH_MASK, 'i', True)
+        self.io4.set_debounce_period(DEBOUNCE_PERIOD)
+        self.io4.register_callback(self.io4.CALLBACK_INTERRUPT, self.cb_interrupt)
+        self.io4.set_interrupt(SWITCH_MASK)
+
+        with self.lock:
+            self.closed_mask = ~self.io4.get_value() & SWITCH_MASK
+
+    def stop(self):
+        self.io4.set_interrupt(0)
+        self.io4.register_callback(self.io4.CALLBACK_INTERRUPT, None)
+
+    def cb_interrupt(self, interrupt_mask, value_mask):
+        arrival_time = get_timestamp()
+        closing_mask = interrupt_mask & ~value_mask & SWITCH_MASK
+
+        # emergency stop, the stepper is braked before anything else is done
+        if closing_mask != 0:
+            self.position_tracker.full_brake()
+
+        latency = get_timestamp() - arrival_time
+
+        with self.lock:
+            self.closed_mask = ~value_mask & SWITCH_MASK
+
+            if closing_mask != 0:
+                self.trigger_count += 1
+                self.latencies.append(latency)
+
+            self.condition.notify_all()
+
+        if closing_mask != 0 and self.triggered != None:
+            self.triggered(closing_mask, latency)
+
+    def get_closed_mask(self):
+        with self.lock:
+            return self.closed_mask
+
+    def get_blocking_mask(self, direction):
+        # the interrupt only fires when a switch changes, a motion further
+        # into a switch that is already closed has to be refused up front.
+        # returns the closed switch in the direction of the motion, if any
+        if direction > 0:
+            return self.get_closed_mask() & MAXIMUM_SWITCH_MASK
+        elif direction < 0:
+            return self.get_closed_mask() & MINIMUM_SWITCH_MASK
+
+        return 0
+
+    def wait_closed(self, mask, timeout):
+        # returns True if one of the switches in mask is closed
+        with self.lock:
+            return self.condition.wait_for(lambda: (self.closed_mask & mask) != 0, timeout)
+
+    def get_latency_statistics(self):
+        # returns count, mean and maximum latency
+        with self.lock:
+            latencies = list(self.latencies)
+
+        if len(latencies) == 0:
+            return 0, 0.0, 0.0
+
+        return len(latencies), sum(latencies) / len(latencies), max(latencies)
+
+class LimitSwitchHoming(object):
+    # finds both rail ends by driving into the limit switches, same interface
+    # as StallGuardHoming. the switches brake the stepper on their own
+    def __init__(self, stepper, position_tracker, limit_switches, velocity, margin=LIMIT_SWITCH_MARGIN):
+        self.stepper = stepper
+        self.position_tracker = position_tracker
+        self.limit_switches = limit_switches
+        self.velocity = velocity
+        self.margin = margin
+        self.aborted = False
+
+    def abort(self):
+        self.aborted = True
+
+    def find_end(self, direction, mask):
+        # returns the position at which the cart stopped at the switch
+        deadline = get_timestamp() + HOMING_TIMEOUT
+
+        if (self.limit_switches.get_closed_mask() & mask) == 0:
+            if direction > 0:
+                self.stepper.drive_forward()
+            else:
+                self.stepper.drive_backward()
+
+            try:
+                while not self.limit_switches.wait_closed(mask, HOMING_POLL_INTERVAL * 10):
+                    if self.aborted:
+                        raise HomingError('Homing aborted')
+
+                    if get_timestamp() > deadline:
+                        raise HomingError('No {0} limit switch found within {1:.0f} seconds'
+                                          .format(get_switch_names(mask), HOMING_TIMEOUT))
+            finally:
+                # an abort is an emergency stop
+                if self.aborted:
+                    self.position_tracker.full_brake()
+                else:
+                    self.position_tracker.stop()
+
+                wait_for_standstill(self.stepper, get_timestamp() + HOMING_TIMEOUT)
+        else:
+            wait_for_standstill(self.stepper, deadline)
+
+        return self.position_tracker.get_current_position()
+
+    def run(self):
+        max_velocity = self.stepper.get_max_velocity()
+
+        try:
+            self.stepper.set_max_velocity(self.velocity)
+            self.stepper.enable()
+
+            maximum_end = self.find_end(1, MAXIMUM_SWITCH_MASK)
+            minimum_end = self.find_end(-1, MINIMUM_SWITCH_MASK)
+        finally:
+            self.stepper.set_max_velocity(max_velocity)
+
+        if maximum_end - minimum_end <= 2 * self.margin:
+            raise HomingError('Limit switches are only {0} steps apart, check the wiring'
+                              .format(maximum_end - minimum_end))
+
+        return minimum_end + self.margin, maximum_end - self.margin
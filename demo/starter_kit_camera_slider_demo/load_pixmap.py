@@ -22,32 +22,139 @@ Free Software Foundation, Inc., 59 Temple Place - Suite 330,
 Boston, MA 02111-1307, USA.
 """
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPixmap, QColor
+from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtGui import QPixmap, QColor, QPixmapCache, QImageReader, QIcon
 
 import os
 import sys
 
+# the resource root and the names directly in it are looked up once, a
+# frozen program does not probe the file system again for every resource
+resources_root = None
+resources_index = None
+resources_paths = {} # relative path -> absolute path or None
+
+def get_resources_root():
+    global resources_root, resources_index
+
+    if resources_root == None:
+        try:
+            # PyInstaller stores data files in a tmp folder refered to as _MEIPASS
+            #pylint: disable=protected-access
+            resources_root = sys._MEIPASS
+        except AttributeError:
+            resources_root = os.path.dirname(os.path.realpath(__file__))
+
+        try:
+            resources_index = set(os.listdir(resources_root))
+        except OSError:
+            resources_index = set()
+
+    return resources_root
+
 def get_resources_path(relative_path, warn_on_missing_file=True):
-    try:
-        # PyInstaller stores data files in a tmp folder refered to as _MEIPASS
-        #pylint: disable=protected-access
-        base_path = sys._MEIPASS
-    except AttributeError:
-        base_path = os.path.dirname(os.path.realpath(__file__))
+    if relative_path not in resources_paths:
+        base_path = get_resources_root()
+        path = os.path.join(base_path, relative_path)
+
+        if os.path.dirname(relative_path) == '':
+            exists = relative_path in resources_index
+        else:
+            exists = os.path.exists(path)
 
-    path = os.path.join(base_path, relative_path)
+        resources_paths[relative_path] = path if exists else None
+
+    path = resources_paths[relative_path]
 
     # If the path still doesn't exist, this function won't help you
-    if not os.path.exists(path):
-        if warn_on_missing_file:
-            print("Resource not found: " + relative_path)
-        return None
+    if path == None and warn_on_missing_file:
+        print("Resource not found: " + relative_path)
 
     return path
 
-def load_pixmap(path):
+def load_pixmap(path, size=None):
+    # decoded pixmaps are kept in the QPixmapCache. with a size the image is
+    # read at that size, an SVG is rendered at it instead of being scaled
+    key = 'load_pixmap:{0}'.format(path)
+
+    if size != None:
+        key += ':{0}x{1}'.format(size.width(), size.height())
+
+    pixmap = QPixmapCache.find(key)
+
+    if pixmap != None and not pixmap.isNull():
+        return pixmap
+
     absolute_path = get_resources_path(path)
-    pixmap = QPixmap(absolute_path)
+
+    if absolute_path == None:
+        return QPixmap()
+
+    if size == None:
+        pixmap = QPixmap(absolute_path)
+    else:
+        reader = QImageReader(absolute_path)
+
+        reader.setScaledSize(size)
+
+        pixmap = QPixmap.fromImage(reader.read())
+
+    if not pixmap.isNull():
+        QPixmapCache.insert(key, pixmap)
 
     return pixmap
+
+def get_cache_directory():
+    if sys.platform == 'win32':
+        base_path = os.getenv('LOCALAPPDATA', os.path.expanduser('~'))
+    elif sys.platform == 'darwin':
+        base_path = os.path.join(os.path.expanduser('~'), 'Library', 'Caches')
+    else:
+        base_path = os.getenv('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache'))
+
+    return os.path.join(base_path, 'starter_kit_camera_slider_demo')
+
+def load_icon(svg_path, png_path, sizes, device_pixel_ratio=1.0):
+    # rasterizes the SVG at each size times the device pixel ratio once and
+    # keeps the result on disk, later starts only read the PNG files. falls
+    # back to the bundled PNG if the SVG is not available or not readable
+    icon = QIcon()
+    absolute_svg_path = get_resources_path(svg_path, warn_on_missing_file=False)
+
+    if absolute_svg_path != None:
+        cache_directory = get_cache_directory()
+        svg_mtime = os.path.getmtime(absolute_svg_path)
+        name = os.path.splitext(os.path.basename(svg_path))[0]
+
+        for size in sizes:
+            pixel_size = int(round(size * device_pixel_ratio))
+            cache_path = os.path.join(cache_directory, '{0}-{1}.png'.format(name, pixel_size))
+
+            try:
+                cached = os.path.getmtime(cache_path) >= svg_mtime
+            except OSError:
+                cached = False
+
+            pixmap = QPixmap(cache_path) if cached else QPixmap()
+
+            # a cached file that cannot be read is replaced
+            if pixmap.isNull():
+                pixmap = load_pixmap(svg_path, QSize(pixel_size, pixel_size))
+
+                if not pixmap.isNull():
+                    try:
+                        if not os.path.exists(cache_directory):
+                            os.makedirs(cache_directory)
+
+                        pixmap.save(cache_path, 'PNG')
+                    except OSError:
+                        pass
+
+            if not pixmap.isNull():
+                pixmap.setDevicePixelRatio(device_pixel_ratio)
+                icon.addPixmap(pixmap)
+
+    if icon.isNull():
+        icon.addPixmap(load_pixmap(png_path))
+
+    return icon
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+log_buffer.py: Bounded Log Buffer and Asynchronous Log File
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+
+import os
+import queue
+import threading
+from collections import deque
+from datetime import datetime
+
+# maximum number of lines kept in the log view and waiting to be shown there
+LOG_MAX_LINE_COUNT = 10000
+
+# milliseconds, lines that arrive within this time are appended in one go
+LOG_FLUSH_INTERVAL = 16
+
+LOG_FILE_NAME = 'starter_kit_camera_slider_demo.log'
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 10
+
+def format_log_line(message):
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S') + ' - ' + message
+
+class LogBuffer(object):
+    # collects log lines from any thread until the GUI thread takes them. if
+    # the GUI thread falls behind, the oldest lines are dropped and counted
+    def __init__(self, max_line_count=LOG_MAX_LINE_COUNT):
+        self.lock = threading.Lock()
+        self.lines = deque(maxlen=max_line_count)
+        self.dropped_count = 0
+
+    def append(self, line):
+        # returns True if the buffer was empty, the caller has to schedule a
+        # flush then. otherwise a flush is already scheduled
+        with self.lock:
+            was_empty = len(self.lines) == 0
+
+            if len(self.lines) == self.lines.maxlen:
+                self.dropped_count += 1
+
+            self.lines.append(line)
+
+        return was_empty
+
+    def take(self):
+        with self.lock:
+            lines = list(self.lines)
+            dropped_count = self.dropped_count
+
+            self.lines.clear()
+            self.dropped_count = 0
+
+        if dropped_count > 0:
+            lines.insert(0, format_log_line('{0} log lines dropped'.format(dropped_count)))
+
+        return lines
+
+    def clear(self):
+        with self.lock:
+            self.lines.clear()
+            self.dropped_count = 0
+
+class LogFile(object):
+    # writes log lines to a rotating file. the lines are handed to a listener
+    # thread through a queue, so writing a line never blocks on the disk
+    def __init__(self, directory):
+        # logging.handlers pulls in many modules, it is only imported once a
+        # log file is opened, after the main window is shown
+        import logging.handlers
+
+        self.filename = os.path.join(directory, LOG_FILE_NAME)
+        self.record_class = logging.LogRecord
+        self.record_level = logging.INFO
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.handler = logging.handlers.RotatingFileHandler(self.filename, maxBytes=LOG_FILE_MAX_BYTES,
+                                                            backupCount=LOG_FILE_BACKUP_COUNT, encoding='utf-8')
+        self.handler.setFormatter(logging.Formatter('%(message)s'))
+
+        self.queue = queue.SimpleQueue()
+        self.queue_handler = logging.handlers.QueueHandler(self.queue)
+        self.listener = logging.handlers.QueueListener(self.queue, self.handler)
+        self.listener.start()
+
+    def write(self, line):
+        if self.listener == None:
+            return
+
+        self.queue_handler.emit(self.record_class('log', self.record_level, '', 0, line, None, None))
+
+    def close(self):
+        # blocks until the remaining lines are written
+        if self.listener != None:
+            self.listener.stop()
+            self.listener = None
+            self.handler.close()
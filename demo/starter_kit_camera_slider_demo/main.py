@@ -22,16 +22,15 @@ Free Software Foundation, Inc., 59 Temple Place - Suite 330,
 Boston, MA 02111-1307, USA.
 """
 
-# FIXME: the Stepper Brick position is represented as an int32_t. the position
-# can overflow between the minimum and maximum position. the code does not deal
-# with this (yet)
+# the Stepper Brick position is represented as an int32_t and can overflow
+# between the minimum and maximum position. all positions used here are virtual
+# positions as tracked by the PositionTracker, they do not overflow
 
 import sys
 if (sys.hexversion & 0xFF000000) != 0x03000000:
     print('Python 3.x required')
     sys.exit(1)
 
-import ctypes
 import os
 
 def prepare_package(package_name):
@@ -60,25 +59,51 @@ def prepare_package(package_name):
 
 program_path = prepare_package('starter_kit_camera_slider_demo')
 
+from starter_kit_camera_slider_demo.startup_profile import startup_profile
+
 import time
 import signal
 import subprocess
 import threading
-from datetime import datetime
+
+startup_profile.mark('import standard library')
 
 from PyQt5.QtCore import pyqtSignal, Qt, QObject, QTimer, QEvent
 from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox, QStyle, \
                         QStyleOptionSlider, QSlider
 from PyQt5.QtGui import QIcon, QFont
 
-from starter_kit_camera_slider_demo.tinkerforge.ip_connection import IPConnection
+startup_profile.mark('import PyQt5')
+
+from starter_kit_camera_slider_demo.tinkerforge.ip_connection import IPConnection, Error
 from starter_kit_camera_slider_demo.tinkerforge.brick_stepper import BrickStepper
 from starter_kit_camera_slider_demo.tinkerforge.brick_silent_stepper import BrickSilentStepper
-from starter_kit_camera_slider_demo.tinkerforge.bricklet_io4 import BrickletIO4
 from starter_kit_camera_slider_demo.ui_mainwindow import Ui_MainWindow
-from starter_kit_camera_slider_demo.load_pixmap import load_pixmap, get_resources_path
+from starter_kit_camera_slider_demo.load_pixmap import load_pixmap, load_icon, get_resources_path
+
+startup_profile.mark('import bindings and UI')
+
+from starter_kit_camera_slider_demo.slider import CALIBRATION_ACCELERATION, CALIBRATION_DECELERATION, \
+                                                 FULL_BREAK_DECELERATION, MAX_VELOCITY, PositionTracker, create_stepper, \
+                                                 configure_stepper, update_stepper_info, is_stepper_reversed, \
+                                                 position_stepper_to_display, position_display_to_stepper
+from starter_kit_camera_slider_demo.time_lapse import TimeLapseSchedule, get_continuous_velocity, get_timestamp
+from starter_kit_camera_slider_demo.trigger_worker import TriggerWorker
+from starter_kit_camera_slider_demo.camera import CameraTriggerError
+from starter_kit_camera_slider_demo.trigger_drivers import create_trigger
+from starter_kit_camera_slider_demo.telemetry import TimeLapseTelemetry, get_telemetry_filename
+from starter_kit_camera_slider_demo.ui_state import UIState
+from starter_kit_camera_slider_demo.log_buffer import LOG_MAX_LINE_COUNT, LOG_FLUSH_INTERVAL, LogBuffer, LogFile, \
+                                                     format_log_line
+from starter_kit_camera_slider_demo.motion_path import INTERPOLATIONS, INTERPOLATION_LINEAR, MotionPathError, \
+                                                      parse_keyframes, evaluate_path, validate_path
+from starter_kit_camera_slider_demo.calibration_store import open_calibration_store, CalibrationStoreError
+from starter_kit_camera_slider_demo.homing import StallGuardHoming, HomingError
+from starter_kit_camera_slider_demo.limit_switches import LimitSwitches, LimitSwitchHoming, get_switch_names
 import starter_kit_camera_slider_demo.config as config
 
+startup_profile.mark('import demo modules')
+
 def load_commit_id(name):
     try:
         # Don't warn if the file is missing, as it is expected when run from source.
@@ -106,6 +131,9 @@ elif SNAPSHOT != None:
 NO_STEPPER_BRICK_FOUND = 'No Stepper Brick found'
 NO_IO4_BRICKLET_FOUND = 'No IO-4 Bricklet found'
 
+# ms, devices that did not answer the enumeration until then are gone
+DEVICE_CACHE_CONFIRM_TIMEOUT = 1000
+
 DEVICE_IDENTIFIERS = {11: 'DC Brick',
                       13: 'Master Brick',
                       14: 'Servo Brick',
@@ -114,19 +142,23 @@ DEVICE_IDENTIFIERS = {11: 'DC Brick',
                       16: 'IMU Brick',
                       17: 'RED Brick'}
 
+# same as in the IO-4 Bricklet bindings, they are only imported once limit
+# switches are used
+IO4_DEVICE_IDENTIFIER = 29
+
+ICON_SIZES = [16, 24, 32, 48, 64, 128]
+
 TAB_CONNECTION = 0
 TAB_CALIBRATION = 1
 TAB_MOTION = 2
 TAB_TIME_LAPSE = 3
 
-CALIBRATION_ACCELERATION = 65535
-CALIBRATION_DECELERATION = 65535
+# milliseconds, at most one target position is sent per period while the
+# target position slider is dragged
+TARGET_POSITION_COMMAND_PERIOD = 50
 
-FULL_BREAK_DECELERATION = 65535
-
-MOTOR_CURRENT = 850
-SYNC_RECT = True
-DECAY = 10000
+MOTION_MODE_SHOOT_MOVE_SHOOT = 0
+MOTION_MODE_CONTINUOUS = 1
 
 gphoto2_path = None
 
@@ -161,12 +193,64 @@ class SliderSpinSyncer(QObject):
             if changed_callback != None:
                 changed_callback()
 
+class CommandCoalescer(QObject):
+    # sends the first submitted value immediately and then at most one value
+    # per period, intermediate values are dropped but the last one is always
+    # sent. the send callback returns True if it sent a command
+    def __init__(self, parent, period, send_callback):
+        QObject.__init__(self, parent)
+
+        self.send_callback = send_callback
+        self.pending = None
+        self.timer = QTimer(self)
+
+        self.timer.setInterval(period)
+        self.timer.timeout.connect(self.send_pending)
+
+        self.reset_statistics()
+
+    def reset_statistics(self):
+        self.event_count = 0
+        self.command_count = 0
+
+    def submit(self, value):
+        self.event_count += 1
+
+        if self.timer.isActive():
+            self.pending = value
+        else:
+            self.send(value)
+            self.timer.start()
+
+    def send(self, value):
+        if self.send_callback(value):
+            self.command_count += 1
+
+    def send_pending(self):
+        if self.pending == None:
+            self.timer.stop()
+            return
+
+        value = self.pending
+        self.pending = None
+
+        self.send(value)
+
+    def cancel(self):
+        self.pending = None
+        self.timer.stop()
+
 class MainWindow(QMainWindow, Ui_MainWindow):
     qtcb_ipcon_enumerate = pyqtSignal(str, str, str, type((0,)), type((0,)), int, int)
     qtcb_ipcon_connected = pyqtSignal(int)
     qtcb_ipcon_disconnected = pyqtSignal(int)
     qtcb_stepper_new_state = pyqtSignal(int, int)
-    qtcb_log_append = pyqtSignal(str)
+    qtcb_log_flush_scheduled = pyqtSignal()
+    qtcb_time_lapse_next = pyqtSignal()
+    qtcb_time_lapse_done = pyqtSignal()
+    qtcb_time_lapse_exposing = pyqtSignal(int, float)
+    qtcb_calibration_homing_done = pyqtSignal(object, str)
+    qtcb_limit_switch_triggered = pyqtSignal(int, float)
 
     def __init__(self, parent=None):
         QMainWindow.__init__(self, parent)
@@ -174,20 +258,26 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.setupUi(self)
         self.setWindowTitle('Starter Kit: Camera Slider Demo ' + DEMO_FULL_VERSION)
 
+        startup_profile.mark('setupUi')
+
         signal.signal(signal.SIGINT, self.shutdown)
         signal.signal(signal.SIGTERM, self.shutdown)
 
-        self.devices = {} # uid -> (connected_uid, device_identifier)
+        self.devices = {} # uid -> (connected_uid, device_identifier, firmware_version)
+        self.unconfirmed_uids = set()
 
         self.calibration_velocity = 2000
 
         self.stepper = None
+        self.position_tracker = None
         self.stepper_info = None
         self.stepper_enabled = False
         self.stepper_driving = False
         self.stepper_reversed = False
+        self.target_position_driving = False
 
         self.io4 = None
+        self.limit_switches = None
 
         self.disconnect_times = []
         self.disconnect_in_progress = False
@@ -195,34 +285,50 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.shutdown_in_progress = False
 
         self.calibration_in_progress = False
-        self.stepper_infos = {}
+        self.calibration_store = open_calibration_store()
+        self.calibration_profile = config.get_calibration_profile()
         self.temporary_minimum_position = None
         self.temporary_maximum_position = None
+        self.calibration_homing = None
 
         self.full_break_in_progress = False
 
+        self.ui_state = UIState()
+        self.connection_state = IPConnection.CONNECTION_STATE_DISCONNECTED
+        self.connecting = False
+
         self.test_in_progress = False
         self.test_thread = None
         self.time_lapse_in_progress = False
         self.time_lapse_in_preparation = False
         self.time_lapse_id = 0
         self.first_time_lapse_trigger = False
-        self.trigger_thread = None
-        self.trigger_thread_id = 0
-        self.image_count = 0
-        self.remaining_image_count = 0
-        self.interval = 0
-        self.next_trigger_time = 0
-        self.steps_per_interval = 0
-        self.next_trigger_position = 0
+        self.trigger_worker = TriggerWorker()
+        self.trigger_worker.start()
+        self.time_lapse_camera = None
+        self.time_lapse_telemetry = None
+        self.time_lapse_move_start_time = None
+        self.time_lapse_move_duration = None
+        self.time_lapse_exposure_time = 0.0
+        self.time_lapse_saved_time = 0.0
+        self.time_lapse_saved_count = 0
+        self.time_lapse_previous_write_out = None
+        self.time_lapse_schedule = None
+        self.time_lapse_continuous = False
+        self.time_lapse_velocity = 0
 
         self.qtcb_ipcon_enumerate.connect(self.cb_ipcon_enumerate)
         self.qtcb_ipcon_connected.connect(self.cb_ipcon_connected)
         self.qtcb_ipcon_disconnected.connect(self.cb_ipcon_disconnected)
         self.qtcb_stepper_new_state.connect(self.cb_stepper_new_state)
-        self.qtcb_log_append.connect(self.log_append)
+        self.qtcb_log_flush_scheduled.connect(self.log_schedule_flush)
+        self.qtcb_time_lapse_next.connect(self.time_lapse_next)
+        self.qtcb_time_lapse_done.connect(self.time_lapse_done)
+        self.qtcb_time_lapse_exposing.connect(self.time_lapse_exposing)
+        self.qtcb_calibration_homing_done.connect(self.calibration_homing_done)
+        self.qtcb_limit_switch_triggered.connect(self.limit_switch_triggered)
 
-        self.tab_widget.currentChanged.connect(lambda: self.update_ui_state())
+        self.tab_widget.currentChanged.connect(self.tab_changed)
 
         # create and setup ipcon
         self.ipcon = IPConnection()
@@ -241,12 +347,13 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.edit_host.setText(host_info.host)
         self.spin_port.setValue(host_info.port)
 
+        startup_profile.mark('connection tab')
+
         # prepare calibration tab
         self.combo_stepper_uid.currentIndexChanged.connect(self.stepper_uid_changed)
         self.check_automatic_power_control.stateChanged.connect(self.automatic_power_control_changed)
-        self.line_limit_switches.setVisible(False) # FIXME
-        self.check_limit_switches.setVisible(False) # FIXME
-        self.check_limit_switches.stateChanged.connect(lambda: self.update_ui_state())
+        self.check_limit_switches.stateChanged.connect(self.limit_switches_changed)
+        self.combo_io4_uid.currentIndexChanged.connect(self.limit_switches_changed)
         self.button_calibration_start.clicked.connect(self.calibration_start)
         self.button_calibration_abort.clicked.connect(self.calibration_abort)
         self.button_calibration_forward.pressed.connect(self.calibration_forward_pressed)
@@ -255,18 +362,23 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.button_calibration_backward.released.connect(self.calibration_backward_released)
         self.button_calibration_set_minimum.clicked.connect(self.calibration_set_minimum)
         self.button_calibration_set_maximum.clicked.connect(self.calibration_set_maximum)
+        self.button_calibration_home.clicked.connect(self.calibration_home)
 
-        for stepper_info in config.get_stepper_infos(config.STEPPER_INFO_COUNT):
-            self.stepper_infos[stepper_info.uid] = stepper_info
+        startup_profile.mark('calibration tab')
 
         # prepare motion tab
         self.current_position_syncer = SliderSpinSyncer(self, self.slider_current_position, self.spin_current_position, None)
         self.target_position_syncer = SliderSpinSyncer(self, self.slider_target_position, self.spin_target_position, self.target_position_changed)
+        self.target_position_coalescer = CommandCoalescer(self, TARGET_POSITION_COMMAND_PERIOD, self.send_target_position)
         self.velocity_syncer = SliderSpinSyncer(self, self.slider_velocity, self.spin_velocity, self.velocity_changed)
         self.acceleration_syncer = SliderSpinSyncer(self, self.slider_acceleration, self.spin_acceleration, self.speed_ramping_changed)
         self.deceleration_syncer = SliderSpinSyncer(self, self.slider_deceleration, self.spin_deceleration, self.speed_ramping_changed)
 
         self.slider_target_position.installEventFilter(self)
+
+        # the cart follows the slider while it is dragged, the coalescer keeps
+        # this from flooding the stepper with commands
+        self.slider_target_position.setTracking(True)
         self.slider_velocity.installEventFilter(self)
         self.slider_acceleration.installEventFilter(self)
         self.slider_deceleration.installEventFilter(self)
@@ -282,10 +394,55 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.current_position_timer.setInterval(50)
         self.current_position_timer.timeout.connect(self.update_current_position)
 
-        # prepare time lapse tab
+        startup_profile.mark('motion tab')
+
+        # the time lapse tab is prepared on its first activation
+        self.time_lapse_tab_prepared = False
+
+        self.edit_camera_trigger.setText(config.get_camera_trigger())
+
+        # prepare log tab, the log file is opened after the window is shown
+        self.log_buffer = LogBuffer()
+        self.log_file = None
+
+        self.edit_log.setMaximumBlockCount(LOG_MAX_LINE_COUNT)
+        self.button_log_clear.clicked.connect(self.log_clear)
+
+        # last things
+        self.clear_all_uids()
+
+        startup_profile.mark('log tab')
+
+    def startup_finished(self):
+        # called on the first event loop iteration after the window was shown
+        startup_profile.mark('first event loop iteration')
+
+        try:
+            self.log_file = LogFile(config.get_telemetry_directory())
+        except OSError as e:
+            self.log_append('Could not open log file: {0}'.format(e))
+
+        startup_profile.mark('open log file')
+
+        if startup_profile.enabled:
+            for line in startup_profile.get_report():
+                print(line)
+                self.log_append(line)
+
+    def prepare_time_lapse_tab(self):
+        if self.time_lapse_tab_prepared:
+            return
+
+        self.time_lapse_tab_prepared = True
+
         self.start_position_syncer = SliderSpinSyncer(self, self.slider_start_position, self.spin_start_position, None)
         self.end_position_syncer = SliderSpinSyncer(self, self.slider_end_position, self.spin_end_position, None)
 
+        # calibration_changed might have set the sliders before the syncers
+        # existed, the spin boxes have to catch up
+        self.spin_start_position.setValue(self.slider_start_position.value())
+        self.spin_end_position.setValue(self.slider_end_position.value())
+
         self.slider_start_position.installEventFilter(self)
         self.slider_end_position.installEventFilter(self)
 
@@ -308,19 +465,18 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.button_time_lapse_test.clicked.connect(self.time_lapse_test)
         self.button_time_lapse_prepare.clicked.connect(self.time_lapse_prepare)
         self.button_time_lapse_start.clicked.connect(self.time_lapse_start)
+        self.button_time_lapse_pause.clicked.connect(self.time_lapse_pause_or_resume)
         self.button_time_lapse_abort.clicked.connect(self.time_lapse_abort)
 
         self.time_lapse_status_timer = QTimer(self)
         self.time_lapse_status_timer.setInterval(100)
         self.time_lapse_status_timer.timeout.connect(self.update_time_lapse_status)
 
-        self.edit_camera_trigger.setText(config.get_camera_trigger())
-
-        # prepare log tab
-        self.button_log_clear.clicked.connect(self.log_clear)
+    def tab_changed(self):
+        if self.tab_widget.currentIndex() == TAB_TIME_LAPSE:
+            self.prepare_time_lapse_tab()
 
-        # last things
-        self.clear_all_uids()
+        self.update_ui_state()
 
     # override QMainWindow.closeEvent
     def closeEvent(self, event):
@@ -333,6 +489,12 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         else:
             self.close_in_progress = False
 
+        if self.log_file != None:
+            self.log_file.close()
+            self.log_file = None
+
+        self.calibration_store.close()
+
         # Without this, the quit event seems to not reach the main loop under OSX.
         QApplication.quit()
 
@@ -386,33 +548,36 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         sys.exit()
 
-    def update_ui_state(self, connection_state=None):
-        if connection_state == None:
-            # FIXME: need to call processEvents() otherwise get_connection_state() might return a wrong value
-            QApplication.processEvents()
-            connection_state = self.ipcon.get_connection_state()
-
+    def update_ui_state(self):
+        # all properties are collected first and only the ones that changed
+        # since the last call are applied to the widgets
+        ui = self.ui_state
+        connection_state = self.connection_state
         connected = connection_state == IPConnection.CONNECTION_STATE_CONNECTED
 
-        self.tab_widget.setTabEnabled(TAB_CALIBRATION, connected)
-        self.tab_widget.setTabEnabled(TAB_MOTION, connected and self.stepper_info != None)
-        self.tab_widget.setTabEnabled(TAB_TIME_LAPSE, connected and self.stepper_info != None)
+        ui.set(self.tab_widget, 'tab_enabled', connected, TAB_CALIBRATION)
+        ui.set(self.tab_widget, 'tab_enabled', connected and self.stepper_info != None, TAB_MOTION)
+        ui.set(self.tab_widget, 'tab_enabled', connected and self.stepper_info != None, TAB_TIME_LAPSE)
 
         # connection tab
-        self.button_connect.setEnabled(True)
-
-        if connection_state == IPConnection.CONNECTION_STATE_DISCONNECTED:
-            self.button_connect.setText('Connect')
-            self.edit_host.setEnabled(True)
-            self.spin_port.setEnabled(True)
+        ui.set_enabled(self.button_connect, not self.connecting)
+
+        if self.connecting:
+            ui.set_text(self.button_connect, 'Connecting ...')
+            ui.set_enabled(self.edit_host, False)
+            ui.set_enabled(self.spin_port, False)
+        elif connection_state == IPConnection.CONNECTION_STATE_DISCONNECTED:
+            ui.set_text(self.button_connect, 'Connect')
+            ui.set_enabled(self.edit_host, True)
+            ui.set_enabled(self.spin_port, True)
         elif connection_state == IPConnection.CONNECTION_STATE_CONNECTED:
-            self.button_connect.setText('Disconnect')
-            self.edit_host.setEnabled(False)
-            self.spin_port.setEnabled(False)
+            ui.set_text(self.button_connect, 'Disconnect')
+            ui.set_enabled(self.edit_host, False)
+            ui.set_enabled(self.spin_port, False)
         elif connection_state == IPConnection.CONNECTION_STATE_PENDING:
-            self.button_connect.setText('Abort Pending Automatic Reconnect')
-            self.edit_host.setEnabled(False)
-            self.spin_port.setEnabled(False)
+            ui.set_text(self.button_connect, 'Abort Pending Automatic Reconnect')
+            ui.set_enabled(self.edit_host, False)
+            ui.set_enabled(self.spin_port, False)
 
         # calibration tab
         stepper_uid = self.get_stepper_uid()
@@ -422,88 +587,108 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         forward_calibration_down = self.button_calibration_forward.isDown()
         backward_calibration_down = self.button_calibration_backward.isDown()
 
-        self.combo_stepper_uid.setEnabled(stepper_uid != None and not self.calibration_in_progress)
-        self.check_automatic_power_control.setEnabled(stepper_uid != None and not self.calibration_in_progress and not self.stepper_driving)
-        self.check_limit_switches.setEnabled(not self.calibration_in_progress and False) # FIXME
-        self.label_io4_uid_title.setVisible(limit_switches)
-        self.combo_io4_uid.setVisible(limit_switches)
-        self.combo_io4_uid.setEnabled(io4_uid != None and not self.calibration_in_progress)
-        self.button_calibration_start.setEnabled(stepper_uid != None and \
+        ui.set_enabled(self.combo_stepper_uid, stepper_uid != None and not self.calibration_in_progress)
+        ui.set_enabled(self.check_automatic_power_control, stepper_uid != None and not self.calibration_in_progress and not self.stepper_driving)
+        ui.set_enabled(self.check_limit_switches, not self.calibration_in_progress)
+        ui.set_visible(self.label_io4_uid_title, limit_switches)
+        ui.set_visible(self.combo_io4_uid, limit_switches)
+        ui.set_enabled(self.combo_io4_uid, io4_uid != None and not self.calibration_in_progress)
+        ui.set_enabled(self.button_calibration_start, stepper_uid != None and \
                                                  (not limit_switches or io4_uid != None) and \
                                                  (not self.calibration_in_progress or \
                                                   (self.temporary_minimum_position != None and \
                                                    self.temporary_maximum_position != None)) and \
                                                  not self.stepper_driving)
-        self.button_calibration_abort.setEnabled(self.calibration_in_progress and not self.stepper_driving)
-        self.label_calibration_help1.setVisible(stepper_uid != None)
-        self.line_calibration_motion.setVisible(self.calibration_in_progress)
-        self.button_calibration_forward.setVisible(self.calibration_in_progress)
-        self.button_calibration_forward.setEnabled((not self.stepper_driving or forward_calibration_down) and not backward_calibration_down)
-        self.button_calibration_backward.setVisible(self.calibration_in_progress)
-        self.button_calibration_backward.setEnabled((not self.stepper_driving or backward_calibration_down) and not forward_calibration_down)
-        self.button_calibration_set_minimum.setVisible(self.calibration_in_progress)
-        self.button_calibration_set_minimum.setEnabled(not self.stepper_driving)
-        self.button_calibration_set_maximum.setVisible(self.calibration_in_progress)
-        self.button_calibration_set_maximum.setEnabled(not self.stepper_driving)
-        self.label_calibration_help2.setVisible(self.calibration_in_progress)
+        ui.set_enabled(self.button_calibration_abort, self.calibration_in_progress and \
+                                                 (not self.stepper_driving or self.calibration_homing != None))
+        ui.set_visible(self.label_calibration_help1, stepper_uid != None)
+        ui.set_visible(self.line_calibration_motion, self.calibration_in_progress)
+        ui.set_visible(self.button_calibration_forward, self.calibration_in_progress)
+        ui.set_enabled(self.button_calibration_forward, (not self.stepper_driving or forward_calibration_down) and not backward_calibration_down)
+        ui.set_visible(self.button_calibration_backward, self.calibration_in_progress)
+        ui.set_enabled(self.button_calibration_backward, (not self.stepper_driving or backward_calibration_down) and not forward_calibration_down)
+        ui.set_visible(self.button_calibration_set_minimum, self.calibration_in_progress)
+        ui.set_enabled(self.button_calibration_set_minimum, not self.stepper_driving)
+        ui.set_visible(self.button_calibration_set_maximum, self.calibration_in_progress)
+        ui.set_enabled(self.button_calibration_set_maximum, not self.stepper_driving)
+        ui.set_visible(self.label_calibration_help2, self.calibration_in_progress)
+        ui.set_visible(self.button_calibration_home, self.calibration_in_progress)
+        ui.set_enabled(self.button_calibration_home, (isinstance(self.stepper, BrickSilentStepper) or self.limit_switches != None) and \
+                                                not self.stepper_driving)
 
         if self.calibration_in_progress:
-            self.button_calibration_start.setText('Apply')
-            self.label_calibration_help1.setText('Set the desired minimum and maximum position using the buttons below. Afterwards click the <b>Apply</b> button to use the new calibration.')
+            ui.set_text(self.button_calibration_start, 'Apply')
+            ui.set_text(self.label_calibration_help1, 'Set the desired minimum and maximum position using the buttons below. Afterwards click the <b>Apply</b> button to use the new calibration.')
         elif stepper_uid != None:
-            if stepper_uid not in self.stepper_infos:
-                self.button_calibration_start.setText('Start')
-                self.label_calibration_help1.setText('The selected Stepper Brick [<b>{0}</b>] is <b>not</b> calibrated. Click the <b>Start</b> button to calibrate the selected Stepper Brick.'.format(stepper_uid))
+            stepper_info = self.calibration_store.get(stepper_uid, self.calibration_profile)
+
+            if stepper_info == None:
+                ui.set_text(self.button_calibration_start, 'Start')
+                ui.set_text(self.label_calibration_help1, 'The selected Stepper Brick [<b>{0}</b>] is <b>not</b> calibrated. Click the <b>Start</b> button to calibrate the selected Stepper Brick.'.format(stepper_uid))
             else:
-                self.button_calibration_start.setText('Start')
-                self.label_calibration_help1.setText('The selected Stepper Brick [<b>{0}</b>] is calibrated. It has <b>{1}</b> steps of motion range. If the cart was manually moved since the last calibration, then click the <b>Start</b> button to recalibrate the selected Stepper Brick.'.format(stepper_uid, abs(self.stepper_infos[stepper_uid].motion_range)))
+                ui.set_text(self.button_calibration_start, 'Start')
+                ui.set_text(self.label_calibration_help1, 'The selected Stepper Brick [<b>{0}</b>] is calibrated. It has <b>{1}</b> steps of motion range. If the cart was manually moved since the last calibration, then click the <b>Start</b> button to recalibrate the selected Stepper Brick.'.format(stepper_uid, abs(stepper_info.motion_range)))
         else:
-            self.button_calibration_start.setText('Start')
-            self.label_calibration_help1.setText('')
+            ui.set_text(self.button_calibration_start, 'Start')
+            ui.set_text(self.label_calibration_help1, '')
 
         if self.temporary_minimum_position == None:
-            self.button_calibration_set_minimum.setText('Set Minimum')
+            ui.set_text(self.button_calibration_set_minimum, 'Set Minimum')
         else:
-            self.button_calibration_set_minimum.setText('Set Minimum (Again)')
+            ui.set_text(self.button_calibration_set_minimum, 'Set Minimum (Again)')
 
         if self.temporary_maximum_position == None:
-            self.button_calibration_set_maximum.setText('Set Maximum')
+            ui.set_text(self.button_calibration_set_maximum, 'Set Maximum')
         else:
-            self.button_calibration_set_maximum.setText('Set Maximum (Again)')
+            ui.set_text(self.button_calibration_set_maximum, 'Set Maximum (Again)')
 
         # motion tab
         forward_motion_down = self.button_motion_forward.isDown()
         backward_motion_down = self.button_motion_backward.isDown()
         any_motion_down = forward_motion_down or backward_motion_down
 
-        self.slider_target_position.setEnabled(not self.stepper_driving and not self.time_lapse_in_progress)
-        self.spin_target_position.setEnabled(not self.stepper_driving and not self.time_lapse_in_progress)
-        self.button_motion_forward.setEnabled((not self.stepper_driving or forward_motion_down) and not backward_motion_down and not self.time_lapse_in_progress)
-        self.button_motion_backward.setEnabled((not self.stepper_driving or backward_motion_down) and not forward_motion_down and not self.time_lapse_in_progress)
-        self.button_motion_stop.setEnabled(self.stepper_driving and not any_motion_down and not self.time_lapse_in_progress)
-        self.button_motion_full_break.setEnabled(self.stepper_driving and not any_motion_down and not self.time_lapse_in_progress)
-        self.slider_velocity.setEnabled(not self.stepper_driving and not self.time_lapse_in_progress)
-        self.spin_velocity.setEnabled(not self.stepper_driving and not self.time_lapse_in_progress)
-        self.slider_acceleration.setEnabled(not self.stepper_driving and not self.time_lapse_in_progress)
-        self.spin_acceleration.setEnabled(not self.stepper_driving and not self.time_lapse_in_progress)
-        self.slider_deceleration.setEnabled(not self.stepper_driving and not self.time_lapse_in_progress)
-        self.spin_deceleration.setEnabled(not self.stepper_driving and not self.time_lapse_in_progress)
+        target_position_enabled = (not self.stepper_driving or self.target_position_driving) and not self.time_lapse_in_progress
+
+        ui.set_enabled(self.slider_target_position, target_position_enabled)
+        ui.set_enabled(self.spin_target_position, target_position_enabled)
+        ui.set_enabled(self.button_motion_forward, (not self.stepper_driving or forward_motion_down) and not backward_motion_down and not self.time_lapse_in_progress)
+        ui.set_enabled(self.button_motion_backward, (not self.stepper_driving or backward_motion_down) and not forward_motion_down and not self.time_lapse_in_progress)
+        ui.set_enabled(self.button_motion_stop, self.stepper_driving and not any_motion_down and not self.time_lapse_in_progress)
+        ui.set_enabled(self.button_motion_full_break, self.stepper_driving and not any_motion_down and not self.time_lapse_in_progress)
+        ui.set_enabled(self.slider_velocity, not self.stepper_driving and not self.time_lapse_in_progress)
+        ui.set_enabled(self.spin_velocity, not self.stepper_driving and not self.time_lapse_in_progress)
+        ui.set_enabled(self.slider_acceleration, not self.stepper_driving and not self.time_lapse_in_progress)
+        ui.set_enabled(self.spin_acceleration, not self.stepper_driving and not self.time_lapse_in_progress)
+        ui.set_enabled(self.slider_deceleration, not self.stepper_driving and not self.time_lapse_in_progress)
+        ui.set_enabled(self.spin_deceleration, not self.stepper_driving and not self.time_lapse_in_progress)
 
         # time lapse tab
-        self.edit_camera_trigger.setEnabled(not self.test_in_progress and not self.time_lapse_in_progress)
-        self.button_time_lapse_test.setEnabled(not self.test_in_progress and not self.time_lapse_in_progress)
-        self.spin_image_count.setEnabled(not self.time_lapse_in_progress)
-        self.spin_initial_delay.setEnabled(not self.time_lapse_in_progress)
-        self.spin_interval.setEnabled(not self.time_lapse_in_progress)
-        self.slider_start_position.setEnabled(not self.time_lapse_in_progress)
-        self.spin_start_position.setEnabled(not self.time_lapse_in_progress)
-        self.slider_end_position.setEnabled(not self.time_lapse_in_progress)
-        self.spin_end_position.setEnabled(not self.time_lapse_in_progress)
-        self.button_time_lapse_prepare.setEnabled(not self.test_in_progress and not self.stepper_driving and not self.time_lapse_in_progress)
-        self.button_time_lapse_start.setEnabled(not self.test_in_progress and not self.stepper_driving and not self.time_lapse_in_progress)
-        self.button_time_lapse_abort.setEnabled(not self.test_in_progress and self.time_lapse_in_progress)
-
-        self.update_time_lapse_status()
+        ui.set_enabled(self.edit_camera_trigger, not self.test_in_progress and not self.time_lapse_in_progress)
+        ui.set_enabled(self.button_time_lapse_test, not self.test_in_progress and not self.time_lapse_in_progress)
+        ui.set_enabled(self.spin_image_count, not self.time_lapse_in_progress)
+        ui.set_enabled(self.spin_initial_delay, not self.time_lapse_in_progress)
+        ui.set_enabled(self.spin_interval, not self.time_lapse_in_progress)
+        ui.set_enabled(self.spin_exposure_time, not self.time_lapse_in_progress)
+        ui.set_enabled(self.combo_motion_mode, not self.time_lapse_in_progress)
+        ui.set_enabled(self.combo_interpolation, not self.time_lapse_in_progress)
+        ui.set_enabled(self.edit_keyframes, not self.time_lapse_in_progress)
+        ui.set_enabled(self.slider_start_position, not self.time_lapse_in_progress)
+        ui.set_enabled(self.spin_start_position, not self.time_lapse_in_progress)
+        ui.set_enabled(self.slider_end_position, not self.time_lapse_in_progress)
+        ui.set_enabled(self.spin_end_position, not self.time_lapse_in_progress)
+        ui.set_enabled(self.button_time_lapse_prepare, not self.test_in_progress and not self.stepper_driving and not self.time_lapse_in_progress)
+        ui.set_enabled(self.button_time_lapse_start, not self.test_in_progress and not self.stepper_driving and not self.time_lapse_in_progress)
+        ui.set_enabled(self.button_time_lapse_pause, self.time_lapse_in_progress and not self.first_time_lapse_trigger and not self.time_lapse_continuous)
+        ui.set_enabled(self.button_time_lapse_abort, not self.test_in_progress and self.time_lapse_in_progress)
+
+        if self.time_lapse_schedule != None and self.time_lapse_schedule.paused:
+            ui.set_text(self.button_time_lapse_pause, 'Resume')
+        else:
+            ui.set_text(self.button_time_lapse_pause, 'Pause')
+
+        self.update_time_lapse_status(apply=False)
+
+        ui.apply()
 
     def get_stepper_uid(self):
         index = self.combo_stepper_uid.currentIndex()
@@ -523,6 +708,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     def clear_all_uids(self):
         self.devices = {}
+        self.unconfirmed_uids = set()
 
         self.combo_stepper_uid.clear()
         self.combo_stepper_uid.addItem(NO_STEPPER_BRICK_FOUND)
@@ -543,6 +729,20 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                not self.full_break_in_progress and \
                (ignore_time_lapse_in_progress or not self.time_lapse_in_progress)
 
+    def limit_switch_blocks_motion(self, direction):
+        # direction is the sign of the motion in stepper steps
+        if self.limit_switches == None:
+            return False
+
+        mask = self.limit_switches.get_blocking_mask(direction)
+
+        if mask == 0:
+            return False
+
+        self.log_append('Not moving further into the closed {0} limit switch'.format(get_switch_names(mask)))
+
+        return True
+
     def prepare_stepper_motion(self):
         if self.stepper_driving:
             return
@@ -560,6 +760,14 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         self.stepper_driving = False
 
+        if self.target_position_driving:
+            self.target_position_driving = False
+
+            coalescer = self.target_position_coalescer
+            self.log_append('Target position: {0} UI events, {1} commands sent'
+                            .format(coalescer.event_count, coalescer.command_count))
+            coalescer.reset_statistics()
+
         if self.stepper != None and self.check_automatic_power_control.isChecked():
             self.stepper.disable()
             self.stepper_enabled = False
@@ -569,9 +777,16 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.speed_ramping_changed()
 
         if self.stepper != None and self.stepper_info != None:
-            self.stepper_info.current_position = self.stepper.get_current_position() # FIXME: blocking getter
+            self.stepper_info.current_position = self.position_tracker.get_current_position() # FIXME: blocking getter
+            self.calibration_store.put(self.stepper_info, self.calibration_profile)
 
-        if self.time_lapse_in_progress:
+        if self.time_lapse_move_start_time != None:
+            self.time_lapse_move_duration = get_timestamp() - self.time_lapse_move_start_time
+            self.time_lapse_move_start_time = None
+
+        # in continuous mode the cart only stops for the first image, all
+        # other images are triggered while the cart is moving
+        if self.time_lapse_in_progress and (not self.time_lapse_continuous or self.first_time_lapse_trigger):
             self.time_lapse_trigger()
 
         if self.time_lapse_in_preparation:
@@ -584,17 +799,13 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     def position_stepper_to_display(self, position):
         if self.stepper_info != None:
-            # FIXME: handle out-of-motion-range positions?
-            return abs(position - self.stepper_info.minimum_position)
+            return position_stepper_to_display(self.stepper_info, position)
 
         return 0
 
     def position_display_to_stepper(self, position):
         if self.stepper_info != None:
-            if self.stepper_reversed:
-                return self.stepper_info.minimum_position - position
-            else:
-                return self.stepper_info.minimum_position + position
+            return position_display_to_stepper(self.stepper_info, position)
 
         return 0
 
@@ -606,12 +817,12 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         if connection_state == IPConnection.CONNECTION_STATE_DISCONNECTED:
             try:
                 host, port = self.edit_host.text(), self.spin_port.value()
-                self.button_connect.setDisabled(True)
-                self.button_connect.setText('Connecting ...')
+                self.connecting = True
+                self.update_ui_state()
                 self.ipcon.connect(self.edit_host.text(), self.spin_port.value())
             except Exception as e:
-                self.button_connect.setDisabled(False)
-                self.button_connect.setText('Connect')
+                self.connecting = False
+                self.update_ui_state()
 
                 QMessageBox.critical(self, 'Connection',
                                      'Could not connect. Please check host, check port and ensure that Brick Daemon is running.')
@@ -619,9 +830,15 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.disconnect(True)
 
     def disconnect(self, ask_user):
-        config.set_stepper_infos(self.stepper_infos.values())
+        if self.stepper_info != None:
+            self.calibration_store.put(self.stepper_info, self.calibration_profile)
+
         config.set_camera_trigger(self.edit_camera_trigger.text())
 
+        # devices that were added or removed since the connect
+        if self.connection_state == IPConnection.CONNECTION_STATE_CONNECTED:
+            self.save_device_cache()
+
         if self.stepper != None and (self.stepper_enabled or self.time_lapse_in_progress) and not self.disconnect_in_progress:
             if ask_user:
                 if self.time_lapse_in_progress:
@@ -657,6 +874,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         except:
             pass
 
+        self.connection_state = IPConnection.CONNECTION_STATE_DISCONNECTED
+
         if self.disconnect_in_progress:
             self.disconnect_in_progress = False
 
@@ -679,33 +898,31 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.stepper.register_callback(self.stepper.CALLBACK_NEW_STATE, None)
 
         self.stepper = None
+        self.position_tracker = None
         self.stepper_info = None
         self.stepper_reversed = False
         uid = self.get_stepper_uid()
 
-        if uid != None:
-            self.stepper = BrickStepper(uid, self.ipcon)
-            self.calibration_velocity = 2000
-
-            identity = self.stepper.get_identity()
+        # a cached stepper is only opened once the enumeration confirmed it,
+        # the first getter of a stepper that is gone would block the GUI
+        # until the request times out
+        if uid != None and uid not in self.unconfirmed_uids:
+            self.stepper, self.calibration_velocity = create_stepper(uid, self.ipcon, self.devices[uid][1])
 
-            if identity.device_identifier == BrickSilentStepper.DEVICE_IDENTIFIER:
-                self.stepper = BrickSilentStepper(uid, self.ipcon)
-                self.calibration_velocity = 64000
+            try:
+                self.position_tracker = PositionTracker(self.stepper)
+            except Error:
+                # a cached device that is gone, the enumeration removes it
+                self.log_append('Stepper Brick [{0}] is not reachable'.format(uid))
+                self.stepper = None
 
+        if self.stepper != None:
             # The constant is read from class instance rather from the
             # class itself to support both Stepper and Silent Stepper Bricks.
             self.stepper.register_callback(self.stepper.CALLBACK_NEW_STATE,
                                            self.qtcb_stepper_new_state.emit)
 
-            self.stepper.set_motor_current(MOTOR_CURRENT)
-
-            # The follwing functions are only available in the Stepper Brick
-            # and not in the Silent Stepper Brick.
-            if hasattr(self.stepper, 'set_sync_rect'):
-                self.stepper.set_sync_rect(SYNC_RECT)
-            if hasattr(self.stepper, 'set_decay'):
-                self.stepper.set_decay(DECAY)
+            configure_stepper(self.stepper)
 
             self.calibration_changed()
             self.velocity_changed()
@@ -714,7 +931,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             if self.stepper.is_enabled():
                 self.check_automatic_power_control.setChecked(False)
 
-        self.update_ui_state()
+        self.limit_switches_changed()
 
     def automatic_power_control_changed(self):
         if self.stepper != None:
@@ -732,7 +949,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             uid = self.get_stepper_uid()
 
             if uid != None:
-                self.stepper_infos.pop(uid, None)
+                self.calibration_store.remove(uid, self.calibration_profile)
                 self.stepper_info = None
 
             self.calibration_in_progress = True
@@ -747,11 +964,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 stepper_info.uid = uid
                 stepper_info.minimum_position = self.temporary_minimum_position
                 stepper_info.maximum_position = self.temporary_maximum_position
-                stepper_info.current_position = self.stepper.get_current_position() # FIXME: blocking getter
-
-                self.stepper_infos[uid] = stepper_info
+                stepper_info.current_position = self.position_tracker.get_current_position() # FIXME: blocking getter
 
-                config.set_stepper_infos(self.stepper_infos.values())
+                self.calibration_store.put(stepper_info, self.calibration_profile)
 
             self.calibration_abort()
             self.calibration_changed()
@@ -759,6 +974,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.update_ui_state()
 
     def calibration_abort(self):
+        if self.calibration_homing != None:
+            # calibration_homing_done finishes the abort
+            self.calibration_homing.abort()
+            return
+
         if self.calibration_in_progress:
             self.calibration_in_progress = False
             self.temporary_minimum_position = None
@@ -770,7 +990,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.update_ui_state()
 
     def calibration_forward_pressed(self):
-        if self.stepper != None and self.calibration_in_progress:
+        if self.stepper != None and self.calibration_in_progress and not self.limit_switch_blocks_motion(1):
             self.stepper.set_max_velocity(self.calibration_velocity)
             self.stepper.set_speed_ramping(CALIBRATION_ACCELERATION, CALIBRATION_DECELERATION)
             self.prepare_stepper_motion()
@@ -780,12 +1000,12 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     def calibration_forward_released(self):
         if self.stepper != None and self.calibration_in_progress:
-            self.stepper.stop()
+            self.position_tracker.stop()
 
         self.update_ui_state()
 
     def calibration_backward_pressed(self):
-        if self.stepper != None and self.calibration_in_progress:
+        if self.stepper != None and self.calibration_in_progress and not self.limit_switch_blocks_motion(-1):
             self.stepper.set_max_velocity(self.calibration_velocity)
             self.stepper.set_speed_ramping(CALIBRATION_ACCELERATION, CALIBRATION_DECELERATION)
             self.prepare_stepper_motion()
@@ -795,33 +1015,118 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     def calibration_backward_released(self):
         if self.stepper != None and self.calibration_in_progress:
-            self.stepper.stop()
+            self.position_tracker.stop()
 
         self.update_ui_state()
 
     def calibration_set_minimum(self):
         if self.stepper != None and self.calibration_in_progress and not self.stepper_driving:
-            self.temporary_minimum_position = self.stepper.get_current_position() # FIXME: blocking getter
+            self.temporary_minimum_position = self.position_tracker.get_current_position() # FIXME: blocking getter
             self.update_ui_state()
 
     def calibration_set_maximum(self):
         if self.stepper != None and self.calibration_in_progress and not self.stepper_driving:
-            self.temporary_maximum_position = self.stepper.get_current_position() # FIXME: blocking getter
+            self.temporary_maximum_position = self.position_tracker.get_current_position() # FIXME: blocking getter
             self.update_ui_state()
 
+    def limit_switches_changed(self):
+        if self.limit_switches != None:
+            try:
+                self.limit_switches.stop()
+            except Error:
+                pass
+
+            self.limit_switches = None
+            self.io4 = None
+
+        io4_uid = self.get_io4_uid()
+
+        if self.check_limit_switches.isChecked() and io4_uid != None and io4_uid not in self.unconfirmed_uids and \
+           self.position_tracker != None:
+            from starter_kit_camera_slider_demo.tinkerforge.bricklet_io4 import BrickletIO4
+
+            self.io4 = BrickletIO4(io4_uid, self.ipcon)
+            # the interrupt callback brakes the stepper from the callback
+            # thread, the GUI is only told afterwards
+            self.limit_switches = LimitSwitches(self.io4, self.position_tracker, self.qtcb_limit_switch_triggered.emit)
+
+            try:
+                self.limit_switches.start()
+            except Error as e:
+                self.log_append('Could not enable limit switches of IO-4 Bricklet [{0}]: {1}'.format(io4_uid, e.description))
+
+                try:
+                    self.limit_switches.stop()
+                except Error:
+                    pass
+
+                self.limit_switches = None
+                self.io4 = None
+
+        self.update_ui_state()
+
+    def limit_switch_triggered(self, mask, latency):
+        self.log_append('Limit switch {0} triggered, full brake sent {1:.2f} ms after the interrupt arrived'
+                        .format(get_switch_names(mask), latency * 1000))
+
+        if self.calibration_homing == None and self.time_lapse_in_progress:
+            self.time_lapse_abort()
+
+    def calibration_home(self):
+        if self.stepper == None or not self.calibration_in_progress or self.stepper_driving:
+            return
+
+        if self.limit_switches != None:
+            self.calibration_homing = LimitSwitchHoming(self.stepper, self.position_tracker, self.limit_switches,
+                                                        self.calibration_velocity)
+        elif isinstance(self.stepper, BrickSilentStepper):
+            self.calibration_homing = StallGuardHoming(self.stepper, self.position_tracker, self.calibration_velocity)
+        else:
+            return
+
+        self.prepare_stepper_motion()
+
+        def home(homing):
+            try:
+                minimum_position, maximum_position = homing.run()
+            except (HomingError, Error) as e:
+                self.qtcb_calibration_homing_done.emit(None, str(e))
+            else:
+                self.qtcb_calibration_homing_done.emit((minimum_position, maximum_position), '')
+
+        thread = threading.Thread(target=home, args=(self.calibration_homing,))
+        thread.daemon = True
+        thread.start()
+
+        self.update_ui_state()
+
+    def calibration_homing_done(self, positions, message):
+        aborted = self.calibration_homing.aborted
+        self.calibration_homing = None
+
+        if positions != None:
+            self.temporary_minimum_position, self.temporary_maximum_position = positions
+            self.log_append('Found rail ends at {0} and {1}'.format(*positions))
+
+        self.stepper_motion_stopped()
+
+        if aborted:
+            self.calibration_abort()
+        elif positions == None:
+            QMessageBox.critical(self, 'Calibration', 'Could not find the rail ends: {0}'.format(message))
+
     def calibration_changed(self):
         self.stepper_info = None
         self.stepper_reversed = False
         uid = self.get_stepper_uid()
 
-        if uid != None and uid in self.stepper_infos:
-            self.stepper_info = self.stepper_infos[uid]
-            self.stepper_reversed = self.stepper_info.maximum_position < self.stepper_info.minimum_position
-            current_position = self.stepper.get_current_position() # FIXME: blocking getter
-            current_position_offset = current_position - self.stepper_info.current_position
-            self.stepper_info.minimum_position += current_position_offset
-            self.stepper_info.maximum_position += current_position_offset
-            self.stepper_info.current_position = current_position
+        if uid != None:
+            self.stepper_info = self.calibration_store.get(uid, self.calibration_profile)
+
+        if self.stepper_info != None:
+            self.stepper_reversed = is_stepper_reversed(self.stepper_info)
+            update_stepper_info(self.stepper_info, self.position_tracker.get_current_position()) # FIXME: blocking getter
+            self.calibration_store.put(self.stepper_info, self.calibration_profile)
 
             # motion tab
             self.slider_current_position.setMaximum(self.stepper_info.motion_range)
@@ -834,7 +1139,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.spin_target_position.setMaximum(self.stepper_info.motion_range)
             self.label_target_position_unit.setText('of {0}'.format(self.stepper_info.motion_range))
 
-            current_position = self.stepper.get_current_position() # FIXME: blocking getter
+            current_position = self.position_tracker.get_current_position() # FIXME: blocking getter
             self.slider_target_position.setValue(self.position_stepper_to_display(current_position))
 
             self.target_position_syncer.callback_blocked = False
@@ -861,35 +1166,56 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     def update_current_position(self):
         if self.stepper != None and self.stepper_info != None and self.tab_widget.currentIndex() == TAB_MOTION:
-            current_position = self.stepper.get_current_position() # FIXME: blocking getter
+            current_position = self.position_tracker.get_current_position() # FIXME: blocking getter
             self.slider_current_position.setValue(self.position_stepper_to_display(current_position))
 
     def target_position_changed(self):
-        if self.stepper_ready_for_motion():
-            current_position = self.stepper.get_current_position() # FIXME: blocking getter
-            target_position = self.position_display_to_stepper(self.slider_target_position.value())
+        self.target_position_coalescer.submit(self.slider_target_position.value())
+        self.update_ui_state()
 
-            if current_position != target_position:
-                self.prepare_stepper_motion()
-                self.stepper.set_target_position(target_position)
+    def send_target_position(self, value):
+        # a motion started by the target position can be given a new target
+        # while the cart is still moving, the target is sent as absolute
+        # position, so it does not depend on the current position
+        retarget = self.target_position_driving and self.stepper_driving and self.stepper != None and \
+                   not self.disconnect_in_progress and not self.full_break_in_progress
+
+        if not retarget and not self.stepper_ready_for_motion():
+            return False
+
+        target_position = self.position_display_to_stepper(value)
+
+        cached_position = self.position_tracker.get_cached_position()
+
+        # the stepper is standing still, the position it reported last is exact
+        if not retarget and cached_position == target_position:
+            return False
+
+        if self.limit_switch_blocks_motion(target_position - cached_position):
+            return False
 
+        self.prepare_stepper_motion()
+        self.target_position_driving = True
+        self.position_tracker.set_target_position(target_position)
         self.update_ui_state()
 
+        return True
+
     def motion_forward_pressed(self):
         if self.stepper_ready_for_motion():
             uid = self.get_stepper_uid()
 
             if uid != None:
-                current_position = self.stepper.get_current_position() # FIXME: blocking getter
+                current_position = self.position_tracker.get_current_position() # FIXME: blocking getter
 
                 if self.stepper_reversed:
-                    target_position = self.stepper_infos[uid].minimum_position
+                    target_position = self.stepper_info.minimum_position
                 else:
-                    target_position = self.stepper_infos[uid].maximum_position
+                    target_position = self.stepper_info.maximum_position
 
-                if current_position != target_position:
+                if current_position != target_position and not self.limit_switch_blocks_motion(target_position - current_position):
                     self.prepare_stepper_motion()
-                    self.stepper.set_target_position(target_position)
+                    self.position_tracker.set_target_position(target_position)
 
         self.update_ui_state()
 
@@ -901,16 +1227,16 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             uid = self.get_stepper_uid()
 
             if uid != None:
-                current_position = self.stepper.get_current_position() # FIXME: blocking getter
+                current_position = self.position_tracker.get_current_position() # FIXME: blocking getter
 
                 if self.stepper_reversed:
-                    target_position = self.stepper_infos[uid].maximum_position
+                    target_position = self.stepper_info.maximum_position
                 else:
-                    target_position = self.stepper_infos[uid].minimum_position
+                    target_position = self.stepper_info.minimum_position
 
-                if current_position != target_position:
+                if current_position != target_position and not self.limit_switch_blocks_motion(target_position - current_position):
                     self.prepare_stepper_motion()
-                    self.stepper.set_target_position(target_position)
+                    self.position_tracker.set_target_position(target_position)
 
         self.update_ui_state()
 
@@ -918,18 +1244,24 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.motion_stop()
 
     def motion_stop(self):
+        self.target_position_coalescer.cancel()
+
         if self.stepper != None and self.stepper_driving:
-            self.stepper.stop()
+            self.position_tracker.stop()
 
         self.update_ui_state()
 
     def motion_full_break(self):
-        if self.stepper != None and not self.full_break_in_progress:
+        self.target_position_coalescer.cancel()
+
+        if self.calibration_homing != None:
+            self.calibration_homing.abort()
+        elif self.stepper != None and not self.full_break_in_progress:
             self.full_break_in_progress = True
             acceleration = self.slider_acceleration.value()
 
             self.stepper.set_speed_ramping(acceleration, FULL_BREAK_DECELERATION)
-            self.stepper.stop()
+            self.position_tracker.stop()
 
         self.update_ui_state()
 
@@ -946,112 +1278,264 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     ### time lapse tab ####################################################
 
-    def update_time_lapse_status(self):
+    def update_time_lapse_status(self, apply=True):
         if self.test_in_progress:
-            self.label_time_lapse_status.setText('Testing camera trigger, see <b>Log</b> tab for result.')
+            self.ui_state.set_text(self.label_time_lapse_status, 'Testing camera trigger, see <b>Log</b> tab for result.')
         elif self.time_lapse_in_preparation:
-            self.label_time_lapse_status.setText('Moving cart to start position.')
+            self.ui_state.set_text(self.label_time_lapse_status, 'Moving cart to start position.')
         elif self.time_lapse_in_progress:
+            schedule = self.time_lapse_schedule
+
             if self.first_time_lapse_trigger:
                 initial_delay = self.spin_initial_delay.value()
 
                 if initial_delay == 0:
-                    self.label_time_lapse_status.setText('Moving cart to start position. Capturing image <b>1</b> of <b>{0}</b> immediately afterwards.'.format(self.image_count))
+                    self.ui_state.set_text(self.label_time_lapse_status, 'Moving cart to start position. Capturing image <b>1</b> of <b>{0}</b> immediately afterwards.'.format(schedule.image_count))
                 else:
                     if initial_delay == 1:
                         suffix = ''
                     else:
                         suffix = 's'
 
-                    self.label_time_lapse_status.setText('Moving cart to start position. Capturing image <b>1</b> of <b>{0}</b> afterwards with a delay of <b>{1}</b> second{2}.'.format(self.image_count, initial_delay, suffix))
-            elif self.remaining_image_count == 0:
-                self.label_time_lapse_status.setText('<b>{0}</b> images have been captured.'.format(self.image_count))
+                    self.ui_state.set_text(self.label_time_lapse_status, 'Moving cart to start position. Capturing image <b>1</b> of <b>{0}</b> afterwards with a delay of <b>{1}</b> second{2}.'.format(schedule.image_count, initial_delay, suffix))
+            elif schedule.done:
+                self.ui_state.set_text(self.label_time_lapse_status, '<b>{0}</b> images have been captured.'.format(schedule.image_count))
+            elif schedule.paused:
+                self.ui_state.set_text(self.label_time_lapse_status, 'Time lapse paused before capturing image <b>{0}</b> of <b>{1}</b>. Click the <b>Resume</b> button to continue the time lapse process.'.format(schedule.next_index + 1, schedule.image_count))
             else:
-                remaining_time = max(self.next_trigger_time - get_timestamp(), 0.0)
-                image_index = self.image_count - self.remaining_image_count + 1
-                self.label_time_lapse_status.setText('Capturing image <b>%d</b> of <b>%d</b> in <b>%.1f</b> seconds. Click the <b>Abort</b> button to abort the time lapse process.' % (image_index, self.image_count, remaining_time))
+                remaining_time = schedule.get_remaining_time()
+                self.ui_state.set_text(self.label_time_lapse_status, 'Capturing image <b>%d</b> of <b>%d</b> in <b>%.1f</b> seconds. Click the <b>Abort</b> button to abort the time lapse process.' % (schedule.next_index + 1, schedule.image_count, remaining_time))
         else:
-            self.label_time_lapse_status.setText('Click the <b>Test</b> button to test the camera trigger (result on <b>Log</b> tab). Click the <b>Prepare</b> button to move the cart to the start position. Click the <b>Start</b> button to start the time lapse process. If the cart is not in the start position yet, it will be moved there first.')
+            self.ui_state.set_text(self.label_time_lapse_status, 'Click the <b>Test</b> button to test the camera trigger (result on <b>Log</b> tab). Click the <b>Prepare</b> button to move the cart to the start position. Click the <b>Start</b> button to start the time lapse process. If the cart is not in the start position yet, it will be moved there first.')
+
+        if apply:
+            self.ui_state.apply()
 
     def time_lapse_done(self):
         if self.time_lapse_in_progress:
             self.log_append('Time lapse done')
 
+            count, mean_lateness, p50_lateness, p99_lateness, max_lateness = self.trigger_worker.statistics.get_summary()
+
+            if count > 0:
+                self.log_append('Trigger lateness for {0} images: {1:.2f} ms mean, {2:.2f} ms p50, {3:.2f} ms p99, {4:.2f} ms max'
+                                .format(count, mean_lateness * 1000, p50_lateness * 1000, p99_lateness * 1000, max_lateness * 1000))
+
+            if self.time_lapse_saved_count > 0:
+                self.log_append('Moving during camera write-out saved {0:.1f} seconds in total, {1:.0f} ms per image'
+                                .format(self.time_lapse_saved_time, self.time_lapse_saved_time * 1000 / self.time_lapse_saved_count))
+
+            if self.time_lapse_telemetry != None:
+                count, failure_count, p50_lateness, p99_lateness, p50_duration, p99_duration = self.time_lapse_telemetry.get_summary()
+
+                self.log_append('Camera trigger for {0} images: {1} failed, {2:.1f} ms p50 and {3:.1f} ms p99 lateness, {4:.1f} ms p50 and {5:.1f} ms p99 duration'
+                                .format(count, failure_count, p50_lateness * 1000, p99_lateness * 1000, p50_duration * 1000, p99_duration * 1000))
+
+            ui = self.ui_state
+
+            if ui.apply_count > 0:
+                self.log_append('UI updates during time lapse: {0} updates in {1:.1f} ms, {2} of {3} widget properties changed, about {4:.1f} ms of redundant setter calls skipped'
+                                .format(ui.apply_count, ui.apply_duration * 1000, ui.change_count, ui.property_count, ui.get_saved_duration() * 1000))
+
             self.time_lapse_status_timer.stop()
             self.time_lapse_in_progress = False
+            self.time_lapse_continuous_done()
+            self.time_lapse_camera_close()
+            self.time_lapse_telemetry_close()
             self.update_ui_state()
 
-    def time_lapse_next(self):
-        if self.stepper_ready_for_motion(ignore_time_lapse_in_progress=True) and self.time_lapse_in_progress and self.remaining_image_count > 0:
-            self.next_trigger_position += self.steps_per_interval
+    def time_lapse_continuous_move(self, time_lapse_id):
+        schedule = self.time_lapse_schedule
 
-            if self.remaining_image_count == 1:
-                target_position = self.slider_end_position.value()
-            else:
-                target_position = int(round(self.next_trigger_position))
+        if self.stepper_ready_for_motion(ignore_time_lapse_in_progress=True) and self.time_lapse_in_progress and \
+           time_lapse_id == self.time_lapse_id:
+            target_position = schedule.get_position(schedule.image_count - 1)
 
-            if target_position >= 0 and target_position <= self.stepper_info.motion_range:
-                current_position = self.stepper.get_current_position() # FIXME: blocking getter
-                target_position = self.position_display_to_stepper(target_position)
+            if self.limit_switch_blocks_motion(target_position - self.position_tracker.get_cached_position()):
+                self.time_lapse_abort()
+                return
 
-                if current_position != target_position:
-                    self.prepare_stepper_motion()
-                    self.stepper.set_target_position(target_position)
-                else:
-                    self.time_lapse_trigger()
+            self.prepare_stepper_motion()
+            self.position_tracker.set_target_position(target_position)
+
+    def time_lapse_continuous_done(self):
+        if self.time_lapse_continuous:
+            self.time_lapse_continuous = False
+
+            # restore the motion tab velocity that was overridden for the
+            # continuous motion
+            if self.stepper != None:
+                self.stepper.set_max_velocity(self.slider_velocity.value())
+
+    def time_lapse_camera_close(self):
+        if self.time_lapse_camera != None:
+            # closing waits for a capture that might still be in progress,
+            # don't block the GUI for this
+            thread = threading.Thread(target=self.time_lapse_camera.close)
+            thread.daemon = True
+            thread.start()
+
+            self.time_lapse_camera = None
+
+    def time_lapse_exposing(self, generation, exposure_time):
+        def exposure_done():
+            if self.time_lapse_in_progress and self.trigger_worker.is_current(generation):
+                self.time_lapse_next()
+
+        QTimer.singleShot(int(round(exposure_time * 1000)), exposure_done)
+
+    def time_lapse_telemetry_close(self):
+        if self.time_lapse_telemetry != None:
+            self.time_lapse_telemetry.close()
+            self.time_lapse_telemetry = None
+
+    def time_lapse_next(self):
+        schedule = self.time_lapse_schedule
+
+        if self.stepper_ready_for_motion(ignore_time_lapse_in_progress=True) and self.time_lapse_in_progress and not schedule.done:
+            current_position = self.position_tracker.get_current_position() # FIXME: blocking getter
+            target_position = schedule.get_position(schedule.next_index)
+
+            if self.limit_switch_blocks_motion(target_position - current_position):
+                self.time_lapse_abort()
+            elif current_position != target_position:
+                self.prepare_stepper_motion()
+                self.time_lapse_move_start_time = get_timestamp()
+                self.position_tracker.set_target_position(target_position)
             else:
-                self.time_lapse_done()
+                self.time_lapse_move_duration = 0.0
+                self.time_lapse_trigger()
 
     def time_lapse_trigger(self):
-        if self.time_lapse_in_progress and self.remaining_image_count > 0:
+        schedule = self.time_lapse_schedule
+
+        if self.time_lapse_in_progress and not schedule.done:
             if self.first_time_lapse_trigger:
                 self.first_time_lapse_trigger = False
-                self.next_trigger_time = get_timestamp() + self.spin_initial_delay.value()
+                schedule.start()
 
-            def trigger(time_lapse_id, trigger_thread_id, camera_trigger):
-                if self.time_lapse_in_progress and self.remaining_image_count > 0:
-                    delay = min(self.next_trigger_time - get_timestamp(), 10.0)
+                if self.time_lapse_telemetry != None:
+                    self.time_lapse_telemetry.start(schedule.start_time)
 
-                    while delay > 0:
-                        time.sleep(delay)
+                if self.time_lapse_continuous:
+                    self.stepper.set_max_velocity(max(int(round(self.time_lapse_velocity)), 1))
 
-                        if not self.time_lapse_in_progress or \
-                           time_lapse_id != self.time_lapse_id or \
-                           trigger_thread_id != self.trigger_thread_id:
-                            return
+                    # start the motion early by half the acceleration time, so
+                    # the cart catches up with the constant velocity plan
+                    # while accelerating
+                    lead_time = self.time_lapse_velocity / (2.0 * self.slider_acceleration.value())
+                    delay = max(schedule.get_delay(0) - lead_time, 0.0)
+                    time_lapse_id = self.time_lapse_id
 
-                        delay = min(self.next_trigger_time - get_timestamp(), 10.0)
+                    QTimer.singleShot(int(delay * 1000), lambda: self.time_lapse_continuous_move(time_lapse_id))
 
-                    image_index = self.image_count - self.remaining_image_count + 1
-                    self.remaining_image_count -= 1
+            if self.time_lapse_continuous:
+                stepper = self.position_tracker
+                frame_indices = range(schedule.next_index, schedule.image_count)
+            else:
+                stepper = None
+                frame_indices = [schedule.next_index]
+
+            camera_trigger = self.edit_camera_trigger.text()
+            camera = self.time_lapse_camera
+            telemetry = self.time_lapse_telemetry
+            move_duration = self.time_lapse_move_duration if stepper == None else None
+            exposure_time = self.time_lapse_exposure_time if stepper == None else 0.0
+
+            # the worker waits for the deadline itself, a pause and resume in
+            # the meantime shifts the deadline and wakes the worker up
+            for frame_index in frame_indices:
+                self.trigger_worker.submit(lambda frame_index=frame_index: schedule.get_deadline(frame_index),
+                                           lambda generation, lateness, frame_index=frame_index:
+                                               self.time_lapse_capture(generation, lateness, schedule, frame_index, camera, camera_trigger, stepper,
+                                                                       telemetry, move_duration, exposure_time))
+
+    # called from the trigger worker thread
+    def time_lapse_capture(self, generation, lateness, schedule, frame_index, camera, camera_trigger, stepper,
+                           telemetry, move_duration, exposure_time):
+        def aborted():
+            return not self.time_lapse_in_progress or not self.trigger_worker.is_current(generation)
+
+        if aborted():
+            return
 
-                    if self.remaining_image_count == 0:
-                        self.next_trigger_time = 0
-                    else:
-                        self.next_trigger_time += self.interval
+        if stepper != None:
+            # record where the moving cart actually is
+            try:
+                position = stepper.get_current_position() # FIXME: blocking getter
+            except:
+                position = None
+        else:
+            position = None
 
-                    self.log_append_async('Triggering camera for image {0} of {1}: {2}'.format(image_index, self.image_count, camera_trigger))
+        schedule.record_trigger(frame_index, position=position)
 
-                    try:
-                        output = subprocess.check_output(camera_trigger, stderr=subprocess.STDOUT, shell=True).decode('utf-8').strip()
-                        self.log_append_async('Camera trigger output: ' + output)
-                    except subprocess.CalledProcessError as e:
-                        self.log_append_async('Camera trigger error {0}: {1}'.format(e.returncode, e.output.decode('utf-8').strip()))
+        if position != None:
+            self.log_append_async('Triggering camera for image {0} of {1} at position {2} ({3:.1f} ms late): {4}'
+                                  .format(frame_index + 1, schedule.image_count, self.position_stepper_to_display(position), lateness * 1000, camera_trigger))
+        else:
+            self.log_append_async('Triggering camera for image {0} of {1} ({2:.1f} ms late): {3}'
+                                  .format(frame_index + 1, schedule.image_count, lateness * 1000, camera_trigger))
 
-                    if not self.time_lapse_in_progress or \
-                       time_lapse_id != self.time_lapse_id or \
-                       trigger_thread_id != self.trigger_thread_id:
-                        return
+        trigger_start = get_timestamp()
 
-                    if self.remaining_image_count == 0:
-                        QTimer.singleShot(0, self.time_lapse_done)
-                    else:
-                        QTimer.singleShot(0, self.time_lapse_next)
+        # with a known exposure time the move to the next position starts as
+        # soon as the shutter is closed, while the camera is still storing the
+        # image and the camera trigger command has not finished yet. the
+        # exposure time counts from the moment the trigger command went out
+        sent_times = []
+
+        def trigger_sent():
+            sent_times.append(get_timestamp())
 
-            self.trigger_thread_id += 1
-            self.trigger_thread = threading.Thread(target=trigger, args=(self.time_lapse_id, self.trigger_thread_id, self.edit_camera_trigger.text()))
-            self.trigger_thread.daemon = True
-            self.trigger_thread.start()
+            if exposure_time > 0 and not schedule.done:
+                self.qtcb_time_lapse_exposing.emit(generation, exposure_time)
+
+        try:
+            output = camera.trigger(trigger_sent)
+            exit_code = 0
+            self.log_append_async('Camera trigger output: ' + output)
+        except CameraTriggerError as e:
+            output = e.output
+            exit_code = e.returncode
+            self.log_append_async('Camera trigger error {0}: {1}'.format(e.returncode, e.output))
+
+        duration = get_timestamp() - trigger_start
+
+        # the move to this image started when the shutter of the previous
+        # image closed. it only saved the part of it that ran while the camera
+        # was still storing the previous image. the captures run one after the
+        # other in the trigger worker thread
+        previous_write_out = self.time_lapse_previous_write_out
+
+        if exposure_time > 0:
+            sent_time = sent_times[0] if len(sent_times) > 0 else trigger_start
+            self.time_lapse_previous_write_out = max(trigger_start + duration - sent_time - exposure_time, 0.0)
+        else:
+            self.time_lapse_previous_write_out = None
+
+        if previous_write_out != None and move_duration != None:
+            overlap = min(previous_write_out, move_duration)
+
+            self.time_lapse_saved_time += overlap
+            self.time_lapse_saved_count += 1
+        else:
+            overlap = None
+
+        if telemetry != None:
+            try:
+                telemetry.record(frame_index, schedule.deadlines[frame_index], trigger_start, duration,
+                                 exit_code, self.position_stepper_to_display(schedule.actual_positions[frame_index]), move_duration, output, overlap)
+            except (OSError, ValueError) as e:
+                self.log_append_async('Could not write telemetry: {0}'.format(e))
+
+        if aborted():
+            return
+
+        if schedule.done:
+            self.qtcb_time_lapse_done.emit()
+        elif stepper == None and exposure_time <= 0:
+            self.qtcb_time_lapse_next.emit()
 
     def gphoto2_enable(self):
         if gphoto2_path != None:
@@ -1077,19 +1561,33 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         if gphoto2_path != None:
             self.log_append('Starting Zadig')
 
+            import ctypes
+
             # Zadig needs UAC elevation.
             ctypes.windll.shell32.ShellExecuteW(None, "runas", os.path.join(gphoto2_path, 'zadig.exe'), "", None, 1)
 
+    def create_camera_trigger(self, camera_trigger):
+        # trigger scripts for the connected host and port are run in-process
+        # using the existing connection
+        if self.ipcon.get_connection_state() == IPConnection.CONNECTION_STATE_CONNECTED:
+            return create_trigger(camera_trigger, self.ipcon, self.ipcon.host, self.ipcon.port)
+        else:
+            return create_trigger(camera_trigger, None, None, None)
+
     def time_lapse_test(self):
         if not self.test_in_progress and not self.time_lapse_in_progress:
             def test(camera_trigger):
                 self.log_append_async('Testing camera trigger: {0}'.format(camera_trigger))
 
+                camera = self.create_camera_trigger(camera_trigger)
+
                 try:
-                    output = subprocess.check_output(camera_trigger, stderr=subprocess.STDOUT, shell=True).decode('utf-8').strip()
+                    output = camera.trigger()
                     self.log_append_async('Camera trigger output: ' + output)
-                except subprocess.CalledProcessError as e:
-                    self.log_append_async('Camera trigger error {0}: {1}'.format(e.returncode, e.output.decode('utf-8').strip()))
+                except CameraTriggerError as e:
+                    self.log_append_async('Camera trigger error {0}: {1}'.format(e.returncode, e.output))
+                finally:
+                    camera.close()
 
                 self.log_append_async('Camera trigger test done')
 
@@ -1107,13 +1605,57 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         if self.stepper_ready_for_motion():
             self.log_append('Preparing time lapse')
 
-            current_position = self.stepper.get_current_position() # FIXME: blocking getter
+            current_position = self.position_tracker.get_current_position() # FIXME: blocking getter
             target_position = self.position_display_to_stepper(self.slider_start_position.value())
 
-            if current_position != target_position:
+            if current_position != target_position and not self.limit_switch_blocks_motion(target_position - current_position):
                 self.time_lapse_in_preparation = True
                 self.prepare_stepper_motion()
-                self.stepper.set_target_position(target_position)
+                self.position_tracker.set_target_position(target_position)
+
+    def get_time_lapse_positions(self, image_count, interval, continuous):
+        start_position = self.slider_start_position.value()
+        end_position = self.slider_end_position.value()
+        interpolation = INTERPOLATIONS[self.combo_interpolation.currentIndex()]
+
+        try:
+            keyframes = parse_keyframes(self.edit_keyframes.text())
+
+            for frame, position in keyframes:
+                if frame >= image_count:
+                    raise MotionPathError('Keyframe for image {0} is after the last image'.format(frame + 1))
+
+                if position < 0 or position > self.stepper_info.motion_range:
+                    raise MotionPathError('Keyframe position {0} is outside the motion range'.format(position))
+
+            if continuous and (len(keyframes) > 0 or interpolation != INTERPOLATION_LINEAR):
+                raise MotionPathError('Keyframes and interpolations other than linear are not supported in continuous motion mode')
+
+            # start and end position are added last, so they win over user
+            # keyframes for the first and the last image
+            keyframes += [(0, start_position), (image_count - 1, end_position)]
+            positions = evaluate_path(keyframes, image_count, interpolation)
+        except MotionPathError as e:
+            QMessageBox.critical(self, 'Time Lapse', str(e))
+            return None
+
+        if not continuous:
+            violations = validate_path(positions, interval, self.slider_velocity.value(),
+                                       self.slider_acceleration.value(), self.slider_deceleration.value())
+
+            if len(violations) > 0:
+                image_index, duration = violations[0]
+                message_text = 'The cart cannot reach the position of {0} image(s) within the interval of {1} seconds with the current velocity and acceleration settings. The move to image {2} requires {3:.1f} seconds. These images will be captured late.'.format(len(violations), interval, image_index + 1, duration)
+
+                message_box = QMessageBox(QMessageBox.Question, 'Time Lapse', message_text, QMessageBox.NoButton, self)
+                start_button = message_box.addButton('Start Anyway', QMessageBox.AcceptRole)
+                message_box.addButton(QMessageBox.Cancel)
+                message_box.exec_()
+
+                if message_box.clickedButton() != start_button:
+                    return None
+
+        return [self.position_display_to_stepper(position) for position in positions]
 
     def time_lapse_start(self):
         config.set_camera_trigger(self.edit_camera_trigger.text())
@@ -1122,55 +1664,135 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             uid = self.get_stepper_uid()
 
             if uid != None:
-                self.log_append('Starting time lapse')
-
                 start_position = self.slider_start_position.value()
                 end_position = self.slider_end_position.value()
+                image_count = self.spin_image_count.value()
+                interval = self.spin_interval.value()
+                continuous = self.combo_motion_mode.currentIndex() == MOTION_MODE_CONTINUOUS
+                positions = self.get_time_lapse_positions(image_count, interval, continuous)
+
+                if positions == None:
+                    return
+
+                self.time_lapse_continuous = continuous
+                self.time_lapse_velocity = get_continuous_velocity(start_position, end_position, image_count, interval)
+
+                if self.time_lapse_continuous and self.time_lapse_velocity > MAX_VELOCITY:
+                    self.time_lapse_continuous = False
+
+                    QMessageBox.critical(self, 'Time Lapse',
+                                         'The cart cannot move fast enough for a continuous time lapse with this image count and interval. It would require a velocity of {0} steps/s, but the maximum is {1} steps/s.'
+                                         .format(int(round(self.time_lapse_velocity)), MAX_VELOCITY))
+                    return
+
+                self.log_append('Starting time lapse')
 
                 self.time_lapse_in_progress = True
                 self.time_lapse_id += 1
                 self.first_time_lapse_trigger = True
-                self.image_count = self.spin_image_count.value()
-                self.remaining_image_count = self.spin_image_count.value()
-                self.interval = self.spin_interval.value()
-                self.steps_per_interval = float(end_position - start_position) / (self.image_count - 1)
-                self.next_trigger_position = float(start_position)
+                self.time_lapse_schedule = TimeLapseSchedule(positions, interval, self.spin_initial_delay.value())
+                self.trigger_worker.statistics.reset()
+                self.ui_state.reset_statistics()
+                self.time_lapse_camera = self.create_camera_trigger(self.edit_camera_trigger.text())
+                self.time_lapse_move_start_time = None
+                self.time_lapse_move_duration = None
+                self.time_lapse_exposure_time = self.spin_exposure_time.value() if not self.time_lapse_continuous else 0.0
+                self.time_lapse_saved_time = 0.0
+                self.time_lapse_saved_count = 0
+                self.time_lapse_previous_write_out = None
+
+                try:
+                    self.time_lapse_telemetry = TimeLapseTelemetry(get_telemetry_filename(config.get_telemetry_directory()))
+                    self.log_append('Writing telemetry to ' + self.time_lapse_telemetry.filename)
+                except OSError as e:
+                    self.time_lapse_telemetry = None
+                    self.log_append('Could not create telemetry file: {0}'.format(e))
+
+                # start a persistent camera session while the cart moves to
+                # the start position, so the camera detection does not delay
+                # the first image
+                thread = threading.Thread(target=self.time_lapse_camera.open)
+                thread.daemon = True
+                thread.start()
+
+                if self.time_lapse_continuous:
+                    self.log_append('Using continuous motion with {0:.1f} steps/s'.format(self.time_lapse_velocity))
 
                 self.time_lapse_status_timer.start()
 
-                current_position = self.stepper.get_current_position() # FIXME: blocking getter
-                target_position = self.position_display_to_stepper(int(round(self.next_trigger_position)))
+                current_position = self.position_tracker.get_current_position() # FIXME: blocking getter
+                target_position = self.time_lapse_schedule.get_position(0)
 
-                if current_position != target_position:
+                if self.limit_switch_blocks_motion(target_position - current_position):
+                    self.time_lapse_abort()
+                elif current_position != target_position:
                     self.prepare_stepper_motion()
-                    self.stepper.set_target_position(target_position)
+                    self.time_lapse_move_start_time = get_timestamp()
+                    self.position_tracker.set_target_position(target_position)
                 else:
+                    self.time_lapse_move_duration = 0.0
                     self.time_lapse_trigger()
 
                 self.update_ui_state()
 
+    def time_lapse_pause_or_resume(self):
+        schedule = self.time_lapse_schedule
+
+        if self.time_lapse_in_progress and schedule != None and schedule.started:
+            if schedule.paused:
+                schedule.resume()
+                self.trigger_worker.wake()
+                self.log_append('Resuming time lapse')
+            else:
+                schedule.pause()
+                self.log_append('Pausing time lapse')
+
+            self.update_ui_state()
+
     def time_lapse_abort(self):
         if self.time_lapse_in_progress:
             self.log_append('Aborting time lapse')
 
+            self.trigger_worker.cancel()
             self.motion_stop()
 
             self.time_lapse_in_progress = False
             self.time_lapse_status_timer.stop()
+            self.time_lapse_continuous_done()
+            self.time_lapse_camera_close()
+            self.time_lapse_telemetry_close()
             self.update_ui_state()
 
     ### log tab ###############################################################
 
     def log_append(self, message):
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        # can be called from any thread. the line is written to the log file
+        # right away, but the log view is only updated once per flush interval
+        line = format_log_line(message)
 
-        self.edit_log.appendPlainText(timestamp + ' - ' + message)
-        self.edit_log.verticalScrollBar().setValue(self.edit_log.verticalScrollBar().maximum())
+        if self.log_file != None:
+            self.log_file.write(line)
+
+        if self.log_buffer.append(line):
+            self.qtcb_log_flush_scheduled.emit()
 
     def log_append_async(self, message):
-        self.qtcb_log_append.emit(message)
+        self.log_append(message)
+
+    def log_schedule_flush(self):
+        QTimer.singleShot(LOG_FLUSH_INTERVAL, self.log_flush)
+
+    def log_flush(self):
+        lines = self.log_buffer.take()
+
+        if len(lines) == 0:
+            return
+
+        self.edit_log.appendPlainText('\n'.join(lines))
+        self.edit_log.verticalScrollBar().setValue(self.edit_log.verticalScrollBar().maximum())
 
     def log_clear(self):
+        self.log_buffer.clear()
         self.edit_log.setPlainText('')
 
     ### callbacks #############################################################
@@ -1184,79 +1806,146 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         if enumeration_type in [IPConnection.ENUMERATION_TYPE_AVAILABLE,
                                 IPConnection.ENUMERATION_TYPE_CONNECTED]:
-            self.devices[uid] = (connected_uid, device_identifier)
+            newly_confirmed = uid in self.unconfirmed_uids
+
+            self.unconfirmed_uids.discard(uid)
+            self.device_added(uid, connected_uid, device_identifier, firmware_version)
+
+            # a selected device from the device cache is opened now
+            if newly_confirmed and self.stepper == None and uid == self.get_stepper_uid():
+                self.stepper_uid_changed()
+            elif newly_confirmed and self.limit_switches == None and uid == self.get_io4_uid():
+                self.limit_switches_changed()
+            # a Bricklet that was reset lost the limit switch configuration
+            elif enumeration_type == IPConnection.ENUMERATION_TYPE_CONNECTED and \
+                 self.limit_switches != None and uid == self.get_io4_uid():
+                self.limit_switches_changed()
+        elif enumeration_type == IPConnection.ENUMERATION_TYPE_DISCONNECTED:
+            # FIXME: abort calibration if stepper or io4 get disconnected
+
+            self.device_removed(uid)
+
+        self.update_ui_state()
 
-            def add_item(combo, no_device_text):
-                if combo.itemText(0) == no_device_text:
-                    combo.clear()
+    def device_added(self, uid, connected_uid, device_identifier, firmware_version):
+        self.devices[uid] = (connected_uid, device_identifier, firmware_version)
 
-                if combo.findData(uid) < 0:
-                    if connected_uid != '0':
-                        if connected_uid in self.devices and self.devices[connected_uid][1] in DEVICE_IDENTIFIERS:
-                            connected_name = DEVICE_IDENTIFIERS[self.devices[connected_uid][1]]
-                        else:
-                            connected_name = 'Unknown Brick'
+        def add_item(combo, no_device_text):
+            if combo.itemText(0) == no_device_text:
+                combo.clear()
 
-                        text = '{0} @ {1} [{2}]'.format(uid, connected_name, connected_uid)
+            if combo.findData(uid) < 0:
+                if connected_uid != '0':
+                    if connected_uid in self.devices and self.devices[connected_uid][1] in DEVICE_IDENTIFIERS:
+                        connected_name = DEVICE_IDENTIFIERS[self.devices[connected_uid][1]]
                     else:
-                        text = uid
+                        connected_name = 'Unknown Brick'
 
-                    combo.addItem(text, uid)
+                    text = '{0} @ {1} [{2}]'.format(uid, connected_name, connected_uid)
+                else:
+                    text = uid
 
-            if device_identifier == BrickStepper.DEVICE_IDENTIFIER:
-                add_item(self.combo_stepper_uid, NO_STEPPER_BRICK_FOUND)
-            elif device_identifier == BrickSilentStepper.DEVICE_IDENTIFIER:
-                add_item(self.combo_stepper_uid, NO_STEPPER_BRICK_FOUND)
-            elif device_identifier == BrickletIO4.DEVICE_IDENTIFIER:
-                add_item(self.combo_io4_uid, NO_IO4_BRICKLET_FOUND)
+                combo.addItem(text, uid)
 
-            if str(device_identifier).startswith('1'):
-                def update_items(combo, expected_device_identifier):
-                    for other_uid in self.devices:
-                        other_connected_uid, other_device_identifier = self.devices[other_uid]
+        if device_identifier == BrickStepper.DEVICE_IDENTIFIER:
+            add_item(self.combo_stepper_uid, NO_STEPPER_BRICK_FOUND)
+        elif device_identifier == BrickSilentStepper.DEVICE_IDENTIFIER:
+            add_item(self.combo_stepper_uid, NO_STEPPER_BRICK_FOUND)
+        elif device_identifier == IO4_DEVICE_IDENTIFIER:
+            add_item(self.combo_io4_uid, NO_IO4_BRICKLET_FOUND)
 
-                        if other_device_identifier != expected_device_identifier:
-                            continue
+        if str(device_identifier).startswith('1'):
+            def update_items(combo, expected_device_identifier):
+                for other_uid in self.devices:
+                    other_connected_uid, other_device_identifier, _ = self.devices[other_uid]
 
-                        if other_connected_uid == uid and device_identifier in DEVICE_IDENTIFIERS:
-                            connected_name = DEVICE_IDENTIFIERS[device_identifier]
-                            text = '{0} @ {1} [{2}]'.format(other_uid, connected_name, uid)
-                            index = combo.findData(other_uid)
+                    if other_device_identifier != expected_device_identifier:
+                        continue
 
-                            if index >= 0:
-                                combo.setItemText(index, text)
+                    if other_connected_uid == uid and device_identifier in DEVICE_IDENTIFIERS:
+                        connected_name = DEVICE_IDENTIFIERS[device_identifier]
+                        text = '{0} @ {1} [{2}]'.format(other_uid, connected_name, uid)
+                        index = combo.findData(other_uid)
 
-                update_items(self.combo_stepper_uid, BrickStepper.DEVICE_IDENTIFIER)
-                update_items(self.combo_stepper_uid, BrickSilentStepper.DEVICE_IDENTIFIER)
-                update_items(self.combo_io4_uid, BrickletIO4.DEVICE_IDENTIFIER)
-        elif enumeration_type == IPConnection.ENUMERATION_TYPE_DISCONNECTED:
-            # FIXME: abort calibration if stepper or io4 get disconnected
+                        if index >= 0:
+                            combo.setItemText(index, text)
 
-            self.devices.pop(uid, None)
+            update_items(self.combo_stepper_uid, BrickStepper.DEVICE_IDENTIFIER)
+            update_items(self.combo_stepper_uid, BrickSilentStepper.DEVICE_IDENTIFIER)
+            update_items(self.combo_io4_uid, IO4_DEVICE_IDENTIFIER)
 
-            def remove_item(combo, no_device_text):
-                index = combo.findData(uid)
+    def device_removed(self, uid):
+        self.devices.pop(uid, None)
 
-                if index < 0:
-                    return
+        def remove_item(combo, no_device_text):
+            index = combo.findData(uid)
+
+            if index < 0:
+                return
+
+            combo.removeItem(index)
+
+            if combo.count() == 0:
+                combo.addItem(no_device_text)
 
-                combo.removeItem(index)
+        remove_item(self.combo_stepper_uid, NO_STEPPER_BRICK_FOUND)
+        remove_item(self.combo_io4_uid, NO_IO4_BRICKLET_FOUND)
+
+    def restore_device_cache(self):
+        # shows the devices of the last connection to this host and port right
+        # away. the enumeration confirms them, the ones that did not answer
+        # until the confirmation timeout are removed again
+        try:
+            devices = self.calibration_store.get_devices(self.edit_host.text(), self.spin_port.value())
+        except CalibrationStoreError:
+            devices = {}
+
+        # before they are added, adding the first one selects it
+        self.unconfirmed_uids.update(devices)
+
+        for uid in devices:
+            if uid not in self.devices:
+                self.device_added(uid, *devices[uid])
+
+        if len(devices) > 0:
+            self.log_append('Restored {0} device(s) from the device cache'.format(len(devices)))
+
+    def confirm_device_cache(self):
+        if self.ipcon.get_connection_state() != IPConnection.CONNECTION_STATE_CONNECTED:
+            return
 
-                if combo.count() == 0:
-                    combo.setEnabled(False)
-                    combo.addItem(no_device_text)
+        for uid in self.unconfirmed_uids:
+            # a slow enumeration must not take away a device that is in use
+            if (uid == self.get_stepper_uid() and self.stepper != None) or \
+               (uid == self.get_io4_uid() and self.limit_switches != None):
+                continue
 
-            remove_item(self.combo_stepper_uid, NO_STEPPER_BRICK_FOUND)
-            remove_item(self.combo_io4_uid, NO_IO4_BRICKLET_FOUND)
+            self.log_append('Device [{0}] did not answer the enumeration, removing it'.format(uid))
+            self.device_removed(uid)
 
+        self.unconfirmed_uids = set()
+
+        self.save_device_cache()
         self.update_ui_state()
 
+    def save_device_cache(self):
+        if len(self.unconfirmed_uids) > 0:
+            return
+
+        try:
+            self.calibration_store.put_devices(self.edit_host.text(), self.spin_port.value(), self.devices)
+        except CalibrationStoreError as e:
+            self.log_append('Could not save the device cache: {0}'.format(e))
+
     def cb_ipcon_connected(self, connect_reason):
+        self.connection_state = IPConnection.CONNECTION_STATE_CONNECTED
+        self.connecting = False
         self.disconnect_times = []
 
         if connect_reason == IPConnection.CONNECT_REASON_REQUEST:
             self.ipcon.set_auto_reconnect(True)
             self.clear_all_uids()
+            self.restore_device_cache()
 
             # save host info
             host_info = config.HostInfo()
@@ -1271,41 +1960,59 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         else:
             self.log_append('Connected')
 
+        # only the devices restored from the device cache have to be
+        # confirmed, the ones of an auto reconnect are known to exist
         try:
             self.ipcon.enumerate()
         except:
             self.update_ui_state()
+        else:
+            if len(self.unconfirmed_uids) > 0:
+                QTimer.singleShot(DEVICE_CACHE_CONFIRM_TIMEOUT, self.confirm_device_cache)
 
     def cb_ipcon_disconnected(self, disconnect_reason):
         self.log_append('Disconnected')
 
         if disconnect_reason == IPConnection.DISCONNECT_REASON_REQUEST or not self.ipcon.get_auto_reconnect():
+            self.connection_state = IPConnection.CONNECTION_STATE_DISCONNECTED
             self.update_ui_state()
         elif len(self.disconnect_times) >= 3 and self.disconnect_times[-3] < time.time() + 1:
             self.disconnect_times = []
             self.ipcon.set_auto_reconnect(False)
+            self.connection_state = IPConnection.CONNECTION_STATE_DISCONNECTED
             self.update_ui_state()
 
             QMessageBox.critical(self, 'Connection',
                                  'Stopped automatic reconnecting due to multiple connection errors in a row.')
         else:
             self.disconnect_times.append(time.time())
-            self.update_ui_state(IPConnection.CONNECTION_STATE_PENDING)
+            self.connection_state = IPConnection.CONNECTION_STATE_PENDING
+            self.update_ui_state()
 
     def cb_stepper_new_state(self, state_new, state_previous):
+        # the homing stops several times, it ends with calibration_homing_done
+        if self.calibration_homing != None:
+            return
+
         # The constant is read from class instance rather from the
         # class itself to support both Stepper and Silent Stepper Bricks.
         if self.stepper != None and state_new == self.stepper.STATE_STOP and state_previous != self.stepper.STATE_STOP:
+            # a long move is done in several segments
+            if self.position_tracker.next_segment():
+                return
+
             self.stepper_motion_stopped()
 
 class Application(QApplication):
     def __init__(self, args):
         super().__init__(args)
 
-        self.setWindowIcon(QIcon(load_pixmap('starter_kit_camera_slider_demo-icon.png')))
-
-def get_timestamp():
-    return time.time() # FIXME: use monotonic clock here
+        # the bundled PNG is too small for high DPI screens
+        if self.devicePixelRatio() > 1:
+            self.setWindowIcon(load_icon('starter_kit_camera_slider_demo-icon.svg', 'starter_kit_camera_slider_demo-icon.png',
+                                         ICON_SIZES, self.devicePixelRatio()))
+        else:
+            self.setWindowIcon(QIcon(load_pixmap('starter_kit_camera_slider_demo-icon.png')))
 
 def main():
     global gphoto2_path
@@ -1333,6 +2040,8 @@ def main():
 
     application = Application(args)
 
+    startup_profile.mark('QApplication')
+
     main_window = MainWindow()
 
     if '-fullscreen' in sys.argv:
@@ -1340,6 +2049,10 @@ def main():
     else:
         main_window.show()
 
+    startup_profile.mark('show')
+
+    QTimer.singleShot(0, main_window.startup_finished)
+
     sys.exit(application.exec_())
 
 if __name__ == "__main__":
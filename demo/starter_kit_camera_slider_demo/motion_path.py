@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+motion_path.py: Keyframe Motion Paths
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+import math
+
+INTERPOLATION_LINEAR = 'linear'
+INTERPOLATION_EASE_IN = 'ease-in'
+INTERPOLATION_EASE_OUT = 'ease-out'
+INTERPOLATION_EASE_IN_OUT = 'ease-in-out'
+INTERPOLATION_CUBIC = 'cubic'
+
+INTERPOLATIONS = [INTERPOLATION_LINEAR,
+                  INTERPOLATION_EASE_IN,
+                  INTERPOLATION_EASE_OUT,
+                  INTERPOLATION_EASE_IN_OUT,
+                  INTERPOLATION_CUBIC]
+
+class MotionPathError(Exception):
+    pass
+
+def ease_linear(t):
+    return t
+
+def ease_in(t):
+    return t * t * t
+
+def ease_out(t):
+    t = 1.0 - t
+
+    return 1.0 - t * t * t
+
+def ease_in_out(t):
+    # smootherstep, zero velocity and acceleration at both ends
+    return t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+
+EASING_FUNCTIONS = {INTERPOLATION_LINEAR: ease_linear,
+                    INTERPOLATION_EASE_IN: ease_in,
+                    INTERPOLATION_EASE_OUT: ease_out,
+                    INTERPOLATION_EASE_IN_OUT: ease_in_out}
+
+def parse_keyframes(text):
+    # image:position pairs separated by commas, e.g. "1:0, 50:2000, 100:8000".
+    # image numbers are 1-based like in the UI, the result is 0-based
+    keyframes = []
+
+    for part in text.split(','):
+        part = part.strip()
+
+        if len(part) == 0:
+            continue
+
+        pair = part.split(':')
+
+        if len(pair) != 2:
+            raise MotionPathError('Malformed keyframe: {0}'.format(part))
+
+        try:
+            image = int(pair[0])
+            position = int(pair[1])
+        except ValueError:
+            raise MotionPathError('Malformed keyframe: {0}'.format(part))
+
+        if image < 1:
+            raise MotionPathError('Keyframe image number must be 1 or greater: {0}'.format(part))
+
+        keyframes.append((image - 1, position))
+
+    return keyframes
+
+def normalize_keyframes(keyframes):
+    # sort by frame and let later keyframes for the same frame win
+    by_frame = {}
+
+    for frame, position in keyframes:
+        by_frame[int(frame)] = int(position)
+
+    return sorted(by_frame.items())
+
+def get_monotone_tangents(frames, positions):
+    # Fritsch-Carlson tangents. unlike a natural cubic spline this never
+    # overshoots the keyframes and therefore never leaves the rail
+    count = len(frames)
+    slopes = [(positions[i + 1] - positions[i]) / float(frames[i + 1] - frames[i]) for i in range(count - 1)]
+    tangents = [0.0] * count
+
+    tangents[0] = slopes[0]
+    tangents[-1] = slopes[-1]
+
+    for i in range(1, count - 1):
+        if slopes[i - 1] * slopes[i] <= 0:
+            tangents[i] = 0.0
+        else:
+            tangents[i] = (slopes[i - 1] + slopes[i]) / 2.0
+
+    for i in range(count - 1):
+        if slopes[i] == 0:
+            tangents[i] = 0.0
+            tangents[i + 1] = 0.0
+            continue
+
+        alpha = tangents[i] / slopes[i]
+        beta = tangents[i + 1] / slopes[i]
+        length = math.hypot(alpha, beta)
+
+        if length > 3.0:
+            scale = 3.0 / length
+            tangents[i] = scale * alpha * slopes[i]
+            tangents[i + 1] = scale * beta * slopes[i]
+
+    return tangents
+
+def evaluate_path(keyframes, image_count, interpolation=INTERPOLATION_LINEAR):
+    keyframes = normalize_keyframes(keyframes)
+
+    if len(keyframes) == 0:
+        raise MotionPathError('At least one keyframe is required')
+
+    if keyframes[0][0] != 0 or keyframes[-1][0] != image_count - 1:
+        raise MotionPathError('Keyframes have to start at the first and end at the last image')
+
+    if interpolation != INTERPOLATION_CUBIC and interpolation not in EASING_FUNCTIONS:
+        raise MotionPathError('Unknown interpolation: {0}'.format(interpolation))
+
+    frames = [keyframe[0] for keyframe in keyframes]
+    positions = [keyframe[1] for keyframe in keyframes]
+
+    if len(keyframes) == 1:
+        return [positions[0]] * image_count
+
+    if interpolation == INTERPOLATION_CUBIC:
+        tangents = get_monotone_tangents(frames, positions)
+    else:
+        ease = EASING_FUNCTIONS[interpolation]
+
+    # evaluate all frames in a single pass over the segments, the segment of
+    # each frame is found by advancing through the sorted keyframes only once
+    result = [0] * image_count
+    segment = 0
+
+    for frame in range(image_count):
+        while frame > frames[segment + 1]:
+            segment += 1
+
+        frame0 = frames[segment]
+        frame1 = frames[segment + 1]
+        position0 = positions[segment]
+        position1 = positions[segment + 1]
+        length = float(frame1 - frame0)
+        t = (frame - frame0) / length
+
+        if interpolation == INTERPOLATION_CUBIC:
+            t2 = t * t
+            t3 = t2 * t
+            position = (2.0 * t3 - 3.0 * t2 + 1.0) * position0 + \
+                       (t3 - 2.0 * t2 + t) * length * tangents[segment] + \
+                       (-2.0 * t3 + 3.0 * t2) * position1 + \
+                       (t3 - t2) * length * tangents[segment + 1]
+        else:
+            position = position0 + (position1 - position0) * ease(t)
+
+        result[frame] = int(round(position))
+
+    return result
+
+def get_move_duration(distance, velocity, acceleration, deceleration):
+    # duration of a trapezoidal (or triangular, if the maximum velocity is not
+    # reached) velocity profile as executed by the Stepper Brick
+    distance = abs(distance)
+
+    if distance == 0:
+        return 0.0
+
+    if velocity <= 0 or acceleration <= 0 or deceleration <= 0:
+        return float('inf')
+
+    ramp_factor = 1.0 / acceleration + 1.0 / deceleration
+    ramp_distance = velocity * velocity * ramp_factor / 2.0
+
+    if distance < ramp_distance:
+        peak_velocity = math.sqrt(2.0 * distance / ramp_factor)
+
+        return peak_velocity * ramp_factor
+
+    return distance / float(velocity) + velocity * ramp_factor / 2.0
+
+def validate_path(positions, interval, velocity, acceleration, deceleration):
+    # returns a list of (image index, required duration) for all moves that
+    # cannot be completed within the interval before the image is due
+    violations = []
+
+    for i in range(1, len(positions)):
+        duration = get_move_duration(positions[i] - positions[i - 1], velocity, acceleration, deceleration)
+
+        if duration > interval:
+            violations.append((i, duration))
+
+    return violations
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+multi_axis.py: Synchronized Multi-Axis Motion Planning
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+
+# plans moves of several axes, e.g. slide, pan and tilt, each driven by its
+# own Stepper Brick. all axes of a move follow the same velocity profile over
+# time, scaled by their distance, so they start, reach full speed, brake and
+# arrive together
+
+import math
+
+from starter_kit_camera_slider_demo.motion_path import MotionPathError, INTERPOLATION_LINEAR, \
+                                                      evaluate_path, get_move_duration
+
+# the Stepper Brick takes velocity and ramping as 16 bit values
+MAX_MOTION_PARAMETER = 65535
+
+def parse_joint_keyframes(text, axis_count):
+    # image:position/position/... tuples separated by commas, one position per
+    # axis, e.g. "1:0/0/0, 100:8000/1200/300". image numbers are 1-based like
+    # in the UI, the result is 0-based
+    keyframes = []
+
+    for part in text.split(','):
+        part = part.strip()
+
+        if len(part) == 0:
+            continue
+
+        pair = part.split(':')
+
+        if len(pair) != 2:
+            raise MotionPathError('Malformed joint keyframe: {0}'.format(part))
+
+        try:
+            image = int(pair[0])
+            positions = [int(position) for position in pair[1].split('/')]
+        except ValueError:
+            raise MotionPathError('Malformed joint keyframe: {0}'.format(part))
+
+        if image < 1:
+            raise MotionPathError('Keyframe image number must be 1 or greater: {0}'.format(part))
+
+        if len(positions) != axis_count:
+            raise MotionPathError('Joint keyframe needs {0} positions: {1}'.format(axis_count, part))
+
+        keyframes.append((image - 1, positions))
+
+    return keyframes
+
+def evaluate_joint_path(keyframes, image_count, axis_count, interpolation=INTERPOLATION_LINEAR):
+    # returns one tuple of axis positions per image. each axis is evaluated in
+    # a single pass over its keyframes
+    axis_paths = []
+
+    for axis in range(axis_count):
+        axis_paths.append(evaluate_path([(frame, positions[axis]) for frame, positions in keyframes],
+                                        image_count, interpolation))
+
+    return list(zip(*axis_paths))
+
+def get_normalized_profile(distances, limits):
+    # the fastest profile for a move over the distance 1 that every moving
+    # axis can follow when velocity and ramps are multiplied by its distance
+    # without exceeding its limits
+    velocity = min([limit[0] / float(distance) for distance, limit in zip(distances, limits) if distance > 0])
+    acceleration = min([limit[1] / float(distance) for distance, limit in zip(distances, limits) if distance > 0])
+    deceleration = min([limit[2] / float(distance) for distance, limit in zip(distances, limits) if distance > 0])
+
+    return velocity, acceleration, deceleration
+
+def get_rounded_candidates(value, limit):
+    return sorted(set([min(max(candidate, 1), limit, MAX_MOTION_PARAMETER)
+                       for candidate in [int(math.floor(value)), int(math.ceil(value))]]))
+
+def get_scaled_parameters(distance, velocity, acceleration, deceleration, limits):
+    # velocity and ramps of one axis for the normalized profile. the Stepper
+    # Brick takes whole steps/s and steps/s^2, for an axis that moves only a
+    # few steps the rounded velocity differs noticeably from the profile. the
+    # ramps are then solved from duration = distance / v + v * ramp_factor / 2
+    # for the rounded v, and the combination of rounded values that arrives
+    # closest to the duration of the profile is used
+    duration = get_move_duration(1.0, velocity, acceleration, deceleration)
+    velocity *= distance
+    acceleration *= distance
+    deceleration *= distance
+    ramp_factor = 1.0 / acceleration + 1.0 / deceleration
+    best_error = None
+    best_parameters = None
+
+    for rounded_velocity in get_rounded_candidates(velocity, limits[0]):
+        solved_acceleration = acceleration
+        solved_deceleration = deceleration
+
+        # the solved profile has to reach the rounded velocity
+        if 2 * distance >= rounded_velocity * duration > distance:
+            rounded_ramp_factor = 2.0 * (duration - distance / float(rounded_velocity)) / rounded_velocity
+            solved_acceleration = acceleration * ramp_factor / rounded_ramp_factor
+            solved_deceleration = deceleration * ramp_factor / rounded_ramp_factor
+
+        for rounded_acceleration in get_rounded_candidates(solved_acceleration, limits[1]):
+            for rounded_deceleration in get_rounded_candidates(solved_deceleration, limits[2]):
+                parameters = rounded_velocity, rounded_acceleration, rounded_deceleration
+                error = abs(get_move_duration(distance, *parameters) - duration)
+
+                if best_error == None or error < best_error:
+                    best_error = error
+                    best_parameters = parameters
+
+    return best_parameters
+
+def plan_joint_move(start_positions, end_positions, limits):
+    # limits is a (velocity, acceleration, deceleration) tuple per axis.
+    # returns the duration and a (velocity, acceleration, deceleration) tuple
+    # per axis. axes that don't move keep their limits
+    distances = [abs(end - start) for start, end in zip(start_positions, end_positions)]
+
+    if max(distances) == 0:
+        return 0.0, list(limits)
+
+    velocity, acceleration, deceleration = get_normalized_profile(distances, limits)
+    parameters = [get_scaled_parameters(distance, velocity, acceleration, deceleration, axis_limits) if distance > 0 else axis_limits
+                  for distance, axis_limits in zip(distances, limits)]
+
+    # the duration of the move as executed with the rounded parameters
+    duration = max([get_move_duration(distance, *axis_parameters)
+                    for distance, axis_parameters in zip(distances, parameters)])
+
+    return duration, parameters
+
+def plan_joint_path(joint_positions, limits):
+    # plans all moves of a time lapse up front, so no planning is left to do
+    # between two images. returns a (duration, parameters) tuple per image,
+    # the first one is the move from the first image to itself
+    plan = [(0.0, list(limits))]
+
+    for i in range(1, len(joint_positions)):
+        plan.append(plan_joint_move(joint_positions[i - 1], joint_positions[i], limits))
+
+    return plan
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+simulated_stepper.py: Simulated Silent Stepper Brick
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+
+# a stand-in for BrickSilentStepper with the part of its API that is used for
+# motion and homing. the cart moves on a rail with hard ends. like the real
+# open-loop driver the position keeps counting steps while the cart is blocked
+# at a rail end, the motor just skips them. the driver status follows a simple
+# StallGuard model: while the motor runs above the Coolstep threshold the
+# StallGuard result shows the free running load, while blocked it drops to 0.
+# a lower StallGuard threshold makes the stall detection more sensitive, too
+# low values report stalls while running freely, like a real motor does
+
+import time
+from threading import RLock
+
+from starter_kit_camera_slider_demo.tinkerforge.brick_silent_stepper import BrickSilentStepper, \
+                                                                           GetBasicConfiguration, \
+                                                                           GetCoolstepConfiguration, \
+                                                                           GetDriverStatus, GetIdentity
+
+# StallGuard result while running freely and the result below which a stall
+# is reported for a threshold of 0. each threshold step changes the latter by 8
+FREE_STALLGUARD_RESULT = 400
+STALL_LEVEL = 32
+STALL_LEVEL_PER_THRESHOLD = 8
+
+class SimulatedSilentStepper(object):
+    STATE_STOP = BrickSilentStepper.STATE_STOP
+    STATE_ACCELERATION = BrickSilentStepper.STATE_ACCELERATION
+    STATE_RUN = BrickSilentStepper.STATE_RUN
+    STATE_DEACCELERATION = BrickSilentStepper.STATE_DEACCELERATION
+
+    CALLBACK_NEW_STATE = BrickSilentStepper.CALLBACK_NEW_STATE
+
+    DEVICE_IDENTIFIER = BrickSilentStepper.DEVICE_IDENTIFIER
+
+    def __init__(self, minimum_end, maximum_end, position=None):
+        # callbacks are called with the lock held and may call back in
+        self.lock = RLock()
+        self.minimum_end = minimum_end
+        self.maximum_end = maximum_end
+        self.position = float((minimum_end + maximum_end) // 2 if position == None else position)
+        self.skipped_steps = 0.0 # device position minus cart position
+        self.velocity = 0.0 # signed, steps/s
+        self.direction = 0 # -1, 0 or 1 while driving
+        self.target_position = None
+        self.blocked = False
+        self.enabled = False
+        self.state = self.STATE_STOP
+        self.max_velocity = 1000
+        self.acceleration = 1000
+        self.deceleration = 1000
+        self.basic_configuration = GetBasicConfiguration(0, 800, 0, 1000, 500, 500, 1000, False)
+        self.coolstep_configuration = GetCoolstepConfiguration(2, 10, 0, 0, 0, 0, 0)
+        self.callbacks = {}
+        self.last_update = time.monotonic()
+
+    def register_callback(self, callback_id, function):
+        if function == None:
+            self.callbacks.pop(callback_id, None)
+        else:
+            self.callbacks[callback_id] = function
+
+    def set_state(self, state):
+        # called with the lock held
+        if state != self.state:
+            previous_state = self.state
+            self.state = state
+            callback = self.callbacks.get(self.CALLBACK_NEW_STATE)
+
+            if callback != None:
+                callback(state, previous_state)
+
+    def update(self):
+        # called with the lock held, advances the simulation to now
+        now = time.monotonic()
+        dt = now - self.last_update
+        self.last_update = now
+
+        if not self.enabled:
+            self.velocity = 0.0
+            self.direction = 0
+            self.set_state(self.STATE_STOP)
+            return
+
+        if self.target_position != None:
+            remaining = self.target_position - self.position
+
+            if abs(remaining) < 1:
+                self.direction = 0
+            else:
+                self.direction = 1 if remaining > 0 else -1
+                # start braking in time
+                braking_distance = self.velocity * self.velocity / (2.0 * self.deceleration)
+
+                if abs(remaining) <= braking_distance:
+                    self.direction = 0
+
+        target_velocity = self.direction * self.max_velocity
+
+        if target_velocity > self.velocity:
+            self.velocity = min(self.velocity + (self.acceleration if self.velocity >= 0 else self.deceleration) * dt, target_velocity)
+        elif target_velocity < self.velocity:
+            self.velocity = max(self.velocity - (self.acceleration if self.velocity <= 0 else self.deceleration) * dt, target_velocity)
+
+        self.position += self.velocity * dt
+        cart_position = self.position - self.skipped_steps
+        self.blocked = False
+
+        if cart_position < self.minimum_end:
+            self.skipped_steps -= self.minimum_end - cart_position
+            self.blocked = self.velocity < 0
+        elif cart_position > self.maximum_end:
+            self.skipped_steps += cart_position - self.maximum_end
+            self.blocked = self.velocity > 0
+
+        if self.target_position != None and self.direction == 0 and abs(self.velocity) < 1:
+            self.position = float(self.target_position)
+            self.velocity = 0.0
+            self.target_position = None
+
+        if self.direction == 0 and self.velocity == 0:
+            self.set_state(self.STATE_STOP)
+        elif abs(self.velocity) >= self.max_velocity:
+            self.set_state(self.STATE_RUN)
+        elif self.direction == 0 or abs(target_velocity) < abs(self.velocity):
+            self.set_state(self.STATE_DEACCELERATION)
+        else:
+            self.set_state(self.STATE_ACCELERATION)
+
+    def simulate(self):
+        with self.lock:
+            self.update()
+
+    def enable(self):
+        with self.lock:
+            self.update()
+            self.enabled = True
+
+    def disable(self):
+        with self.lock:
+            self.update()
+            self.enabled = False
+            self.update()
+
+    def is_enabled(self):
+        return self.enabled
+
+    def get_identity(self):
+        return GetIdentity('sim', '0', '0', (1, 0, 0), (2, 0, 0), self.DEVICE_IDENTIFIER)
+
+    def set_max_velocity(self, velocity):
+        with self.lock:
+            self.update()
+            self.max_velocity = velocity
+
+    def get_max_velocity(self):
+        return self.max_velocity
+
+    def get_current_velocity(self):
+        with self.lock:
+            self.update()
+
+            return int(abs(self.velocity))
+
+    def set_speed_ramping(self, acceleration, deceleration):
+        with self.lock:
+            self.update()
+            self.acceleration = acceleration
+            self.deceleration = deceleration
+
+    def get_cart_position(self):
+        # the physical position, not available on the real device
+        with self.lock:
+            self.update()
+
+            return int(round(self.position - self.skipped_steps))
+
+    def get_current_position(self):
+        with self.lock:
+            self.update()
+
+            return int(round(self.position))
+
+    def set_target_position(self, position):
+        with self.lock:
+            self.update()
+            self.target_position = position
+
+    def set_steps(self, steps):
+        with self.lock:
+            self.update()
+            self.target_position = int(round(self.position)) + steps
+
+    def drive_forward(self):
+        with self.lock:
+            self.update()
+            self.target_position = None
+            self.direction = 1
+
+    def drive_backward(self):
+        with self.lock:
+            self.update()
+            self.target_position = None
+            self.direction = -1
+
+    def stop(self):
+        with self.lock:
+            self.update()
+            self.target_position = None
+            self.direction = 0
+
+    def full_brake(self):
+        with self.lock:
+            self.update()
+            self.target_position = None
+            self.direction = 0
+            self.velocity = 0.0
+            self.set_state(self.STATE_STOP)
+
+    def get_speed_ramping(self):
+        return self.acceleration, self.deceleration
+
+    def set_basic_configuration(self, *args):
+        self.basic_configuration = GetBasicConfiguration(*args)
+
+    def get_basic_configuration(self):
+        return self.basic_configuration
+
+    def set_coolstep_configuration(self, *args):
+        self.coolstep_configuration = GetCoolstepConfiguration(*args)
+
+    def get_coolstep_configuration(self):
+        return self.coolstep_configuration
+
+    def get_driver_status(self):
+        with self.lock:
+            self.update()
+
+            if self.blocked:
+                stallguard_result = 0
+            elif abs(self.velocity) >= self.basic_configuration.coolstep_threshold:
+                stallguard_result = FREE_STALLGUARD_RESULT
+            else:
+                # not valid below the Coolstep threshold
+                stallguard_result = 1023
+
+            threshold = self.coolstep_configuration.stallguard_threshold_value
+            stall_level = STALL_LEVEL - STALL_LEVEL_PER_THRESHOLD * threshold
+            motor_stalled = self.direction != 0 and stallguard_result < stall_level
+
+            return GetDriverStatus(0, 0, 0, motor_stalled, 31, False, stallguard_result, 0)
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+slider.py: Stepper Setup and Position Helpers
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+# this module must not import PyQt, it is shared by the GUI and the headless
+# time lapse runner
+
+from threading import Lock
+
+from starter_kit_camera_slider_demo.tinkerforge.brick_stepper import BrickStepper
+from starter_kit_camera_slider_demo.tinkerforge.brick_silent_stepper import BrickSilentStepper
+
+CALIBRATION_ACCELERATION = 65535
+CALIBRATION_DECELERATION = 65535
+
+FULL_BREAK_DECELERATION = 65535
+
+MAX_VELOCITY = 65535
+
+MOTOR_CURRENT = 850
+SYNC_RECT = True
+DECAY = 10000
+
+def create_stepper(uid, ipcon, device_identifier=None):
+    # the device identifier is asked for if it is not known from the
+    # enumeration or the device cache
+    stepper = BrickStepper(uid, ipcon)
+    calibration_velocity = 2000
+
+    if device_identifier == None:
+        device_identifier = stepper.get_identity().device_identifier
+
+    if device_identifier == BrickSilentStepper.DEVICE_IDENTIFIER:
+        stepper = BrickSilentStepper(uid, ipcon)
+        calibration_velocity = 64000
+
+    return stepper, calibration_velocity
+
+def configure_stepper(stepper):
+    stepper.set_motor_current(MOTOR_CURRENT)
+
+    # The follwing functions are only available in the Stepper Brick
+    # and not in the Silent Stepper Brick.
+    if hasattr(stepper, 'set_sync_rect'):
+        stepper.set_sync_rect(SYNC_RECT)
+    if hasattr(stepper, 'set_decay'):
+        stepper.set_decay(DECAY)
+
+# the Stepper Brick counts positions and steps as int32
+INT32_RANGE = 1 << 32
+MIN_INT32 = -(1 << 31)
+MAX_INT32 = (1 << 31) - 1
+MAX_SEGMENT_STEPS = MAX_INT32
+
+def unwrap_int32_delta(position, previous_position):
+    # shortest signed distance between two int32 positions, correct as long as
+    # the stepper moves less than 2^31 steps between two reads. at the maximum
+    # velocity that takes more than 9 hours
+    return (position - previous_position + (1 << 31)) % INT32_RANGE - (1 << 31)
+
+class PositionTracker(object):
+    # tracks the stepper position as an unbounded virtual position, so the
+    # int32 device position may overflow anywhere on the rail. the virtual
+    # position matches the device position until the first overflow. targets
+    # that are within the int32 range of the device are sent as absolute
+    # device positions. all others are sent as relative set_steps segments of
+    # at most 2^31 - 1 steps, the caller has to call next_segment when the
+    # stepper stops
+    def __init__(self, stepper):
+        self.stepper = stepper
+        self.lock = Lock()
+        self.remaining_steps = 0
+
+        self.device_position = stepper.get_current_position()
+        self.virtual_position = self.device_position
+
+    def update(self, device_position):
+        # accepts device positions from getters and callbacks, returns the
+        # virtual position
+        with self.lock:
+            self.virtual_position += unwrap_int32_delta(device_position, self.device_position)
+            self.device_position = device_position
+
+            return self.virtual_position
+
+    def get_current_position(self):
+        return self.update(self.stepper.get_current_position())
+
+    def get_cached_position(self):
+        # the virtual position as of the last getter or callback, without a
+        # request to the stepper
+        with self.lock:
+            return self.virtual_position
+
+    def send_segment(self):
+        # called with the lock held
+        segment = max(min(self.remaining_steps, MAX_SEGMENT_STEPS), -MAX_SEGMENT_STEPS)
+        self.remaining_steps -= segment
+
+        self.stepper.set_steps(segment)
+
+    def set_target_position(self, target_position):
+        self.prepare_target_position(target_position)()
+
+    def prepare_target_position(self, target_position):
+        # does everything that might need a round trip to the device and
+        # returns a function that only sends the target. this allows to start
+        # several steppers as close together as possible
+        with self.lock:
+            # the offset between virtual and device position only changes
+            # when the device position wraps, so an absolute target does not
+            # depend on where the cart is right now. this allows to retarget
+            # a moving cart without a position read that is already outdated
+            device_target_position = self.device_position + target_position - self.virtual_position
+
+        if MIN_INT32 <= device_target_position <= MAX_INT32:
+            def send():
+                with self.lock:
+                    self.remaining_steps = 0
+                    self.stepper.set_target_position(self.device_position + target_position - self.virtual_position)
+
+            return send
+
+        current_position = self.get_current_position()
+
+        def send():
+            with self.lock:
+                self.remaining_steps = target_position - current_position
+                self.send_segment()
+
+        return send
+
+    def next_segment(self):
+        # returns True if the stepper was sent the next segment of the current
+        # target, then the stop is not the end of the motion
+        with self.lock:
+            if self.remaining_steps == 0:
+                return False
+
+            self.send_segment()
+
+            return True
+
+    def stop(self):
+        with self.lock:
+            self.remaining_steps = 0
+
+        self.stepper.stop()
+
+    def full_brake(self):
+        # brakes before taking the lock, a limit switch must not wait for it
+        self.stepper.full_brake()
+
+        with self.lock:
+            self.remaining_steps = 0
+
+def update_stepper_info(stepper_info, current_position):
+    # the Stepper Brick counts from 0 after each power cycle. the calibration
+    # stores the position of the cart at the time it was saved, assume that the
+    # cart was not moved manually since then and shift the calibration
+    current_position_offset = current_position - stepper_info.current_position
+    stepper_info.minimum_position += current_position_offset
+    stepper_info.maximum_position += current_position_offset
+    stepper_info.current_position = current_position
+
+def is_stepper_reversed(stepper_info):
+    return stepper_info.maximum_position < stepper_info.minimum_position
+
+def position_stepper_to_display(stepper_info, position):
+    # FIXME: handle out-of-motion-range positions?
+    return abs(position - stepper_info.minimum_position)
+
+def position_display_to_stepper(stepper_info, position):
+    if is_stepper_reversed(stepper_info):
+        return stepper_info.minimum_position - position
+    else:
+        return stepper_info.minimum_position + position
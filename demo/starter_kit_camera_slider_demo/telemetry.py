@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+telemetry.py: Per-Frame Time Lapse Telemetry
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+import os
+import csv
+import threading
+from datetime import datetime
+
+from starter_kit_camera_slider_demo.trigger_worker import get_percentile
+
+TELEMETRY_FIELDS = ['image', 'wall_time', 'scheduled_time', 'trigger_start', 'lateness_ms',
+                    'duration_ms', 'exit_code', 'position', 'move_duration_ms', 'overlap_ms', 'output']
+
+def get_telemetry_filename(directory):
+    return os.path.join(directory, 'time_lapse_{0}.csv'.format(datetime.now().strftime('%Y%m%d_%H%M%S')))
+
+def format_optional(value, scale=1, digits=1):
+    if value == None:
+        return ''
+
+    return '{0:.{1}f}'.format(value * scale, digits)
+
+class TimeLapseTelemetry(object):
+    # one CSV row per frame, written and flushed as soon as the frame is done,
+    # so the file is usable even if the time lapse is interrupted. all times
+    # are in seconds since the start of the time lapse on the monotonic clock
+    def __init__(self, filename):
+        self.filename = filename
+        self.start_time = 0.0
+        self.lock = threading.Lock()
+        self.latenesses = []
+        self.durations = []
+        self.failure_count = 0
+
+        directory = os.path.dirname(filename)
+
+        if len(directory) > 0 and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.f = open(filename, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.f)
+
+        self.writer.writerow(TELEMETRY_FIELDS)
+        self.f.flush()
+
+    def start(self, start_time):
+        self.start_time = start_time
+
+    def record(self, image_index, scheduled_time, trigger_start, duration, exit_code, position, move_duration, output, overlap=None):
+        # overlap is the part of the move to this image that ran while the
+        # camera was still storing the previous image
+        lateness = trigger_start - scheduled_time
+
+        with self.lock:
+            self.latenesses.append(lateness)
+            self.durations.append(duration)
+
+            if exit_code != 0:
+                self.failure_count += 1
+
+            if self.f == None:
+                return
+
+            self.writer.writerow([image_index + 1,
+                                  datetime.now().isoformat(),
+                                  format_optional(scheduled_time - self.start_time, digits=6),
+                                  format_optional(trigger_start - self.start_time, digits=6),
+                                  format_optional(lateness, 1000, 3),
+                                  format_optional(duration, 1000, 3),
+                                  exit_code,
+                                  '' if position == None else position,
+                                  format_optional(move_duration, 1000, 3),
+                                  format_optional(overlap, 1000, 3),
+                                  output])
+            self.f.flush()
+
+    def get_summary(self):
+        # returns count, failure count, p50 and p99 lateness, p50 and p99 duration
+        with self.lock:
+            latenesses = sorted(self.latenesses)
+            durations = sorted(self.durations)
+            failure_count = self.failure_count
+
+        return len(latenesses), failure_count, \
+               get_percentile(latenesses, 50), get_percentile(latenesses, 99), \
+               get_percentile(durations, 50), get_percentile(durations, 99)
+
+    def close(self):
+        with self.lock:
+            if self.f != None:
+                self.f.close()
+                self.f = None
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+time_lapse.py: Time Lapse Schedule
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+import time
+from array import array
+
+def get_timestamp():
+    return time.monotonic()
+
+def get_continuous_velocity(start_position, end_position, image_count, interval):
+    # constant velocity in steps per second to cover the distance between the
+    # first and the last image while moving without stopping
+    if image_count < 2 or interval <= 0:
+        return 0
+
+    return abs(end_position - start_position) / ((image_count - 1) * float(interval))
+
+class TimeLapseSchedule(object):
+    # all deadlines are on the monotonic clock (see get_timestamp). they are
+    # derived from the frame index, the start time and the total pause duration
+    # only, therefore late triggers and pauses cannot accumulate drift
+    def __init__(self, positions, interval, initial_delay=0):
+        self.image_count = len(positions)
+        self.interval = float(interval)
+        self.initial_delay = float(initial_delay)
+
+        self.frame_indices = array('l', range(self.image_count))
+        self.positions = array('q', positions)
+        self.offsets = array('d', [self.initial_delay + i * self.interval for i in range(self.image_count)])
+        self.deadlines = array('d', [0.0] * self.image_count)
+        self.trigger_times = array('d', [0.0] * self.image_count)
+        self.actual_positions = array('q', positions)
+        self.jitters = array('d', [0.0] * self.image_count)
+
+        self.next_index = 0
+        self.start_time = None
+        self.pause_time = None
+        self.pause_duration = 0.0
+
+    @property
+    def started(self):
+        return self.start_time != None
+
+    @property
+    def paused(self):
+        return self.pause_time != None
+
+    @property
+    def done(self):
+        return self.next_index >= self.image_count
+
+    @property
+    def remaining_image_count(self):
+        return self.image_count - self.next_index
+
+    def get_position(self, index):
+        return self.positions[index]
+
+    def start(self, timestamp=None):
+        if timestamp == None:
+            timestamp = get_timestamp()
+
+        self.start_time = timestamp
+        self.pause_time = None
+        self.pause_duration = 0.0
+
+        self.update_deadlines(0)
+
+    def pause(self, timestamp=None):
+        if self.paused:
+            return
+
+        if timestamp == None:
+            timestamp = get_timestamp()
+
+        self.pause_time = timestamp
+
+    def resume(self, timestamp=None):
+        if not self.paused:
+            return
+
+        if timestamp == None:
+            timestamp = get_timestamp()
+
+        self.pause_duration += timestamp - self.pause_time
+        self.pause_time = None
+
+        self.update_deadlines(self.next_index)
+
+    def update_deadlines(self, first_index):
+        if self.start_time == None:
+            return
+
+        base_time = self.start_time + self.pause_duration
+
+        for i in range(first_index, self.image_count):
+            self.deadlines[i] = base_time + self.offsets[i]
+
+    def get_deadline(self, index):
+        if not self.started or self.paused or index >= self.image_count:
+            return None
+
+        return self.deadlines[index]
+
+    def get_delay(self, index, timestamp=None):
+        deadline = self.get_deadline(index)
+
+        if deadline == None:
+            return None
+
+        if timestamp == None:
+            timestamp = get_timestamp()
+
+        return deadline - timestamp
+
+    def get_remaining_time(self, timestamp=None):
+        if self.done:
+            return 0.0
+
+        if not self.started:
+            return self.offsets[self.next_index]
+
+        if timestamp == None:
+            timestamp = get_timestamp()
+
+        if self.paused:
+            timestamp = self.pause_time
+
+        return max(self.deadlines[self.next_index] - timestamp, 0.0)
+
+    def record_trigger(self, index, timestamp=None, position=None):
+        if timestamp == None:
+            timestamp = get_timestamp()
+
+        if position != None:
+            self.actual_positions[index] = position
+
+        self.trigger_times[index] = timestamp
+        self.jitters[index] = timestamp - self.deadlines[index]
+        self.next_index = index + 1
+
+    def get_jitter_statistics(self):
+        jitters = self.jitters[:self.next_index]
+
+        if len(jitters) == 0:
+            return 0, 0.0, 0.0
+
+        return len(jitters), sum(jitters) / len(jitters), max(jitters)
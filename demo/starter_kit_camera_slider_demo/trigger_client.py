@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# sends a trigger request to trigger_server.py, e.g. as camera trigger:
+#
+#   python3 trigger_client.py iqr 6ww 0 100 50
+
+import os
+import sys
+import shlex
+import socket
+
+def get_default_socket_path():
+    runtime_dir = os.getenv('XDG_RUNTIME_DIR')
+
+    if runtime_dir == None or len(runtime_dir) < 1:
+        runtime_dir = '/tmp'
+
+    return os.path.join(runtime_dir, 'starter_kit_camera_slider_demo_trigger.sock')
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    socket_path = get_default_socket_path()
+
+    if len(args) >= 2 and args[0] == '--socket':
+        socket_path = args[1]
+        args = args[2:]
+
+    if len(args) == 0:
+        print('usage: {0} [--socket <path>] <trigger-name> <trigger-arguments>...'.format(sys.argv[0]))
+        sys.exit(1)
+
+    try:
+        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        s.connect(socket_path)
+        s.sendall((' '.join(shlex.quote(arg) for arg in args) + '\n').encode('utf-8'))
+
+        response = s.makefile('rb').readline().decode('utf-8').strip()
+    except OSError as e:
+        print('Could not reach trigger server at {0}: {1}'.format(socket_path, e))
+        sys.exit(1)
+
+    if response.startswith('OK'):
+        print(response[2:].strip())
+        sys.exit(0)
+
+    print(response)
+
+    try:
+        code = int(response.split()[1])
+    except:
+        code = 1
+
+    sys.exit(code if code > 0 else 1)
@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+trigger_drivers.py: In-Process Camera Trigger Drivers
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+# the trigger_iqr.py, trigger_beep.py and trigger_red.py scripts open their own
+# IP Connection for every image. if the camera trigger calls one of them for the
+# host and port the demo is connected to anyway, the same trigger is done by a
+# driver that uses the existing connection and a device object that is created
+# only once. the bindings of the trigger devices are imported when a driver
+# for them is created, the RED Brick bindings alone are a noticeable part of
+# the startup time on slow hardware.
+#
+# a trigger device wraps the device object of one UID and takes the relay,
+# frequency or program per trigger. the IP Connection dispatches responses and
+# callbacks to the last device object created for a UID, so there must be only
+# one per UID and connection. a trigger driver binds a device to the arguments
+# of one camera trigger
+
+import os
+import time
+import shlex
+from threading import Semaphore, Lock
+
+from starter_kit_camera_slider_demo.tinkerforge.ip_connection import Error
+from starter_kit_camera_slider_demo.camera import CameraTriggerError, create_camera_trigger
+
+# additional time to wait for a done callback after the trigger duration
+CALLBACK_TIMEOUT = 1.0
+
+# seconds, the maximum the RED Brick accepts
+RED_SESSION_LIFETIME = 3600
+
+class CallbackTriggerDevice(object):
+    # base for devices that report the end of the trigger pulse by callback.
+    # subclasses pass the request that starts the pulse to trigger_pulse
+    def __init__(self):
+        self.lock = Lock()
+        self.done = Semaphore(0)
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def cb_done(self, *args):
+        self.done.release()
+
+    def trigger_pulse(self, start, trigger_duration, wait_duration, sent=None):
+        with self.lock:
+            # a callback that arrived after an earlier timeout must not end
+            # this trigger early
+            while self.done.acquire(blocking=False):
+                pass
+
+            try:
+                start()
+            except Error as e:
+                raise CameraTriggerError(-1, e.description)
+
+            if sent != None:
+                sent()
+
+            if not self.done.acquire(timeout=trigger_duration / 1000.0 + CALLBACK_TIMEOUT):
+                raise CameraTriggerError(-1, 'Trigger done callback did not arrive')
+
+        time.sleep(wait_duration / 1000.0)
+
+        return ''
+
+class IndustrialQuadRelayTriggerDevice(CallbackTriggerDevice):
+    def __init__(self, ipcon, uid):
+        from starter_kit_camera_slider_demo.tinkerforge.bricklet_industrial_quad_relay import BrickletIndustrialQuadRelay
+
+        CallbackTriggerDevice.__init__(self)
+
+        self.mask = 0
+        self.iqr = BrickletIndustrialQuadRelay(uid, ipcon)
+
+        self.iqr.register_callback(self.iqr.CALLBACK_MONOFLOP_DONE, self.cb_monoflop_done)
+
+    def cb_monoflop_done(self, selection_mask, value_mask):
+        if (selection_mask & self.mask) != 0:
+            self.done.release()
+
+    def trigger(self, relay, trigger_duration, wait_duration, sent=None):
+        mask = 1 << relay
+
+        def start():
+            # called with the lock held
+            self.mask = mask
+            self.iqr.set_monoflop(mask, mask, trigger_duration)
+
+        return self.trigger_pulse(start, trigger_duration, wait_duration, sent)
+
+class PiezoSpeakerTriggerDevice(CallbackTriggerDevice):
+    def __init__(self, ipcon, uid):
+        from starter_kit_camera_slider_demo.tinkerforge.bricklet_piezo_speaker import BrickletPiezoSpeaker
+
+        CallbackTriggerDevice.__init__(self)
+
+        self.ps = BrickletPiezoSpeaker(uid, ipcon)
+
+        self.ps.register_callback(self.ps.CALLBACK_BEEP_FINISHED, self.cb_done)
+
+    def trigger(self, frequency, trigger_duration, wait_duration, sent=None):
+        return self.trigger_pulse(lambda: self.ps.beep(trigger_duration, frequency), trigger_duration, wait_duration, sent)
+
+def check_red_error(error_code, *args):
+    if error_code != 0:
+        raise CameraTriggerError(error_code, 'RED Brick error occurred: {0}'.format(error_code))
+
+    if len(args) == 1:
+        return args[0]
+
+    return args
+
+def get_red_string(red, string_id):
+    string_length = check_red_error(*red.get_string_length(string_id))
+    chunks = []
+    offset = 0
+
+    while offset < string_length:
+        chunk = check_red_error(*red.get_string_chunk(string_id, offset))
+
+        if len(chunk) == 0:
+            break
+
+        chunks.append(chunk)
+        offset += len(chunk)
+
+    # the bindings return the raw bytes as a str of code points 0 to 255
+    return ''.join(chunks)[:string_length].encode('latin-1').decode('utf-8')
+
+class REDProgramCache(object):
+    # maps program identifiers to program IDs. the program objects and the
+    # session they belong to are kept alive between triggers, so starting a
+    # known program costs a single start_program call plus keep_session_alive
+    # if the session is about to expire. the ipcon request lock serializes all
+    # requests to a device, so the cache is built with one request in flight
+    # at a time, but each string is fetched without intermediate copies
+    def __init__(self, red):
+        self.red = red
+        self.lock = Lock()
+        self.session_id = None
+        self.session_renew_time = 0
+        self.program_ids = None
+        self.stale = False
+
+        self.red.register_callback(self.red.CALLBACK_PROGRAM_SCHEDULER_STATE_CHANGED,
+                                   self.cb_program_scheduler_state_changed)
+
+    def cb_program_scheduler_state_changed(self, program_id):
+        # a program was added, changed or removed. starting one of the known
+        # programs changes its state too, that does not change the mapping.
+        # the objects are released on the next lookup, not from the callback.
+        # the lock is held across RED Brick requests, taking it here would
+        # stall all other callbacks of the connection. program_ids is only
+        # ever replaced, never changed in place, so reading it is safe. while
+        # it is None a load might be in progress that misses the change
+        program_ids = self.program_ids
+
+        if program_ids == None or program_id not in program_ids.values():
+            self.stale = True
+
+    def keep_session_alive(self):
+        # called with the lock held
+        now = time.monotonic()
+
+        if self.session_id != None and now < self.session_renew_time:
+            return
+
+        if self.session_id != None:
+            error_code = self.red.keep_session_alive(self.session_id, RED_SESSION_LIFETIME)
+
+            if error_code == self.red.ERROR_CODE_SUCCESS:
+                self.session_renew_time = now + RED_SESSION_LIFETIME / 2
+                return
+
+            # the session expired, all objects of it are gone
+            self.session_id = None
+            self.program_ids = None
+
+        self.session_id = check_red_error(*self.red.create_session(RED_SESSION_LIFETIME))
+        self.session_renew_time = now + RED_SESSION_LIFETIME / 2
+
+    def release_programs(self):
+        # called with the lock held
+        if self.program_ids != None and self.session_id != None:
+            for program_id in self.program_ids.values():
+                self.red.release_object_unchecked(program_id, self.session_id)
+
+        self.program_ids = None
+        self.stale = False
+
+    def load_programs(self):
+        # called with the lock held
+        self.release_programs()
+
+        program_ids = {}
+        program_list_id = check_red_error(*self.red.get_programs(self.session_id))
+
+        try:
+            for i in range(check_red_error(*self.red.get_list_length(program_list_id))):
+                program_id, _ = check_red_error(*self.red.get_list_item(program_list_id, i, self.session_id))
+                string_id = check_red_error(*self.red.get_program_identifier(program_id, self.session_id))
+
+                try:
+                    program_ids[get_red_string(self.red, string_id)] = program_id
+                finally:
+                    self.red.release_object_unchecked(string_id, self.session_id)
+        finally:
+            self.red.release_object_unchecked(program_list_id, self.session_id)
+
+        self.program_ids = program_ids
+
+    def refresh(self):
+        # called with the lock held
+        self.keep_session_alive()
+
+        if self.program_ids == None or self.stale:
+            self.load_programs()
+
+    def load(self):
+        with self.lock:
+            self.refresh()
+
+    def get_program_id(self, identifier):
+        with self.lock:
+            self.refresh()
+
+            return self.program_ids.get(identifier)
+
+    def invalidate(self):
+        with self.lock:
+            self.release_programs()
+
+    def close(self):
+        with self.lock:
+            self.release_programs()
+
+            if self.session_id != None:
+                self.red.expire_session_unchecked(self.session_id)
+                self.session_id = None
+
+class REDTriggerDevice(object):
+    def __init__(self, ipcon, uid):
+        from starter_kit_camera_slider_demo.tinkerforge.brick_red import BrickRED
+
+        self.red = BrickRED(uid, ipcon)
+        self.program_cache = REDProgramCache(self.red)
+
+    def open(self):
+        try:
+            self.program_cache.load()
+        except (Error, CameraTriggerError):
+            pass
+
+    def close(self):
+        try:
+            self.program_cache.close()
+        except Error:
+            pass
+
+    def start_program(self, identifier):
+        program_id = self.program_cache.get_program_id(identifier)
+
+        if program_id == None:
+            raise CameraTriggerError(2, 'RED Brick program not found: {0}'.format(identifier))
+
+        return self.red.start_program(program_id)
+
+    def trigger(self, identifier, wait_duration, sent=None):
+        try:
+            error_code = self.start_program(identifier)
+
+            if error_code != self.red.ERROR_CODE_SUCCESS:
+                # the program might have been removed or replaced in the
+                # meantime, look it up again once
+                self.program_cache.invalidate()
+                check_red_error(self.start_program(identifier))
+        except Error as e:
+            raise CameraTriggerError(-1, e.description)
+
+        if sent != None:
+            sent()
+
+        time.sleep(wait_duration / 1000.0)
+
+        return ''
+
+class TriggerDriver(object):
+    # a camera trigger that owns its device and always triggers it with the
+    # same arguments
+    def __init__(self, device, args):
+        self.device = device
+        self.args = args
+
+    def open(self):
+        self.device.open()
+
+    def close(self):
+        self.device.close()
+
+    def trigger(self, sent=None):
+        return self.device.trigger(*self.args, sent=sent)
+
+# trigger names as used by the trigger server and the scripts they replace
+TRIGGER_IQR = 'iqr'
+TRIGGER_BEEP = 'beep'
+TRIGGER_RED = 'red'
+
+TRIGGER_SCRIPTS = {'trigger_iqr.py': TRIGGER_IQR,
+                   'trigger_beep.py': TRIGGER_BEEP,
+                   'trigger_red.py': TRIGGER_RED}
+
+def parse_trigger_script(camera_trigger):
+    # returns (trigger name, arguments) if the camera trigger runs one of the
+    # trigger scripts, directly or through a python interpreter
+    try:
+        args = shlex.split(camera_trigger)
+    except ValueError:
+        return None
+
+    if len(args) > 0 and os.path.basename(args[0]).lower().startswith('python'):
+        args = args[1:]
+
+    if len(args) == 0:
+        return None
+
+    name = os.path.basename(args[0])
+
+    if name not in TRIGGER_SCRIPTS:
+        return None
+
+    return TRIGGER_SCRIPTS[name], args[1:]
+
+def parse_named_trigger(name, args):
+    # args are the script arguments following host and port, as strings.
+    # returns (device class, uid, trigger arguments) or None if the name or
+    # the arguments are not valid
+    try:
+        if name == TRIGGER_IQR and len(args) == 4:
+            return IndustrialQuadRelayTriggerDevice, args[0], (int(args[1]), int(args[2]), int(args[3]))
+        elif name == TRIGGER_BEEP and len(args) == 4:
+            return PiezoSpeakerTriggerDevice, args[0], (int(args[1]), int(args[2]), int(args[3]))
+        elif name == TRIGGER_RED and len(args) == 3:
+            return REDTriggerDevice, args[0], (args[1], int(args[2]))
+    except ValueError:
+        pass
+
+    return None
+
+def create_named_trigger_driver(name, args, ipcon):
+    parsed = parse_named_trigger(name, args)
+
+    if parsed == None:
+        return None
+
+    device_class, uid, trigger_args = parsed
+
+    return TriggerDriver(device_class(ipcon, uid), trigger_args)
+
+def create_trigger_driver(camera_trigger, ipcon, host, port):
+    # returns None if the camera trigger has to be run as command line
+    parsed = parse_trigger_script(camera_trigger)
+
+    if parsed == None:
+        return None
+
+    name, args = parsed
+
+    try:
+        if len(args) < 2 or args[0] != host or int(args[1]) != port:
+            return None
+    except ValueError:
+        return None
+
+    return create_named_trigger_driver(name, args[2:], ipcon)
+
+def create_trigger(camera_trigger, ipcon, host, port):
+    driver = create_trigger_driver(camera_trigger, ipcon, host, port)
+
+    if driver != None:
+        return driver
+
+    return create_camera_trigger(camera_trigger)
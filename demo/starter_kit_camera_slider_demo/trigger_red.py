@@ -16,6 +16,25 @@ def check_error(error_code, *args):
 
     return args
 
+def get_string(red, string_id, string_length):
+    # collect the chunks and join them once instead of growing a string
+    chunks = []
+    offset = 0
+
+    while offset < string_length:
+        chunk = check_error(*red.get_string_chunk(string_id, offset))
+
+        if len(chunk) == 0:
+            break
+
+        chunks.append(chunk)
+        offset += len(chunk)
+
+    string_data = ''.join(chunks)[:string_length]
+
+    # the bindings return the raw bytes as a str of code points 0 to 255
+    return string_data.encode('latin-1').decode('utf-8')
+
 def start_program(red, identifier):
     session_id = check_error(*red.create_session(30))
     program_list_id = check_error(*red.get_programs(session_id))
@@ -26,24 +45,21 @@ def start_program(red, identifier):
 
         string_id = check_error(*red.get_program_identifier(program_id, session_id))
         string_length = check_error(*red.get_string_length(string_id))
-        string_data = ''
-
-        while len(string_data) < string_length:
-            string_data += check_error(*red.get_string_chunk(string_id, len(string_data)))
+        string_data = get_string(red, string_id, string_length)
 
-        check_error(red.release_object(string_id, session_id))
+        red.release_object_unchecked(string_id, session_id)
 
-        if string_data.decode('utf-8') == identifier:
+        if string_data == identifier:
             check_error(red.start_program(program_id))
             started = True
 
-        check_error(red.release_object(program_id, session_id))
+        red.release_object_unchecked(program_id, session_id)
 
         if started:
             break
 
-    check_error(red.release_object(program_list_id, session_id))
-    check_error(red.expire_session(session_id))
+    red.release_object_unchecked(program_list_id, session_id)
+    red.expire_session_unchecked(session_id)
 
     return started
 
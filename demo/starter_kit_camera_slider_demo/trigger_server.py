@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+trigger_server.py: Trigger Server for External Camera Trigger Scripts
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+# keeps an IP Connection and the trigger device objects open and fires
+# triggers on request over a UNIX domain socket. a request is a single line
+# with the trigger name and the arguments of the corresponding trigger script
+# without host and port:
+#
+#   iqr <iqr-uid> <relay> <trigger-duration> <wait-duration>
+#   beep <ps-uid> <frequency> <trigger-duration> <wait-duration>
+#   red <red-uid> <program-identifier> <wait-duration>
+#   ping
+#
+# the response is a single line, either "OK <output>" or "ERROR <code>
+# <message>". trigger_client.py can be used as camera trigger, as can socat:
+#
+#   echo "iqr 6ww 0 100 50" | socat - UNIX-CONNECT:<socket>
+
+import sys
+if (sys.hexversion & 0xFF000000) != 0x03000000:
+    print('Python 3.x required')
+    sys.exit(1)
+
+import os
+
+def prepare_package(package_name):
+    # from http://www.py2exe.org/index.cgi/WhereAmI
+    if hasattr(sys, 'frozen'):
+        program_path = os.path.dirname(os.path.realpath(sys.executable))
+    else:
+        program_path = os.path.dirname(os.path.realpath(__file__))
+
+    # allow the program to be directly started by calling 'trigger_server.py'
+    # without '<package_name>' being in the path already
+    if package_name not in sys.modules:
+        head, tail = os.path.split(program_path)
+
+        if head not in sys.path:
+            sys.path.insert(0, head)
+
+        if not hasattr(sys, 'frozen'):
+            # load and inject in modules list, this allows to have the source in a
+            # directory named differently than '<package_name>'
+            sys.modules[package_name] = __import__(tail, globals(), locals())
+
+    return program_path
+
+program_path = prepare_package('starter_kit_camera_slider_demo')
+
+import shlex
+import signal
+import socket
+import argparse
+import threading
+import socketserver
+from datetime import datetime
+
+from starter_kit_camera_slider_demo.tinkerforge.ip_connection import IPConnection, Error
+from starter_kit_camera_slider_demo.camera import CameraTriggerError
+from starter_kit_camera_slider_demo.trigger_drivers import parse_named_trigger
+from starter_kit_camera_slider_demo.config_common import DEFAULT_HOST, DEFAULT_PORT
+
+def get_default_socket_path():
+    runtime_dir = os.getenv('XDG_RUNTIME_DIR')
+
+    if runtime_dir == None or len(runtime_dir) < 1:
+        runtime_dir = '/tmp'
+
+    return os.path.join(runtime_dir, 'starter_kit_camera_slider_demo_trigger.sock')
+
+def is_socket_in_use(socket_path):
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        s.connect(socket_path)
+    except OSError:
+        return False
+    finally:
+        s.close()
+
+    return True
+
+def log(message):
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    print(timestamp + ' - ' + message)
+    sys.stdout.flush()
+
+class TriggerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path, ipcon):
+        self.ipcon = ipcon
+        self.devices = {}
+        self.lock = threading.Lock()
+
+        socketserver.UnixStreamServer.__init__(self, socket_path, TriggerRequestHandler)
+
+    def get_device(self, device_class, uid):
+        # called with the lock held. requests for the same UID share one
+        # device object, a second one would take over its callbacks and
+        # responses
+        key = (device_class, uid)
+
+        if key not in self.devices:
+            device = device_class(self.ipcon, uid)
+
+            device.open()
+            self.devices[key] = device
+
+        return self.devices[key]
+
+    def execute(self, line):
+        try:
+            parts = shlex.split(line)
+        except ValueError as e:
+            return 'ERROR 1 Malformed request: {0}'.format(e)
+
+        if len(parts) == 0:
+            return 'ERROR 1 Empty request'
+
+        if parts == ['ping']:
+            return 'OK pong'
+
+        parsed = parse_named_trigger(parts[0], parts[1:])
+
+        if parsed == None:
+            return 'ERROR 1 Unknown trigger or invalid arguments: {0}'.format(line)
+
+        device_class, uid, trigger_args = parsed
+
+        # the devices are shared, fire one trigger at a time
+        with self.lock:
+            device = self.get_device(device_class, uid)
+
+            try:
+                output = device.trigger(*trigger_args)
+            except CameraTriggerError as e:
+                return 'ERROR {0} {1}'.format(e.returncode, ' '.join(e.output.split()))
+
+        return 'OK ' + ' '.join(output.split())
+
+    def close(self):
+        with self.lock:
+            for device in self.devices.values():
+                device.close()
+
+            self.devices = {}
+
+class TriggerRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        # a client can send any number of requests over one connection
+        for line in self.rfile:
+            line = line.decode('utf-8', errors='replace').strip()
+
+            if len(line) == 0:
+                continue
+
+            response = self.server.execute(line)
+
+            if line != 'ping':
+                log('{0}: {1}'.format(line, response))
+
+            self.wfile.write((response + '\n').encode('utf-8'))
+            self.wfile.flush()
+
+def main():
+    parser = argparse.ArgumentParser(description='Trigger server for Starter Kit: Camera Slider. '
+                                                 'Keeps the connection and the trigger devices open between triggers.')
+
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--socket', default=get_default_socket_path(), help='UNIX domain socket path')
+
+    args = parser.parse_args()
+
+    if not hasattr(socket, 'AF_UNIX'):
+        print('error: UNIX domain sockets are not supported on this platform')
+        return 1
+
+    ipcon = IPConnection()
+
+    try:
+        ipcon.connect(args.host, args.port)
+    except (Error, OSError) as e:
+        print('error: could not connect to {0}:{1}: {2}'.format(args.host, args.port, e))
+        return 1
+
+    # a socket file left behind by a server that was killed would block bind,
+    # but the one of a running server must not be taken over
+    if os.path.exists(args.socket):
+        if is_socket_in_use(args.socket):
+            print('error: another trigger server is already listening on {0}'.format(args.socket))
+            ipcon.disconnect()
+            return 1
+
+        os.remove(args.socket)
+
+    # only the current user is allowed to fire triggers
+    umask = os.umask(0o177)
+
+    try:
+        server = TriggerServer(args.socket, ipcon)
+    finally:
+        os.umask(umask)
+
+    def shutdown(signal_number, frame):
+        raise KeyboardInterrupt()
+
+    signal.signal(signal.SIGTERM, shutdown)
+
+    log('Listening on {0}, connected to {1}:{2}'.format(args.socket, args.host, args.port))
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        log('Shutting down')
+    finally:
+        server.server_close()
+        server.close()
+        os.remove(args.socket)
+        ipcon.disconnect()
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+trigger_worker.py: Persistent Trigger Worker
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+import time
+import threading
+import traceback
+from collections import deque
+
+from starter_kit_camera_slider_demo.time_lapse import get_timestamp
+
+# the coarse wait on the condition variable ends this much before the deadline,
+# the rest is slept with time.sleep, which uses clock_nanosleep on Linux and a
+# high-resolution waitable timer on Windows
+FINE_WAIT_THRESHOLD = 0.002
+
+def get_percentile(sorted_values, percentile):
+    if len(sorted_values) == 0:
+        return 0.0
+
+    index = int(round((len(sorted_values) - 1) * percentile / 100.0))
+
+    return sorted_values[index]
+
+class LatenessStatistics(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latenesses = []
+
+    def reset(self):
+        with self.lock:
+            self.latenesses = []
+
+    def add(self, lateness):
+        with self.lock:
+            self.latenesses.append(lateness)
+
+    def get_summary(self):
+        # returns count, mean, p50, p99 and max
+        with self.lock:
+            latenesses = sorted(self.latenesses)
+
+        if len(latenesses) == 0:
+            return 0, 0.0, 0.0, 0.0, 0.0
+
+        return len(latenesses), sum(latenesses) / len(latenesses), \
+               get_percentile(latenesses, 50), get_percentile(latenesses, 99), latenesses[-1]
+
+class TriggerWorker(object):
+    # a single long-lived thread that executes actions at deadlines on the
+    # monotonic clock. a request is (generation, get_deadline, action), where
+    # get_deadline returns None while the deadline is unknown (e.g. paused).
+    # cancel() increments the generation, which drops all pending requests and
+    # aborts the current wait immediately
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.requests = deque()
+        self.generation = 0
+        self.running = False
+        self.thread = None
+        self.statistics = LatenessStatistics()
+
+    def start(self):
+        with self.condition:
+            if self.running:
+                return
+
+            self.running = True
+
+        self.thread = threading.Thread(target=self.loop, name='TriggerWorker')
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.generation += 1
+            self.requests.clear()
+            self.condition.notify_all()
+
+    def submit(self, get_deadline, action):
+        with self.condition:
+            self.requests.append((self.generation, get_deadline, action))
+            self.condition.notify_all()
+
+            return self.generation
+
+    def cancel(self):
+        with self.condition:
+            self.generation += 1
+            self.requests.clear()
+            self.condition.notify_all()
+
+    def wake(self):
+        # has to be called if a deadline changed, e.g. on resume
+        with self.condition:
+            self.condition.notify_all()
+
+    def is_current(self, generation):
+        return generation == self.generation
+
+    def wait_for_deadline(self, generation, get_deadline):
+        # called with the condition held, returns None if cancelled
+        while self.running and generation == self.generation:
+            deadline = get_deadline()
+
+            if deadline == None:
+                self.condition.wait()
+                continue
+
+            remaining = deadline - get_timestamp()
+
+            if remaining <= FINE_WAIT_THRESHOLD:
+                return deadline
+
+            self.condition.wait(remaining - FINE_WAIT_THRESHOLD)
+
+        return None
+
+    def loop(self):
+        with self.condition:
+            while self.running:
+                if len(self.requests) == 0:
+                    self.condition.wait()
+                    continue
+
+                generation, get_deadline, action = self.requests[0]
+                deadline = self.wait_for_deadline(generation, get_deadline)
+
+                if deadline == None:
+                    continue
+
+                self.requests.popleft()
+                self.condition.release()
+
+                try:
+                    remaining = deadline - get_timestamp()
+
+                    if remaining > 0:
+                        time.sleep(remaining)
+
+                    if generation == self.generation:
+                        lateness = get_timestamp() - deadline
+
+                        self.statistics.add(lateness)
+                        action(generation, lateness)
+                except:
+                    traceback.print_exc()
+                finally:
+                    self.condition.acquire()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+ui_state.py: Diff-Based Widget State
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+import time
+
+SETTERS = {'enabled': 'setEnabled',
+           'visible': 'setVisible',
+           'text': 'setText',
+           'tab_enabled': 'setTabEnabled'}
+
+class UIState(object):
+    # collects the desired widget properties as (widget, property, *args) ->
+    # value and applies only those that differ from the previously applied
+    # value. properties managed here must not be changed elsewhere, otherwise
+    # the applied state gets out of sync with the widgets
+    def __init__(self):
+        self.applied = {}
+        self.pending = {}
+
+        self.reset_statistics()
+
+    def reset_statistics(self):
+        self.apply_count = 0
+        self.property_count = 0
+        self.change_count = 0
+        self.apply_duration = 0.0
+        self.setter_duration = 0.0
+
+    def set(self, widget, prop, value, *args):
+        self.pending[(widget, prop) + args] = value
+
+    def set_enabled(self, widget, enabled):
+        self.set(widget, 'enabled', bool(enabled))
+
+    def set_visible(self, widget, visible):
+        self.set(widget, 'visible', bool(visible))
+
+    def set_text(self, widget, text):
+        self.set(widget, 'text', text)
+
+    def apply(self):
+        start = time.perf_counter()
+        pending = self.pending
+        self.pending = {}
+
+        for key, value in pending.items():
+            if key in self.applied and self.applied[key] == value:
+                continue
+
+            widget, prop = key[0], key[1]
+            setter_start = time.perf_counter()
+
+            getattr(widget, SETTERS[prop])(*(key[2:] + (value,)))
+
+            self.setter_duration += time.perf_counter() - setter_start
+            self.applied[key] = value
+            self.change_count += 1
+
+        self.apply_count += 1
+        self.property_count += len(pending)
+        self.apply_duration += time.perf_counter() - start
+
+    def get_saved_duration(self):
+        # estimated time that the skipped setter calls would have taken
+        if self.change_count == 0:
+            return 0.0
+
+        return self.setter_duration / self.change_count * (self.property_count - self.change_count)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+test_config_common.py: Tests for the Config Cache
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+import os
+import sys
+import stat
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from starter_kit_camera_slider_demo.config_common import ConfigCache, write_file_atomically
+
+class FakeStore(object):
+    # a config store in memory that counts the operations of the cache
+    def __init__(self):
+        self.values = {'a': '1', 'b': '2'}
+        self.mtime = 1
+        self.load_count = 0
+        self.mtime_count = 0
+        self.saves = []
+
+    def load(self):
+        self.load_count += 1
+        return dict(self.values)
+
+    def save(self, values, changed_keys):
+        self.saves.append(sorted(changed_keys))
+
+        for key in changed_keys:
+            self.values[key] = values[key]
+
+        self.mtime += 1
+
+    def get_mtime(self):
+        self.mtime_count += 1
+        return self.mtime
+
+    def change_from_outside(self, key, value):
+        self.values[key] = value
+        self.mtime += 1
+
+def set_value(cache, key, value):
+    cache.get_values()[key] = value
+    cache.changed(key)
+
+class ConfigCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.store = FakeStore()
+        self.cache = ConfigCache(self.store.load, self.store.save, self.store.get_mtime)
+
+    def test_loads_once(self):
+        self.assertEqual(self.cache.get_values()['a'], '1')
+        self.assertEqual(self.cache.get_values()['b'], '2')
+        self.assertEqual(self.store.load_count, 1)
+
+    def test_reloads_after_outside_change(self):
+        self.cache.get_values()
+        self.store.change_from_outside('a', '3')
+
+        self.assertEqual(self.cache.get_values()['a'], '3')
+        self.assertEqual(self.store.load_count, 2)
+
+    def test_change_without_transaction_saves_right_away(self):
+        set_value(self.cache, 'a', '5')
+
+        self.assertEqual(self.store.saves, [['a']])
+        self.assertEqual(self.store.values['a'], '5')
+
+        # its own save is not mistaken for an outside change
+        self.cache.get_values()
+        self.assertEqual(self.store.load_count, 1)
+
+    def test_transaction_saves_once(self):
+        with self.cache.transaction():
+            set_value(self.cache, 'a', '5')
+
+            with self.cache.transaction():
+                set_value(self.cache, 'b', '6')
+
+            self.assertEqual(self.store.saves, [])
+
+            # staged changes win over the store contents
+            self.store.change_from_outside('a', '7')
+            self.assertEqual(self.cache.get_values()['a'], '5')
+
+        self.assertEqual(self.store.saves, [['a', 'b']])
+        self.assertEqual(self.store.values, {'a': '5', 'b': '6'})
+
+    def test_failed_transaction_discards_changes(self):
+        try:
+            with self.cache.transaction():
+                set_value(self.cache, 'a', '5')
+                raise ValueError()
+        except ValueError:
+            pass
+
+        self.assertEqual(self.store.saves, [])
+        self.assertEqual(self.cache.get_values()['a'], '1')
+
+    def test_batch_checks_mtime_once(self):
+        self.cache.get_values()
+        self.store.mtime_count = 0
+
+        with self.cache.batch():
+            for i in range(10):
+                self.cache.get_values()
+
+        self.assertEqual(self.store.mtime_count, 1)
+
+        # the next batch checks again and sees the outside change
+        self.store.change_from_outside('a', '3')
+
+        with self.cache.batch():
+            self.assertEqual(self.cache.get_values()['a'], '3')
+
+class WriteFileAtomicallyTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'config', 'test.conf')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read(self):
+        with open(self.filename, 'r') as f:
+            return f.read()
+
+    def test_write_and_replace(self):
+        write_file_atomically(self.filename, 'w', lambda f: f.write('old'))
+        os.chmod(self.filename, 0o600)
+
+        write_file_atomically(self.filename, 'w', lambda f: f.write('new'))
+
+        self.assertEqual(self.read(), 'new')
+        self.assertEqual(stat.S_IMODE(os.stat(self.filename).st_mode), 0o600)
+        self.assertEqual(os.listdir(os.path.dirname(self.filename)), ['test.conf'])
+
+    def test_failed_write_keeps_old_content(self):
+        write_file_atomically(self.filename, 'w', lambda f: f.write('old'))
+
+        def write(f):
+            f.write('partial')
+            raise ValueError()
+
+        self.assertRaises(ValueError, write_file_atomically, self.filename, 'w', write)
+        self.assertEqual(self.read(), 'old')
+        self.assertEqual(os.listdir(os.path.dirname(self.filename)), ['test.conf'])
+
+if __name__ == '__main__':
+    unittest.main()
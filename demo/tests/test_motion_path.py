@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+test_motion_path.py: Tests for Keyframe Motion Paths
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from starter_kit_camera_slider_demo.motion_path import INTERPOLATION_LINEAR, INTERPOLATION_EASE_IN_OUT, \
+                                                      INTERPOLATION_CUBIC, MotionPathError, parse_keyframes, \
+                                                      evaluate_path, get_move_duration, validate_path
+
+class ParseKeyframesTest(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(parse_keyframes('1:0, 50:2000,, 100:8000'), [(0, 0), (49, 2000), (99, 8000)])
+
+    def test_malformed(self):
+        for text in ['1:0:5', 'a:0', '1:x', '0:100']:
+            self.assertRaises(MotionPathError, parse_keyframes, text)
+
+class EvaluatePathTest(unittest.TestCase):
+    def test_linear(self):
+        self.assertEqual(evaluate_path([(0, 0), (4, 400)], 5), [0, 100, 200, 300, 400])
+
+    def test_keyframes_are_hit(self):
+        keyframes = [(0, 0), (3, 900), (6, 300), (9, 1200)]
+
+        for interpolation in [INTERPOLATION_LINEAR, INTERPOLATION_EASE_IN_OUT, INTERPOLATION_CUBIC]:
+            positions = evaluate_path(keyframes, 10, interpolation)
+
+            for frame, position in keyframes:
+                self.assertEqual(positions[frame], position)
+
+    def test_ease_in_out_is_symmetric(self):
+        positions = evaluate_path([(0, 0), (10, 1000)], 11, INTERPOLATION_EASE_IN_OUT)
+
+        for i in range(11):
+            self.assertEqual(positions[i] + positions[10 - i], 1000)
+
+        # slow at the ends, fast in the middle
+        self.assertTrue(positions[1] - positions[0] < positions[6] - positions[5])
+
+    def test_cubic_does_not_overshoot(self):
+        keyframes = [(0, 0), (5, 1000), (10, 1000), (15, 0)]
+        positions = evaluate_path(keyframes, 16, INTERPOLATION_CUBIC)
+
+        self.assertTrue(min(positions) >= 0)
+        self.assertTrue(max(positions) <= 1000)
+
+    def test_single_keyframe(self):
+        self.assertEqual(evaluate_path([(0, 500)], 1), [500])
+
+    def test_keyframes_must_cover_all_images(self):
+        self.assertRaises(MotionPathError, evaluate_path, [(0, 0), (3, 100)], 5)
+        self.assertRaises(MotionPathError, evaluate_path, [(1, 0), (4, 100)], 5)
+        self.assertRaises(MotionPathError, evaluate_path, [(0, 0), (4, 100)], 5, 'bogus')
+
+class MoveDurationTest(unittest.TestCase):
+    def test_trapezoid(self):
+        # 1 s to accelerate to 1000 steps/s and 1 s to decelerate cover 1000
+        # steps, the remaining 1000 steps take 1 s at full velocity
+        self.assertAlmostEqual(get_move_duration(2000, 1000, 1000, 1000), 3.0)
+        self.assertAlmostEqual(get_move_duration(-2000, 1000, 1000, 1000), 3.0)
+
+    def test_triangle(self):
+        # the velocity peaks at 500 steps/s without reaching the maximum
+        self.assertAlmostEqual(get_move_duration(250, 1000, 1000, 1000), 1.0)
+
+    def test_degenerate(self):
+        self.assertEqual(get_move_duration(0, 1000, 1000, 1000), 0.0)
+        self.assertEqual(get_move_duration(100, 0, 1000, 1000), float('inf'))
+
+    def test_validate_path(self):
+        violations = validate_path([0, 250, 2250, 2500], 2.0, 1000, 1000, 1000)
+
+        self.assertEqual([index for index, _ in violations], [2])
+        self.assertAlmostEqual(violations[0][1], 3.0)
+
+if __name__ == '__main__':
+    unittest.main()
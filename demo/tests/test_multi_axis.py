@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+test_multi_axis.py: Tests for Multi-Axis Rigs
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from starter_kit_camera_slider_demo.motion_path import MotionPathError, get_move_duration
+from starter_kit_camera_slider_demo.multi_axis import MAX_MOTION_PARAMETER, parse_joint_keyframes, \
+                                                     evaluate_joint_path, plan_joint_move, plan_joint_path
+
+LIMITS = [(10000, 5000, 5000), (2000, 1000, 1000), (4000, 8000, 2000)]
+
+class JointKeyframesTest(unittest.TestCase):
+    def test_parse_and_evaluate(self):
+        keyframes = parse_joint_keyframes('1:0/0/0, 5:400/-80/1200', 3)
+
+        self.assertEqual(evaluate_joint_path(keyframes, 5, 3)[2], (200, -40, 600))
+
+    def test_axis_count_mismatch(self):
+        self.assertRaises(MotionPathError, parse_joint_keyframes, '1:0/0, 5:400/80', 3)
+
+class PlanJointMoveTest(unittest.TestCase):
+    def assert_synchronized(self, start_positions, end_positions, limits):
+        duration, parameters = plan_joint_move(start_positions, end_positions, limits)
+        arrivals = []
+
+        for start, end, axis_parameters, axis_limits in zip(start_positions, end_positions, parameters, limits):
+            for value, limit in zip(axis_parameters, axis_limits):
+                self.assertTrue(1 <= value <= min(limit, MAX_MOTION_PARAMETER))
+                self.assertEqual(value, int(value))
+
+            if start != end:
+                arrivals.append(get_move_duration(end - start, *axis_parameters))
+
+        self.assertAlmostEqual(max(arrivals), duration)
+
+        # all moving axes arrive together, up to the rounding of the
+        # parameters to whole steps/s and steps/s^2
+        self.assertTrue(max(arrivals) - min(arrivals) < 0.02 * duration)
+
+        return duration, parameters
+
+    def test_arrival_times_match(self):
+        self.assert_synchronized([0, 0, 0], [100000, 3000, -40000], LIMITS)
+        self.assert_synchronized([0, 0, 0], [20000, -15000, 7000], LIMITS)
+
+    def test_short_axis(self):
+        # an axis that moves only a few steps ends up with small rounded
+        # parameters that still follow the same time profile
+        self.assert_synchronized([0, 0], [40000, 5], LIMITS[:2])
+
+    def test_limits_are_respected(self):
+        # the slowest axis moves at its limits, so the move takes as long as
+        # that axis alone would need
+        duration, _ = self.assert_synchronized([0, 0], [1000, 4000], LIMITS[:2])
+
+        self.assertAlmostEqual(duration, get_move_duration(4000, *LIMITS[1]), places=3)
+
+    def test_idle_axes_keep_limits(self):
+        duration, parameters = plan_joint_move([0, 10, 20], [500, 10, 20], LIMITS)
+
+        self.assertEqual(parameters[1], LIMITS[1])
+        self.assertEqual(parameters[2], LIMITS[2])
+        self.assertAlmostEqual(duration, get_move_duration(500, *LIMITS[0]))
+
+    def test_no_motion(self):
+        self.assertEqual(plan_joint_move([1, 2], [1, 2], LIMITS[:2]), (0.0, LIMITS[:2]))
+
+    def test_plan_joint_path(self):
+        plan = plan_joint_path([(0, 0), (1000, 50), (1000, 50)], LIMITS[:2])
+
+        self.assertEqual(len(plan), 3)
+        self.assertEqual(plan[0][0], 0.0)
+        self.assertTrue(plan[1][0] > 0)
+        self.assertEqual(plan[2][0], 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+test_slider.py: Tests for the Position Tracker
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from starter_kit_camera_slider_demo.slider import MIN_INT32, MAX_INT32, MAX_SEGMENT_STEPS, PositionTracker, \
+                                                 unwrap_int32_delta
+
+class FakeStepper(object):
+    # records the requests, the device position is set by the test
+    def __init__(self, position):
+        self.position = position
+        self.requests = []
+
+    def get_current_position(self):
+        self.requests.append(('get_current_position',))
+        return self.position
+
+    def set_target_position(self, position):
+        assert MIN_INT32 <= position <= MAX_INT32
+        self.requests.append(('set_target_position', position))
+
+    def set_steps(self, steps):
+        assert MIN_INT32 <= steps <= MAX_INT32
+        self.requests.append(('set_steps', steps))
+
+    def stop(self):
+        self.requests.append(('stop',))
+
+    def full_brake(self):
+        self.requests.append(('full_brake',))
+
+class UnwrapTest(unittest.TestCase):
+    def test_no_wrap(self):
+        self.assertEqual(unwrap_int32_delta(150, 100), 50)
+        self.assertEqual(unwrap_int32_delta(100, 150), -50)
+
+    def test_wrap_forward(self):
+        self.assertEqual(unwrap_int32_delta(MIN_INT32 + 5, MAX_INT32 - 4), 10)
+
+    def test_wrap_backward(self):
+        self.assertEqual(unwrap_int32_delta(MAX_INT32 - 4, MIN_INT32 + 5), -10)
+
+class PositionTrackerTest(unittest.TestCase):
+    def test_virtual_position_follows_wraps(self):
+        stepper = FakeStepper(MAX_INT32 - 10)
+        tracker = PositionTracker(stepper)
+
+        self.assertEqual(tracker.get_cached_position(), MAX_INT32 - 10)
+        self.assertEqual(tracker.update(MIN_INT32 + 9), MAX_INT32 + 10)
+
+        stepper.position = MIN_INT32 + 100
+        self.assertEqual(tracker.get_current_position(), MAX_INT32 + 101)
+
+        # and back over the wrap
+        self.assertEqual(tracker.update(MAX_INT32), MAX_INT32)
+        self.assertEqual(tracker.get_cached_position(), MAX_INT32)
+
+    def test_absolute_target_within_int32(self):
+        stepper = FakeStepper(1000)
+        tracker = PositionTracker(stepper)
+        del stepper.requests[:]
+
+        tracker.set_target_position(5000)
+
+        self.assertEqual(stepper.requests, [('set_target_position', 5000)])
+        self.assertFalse(tracker.next_segment())
+
+    def test_absolute_target_after_wrap(self):
+        # the device position wrapped once, the target is still reachable
+        # with an absolute device position and needs no position read
+        stepper = FakeStepper(MAX_INT32 - 10)
+        tracker = PositionTracker(stepper)
+        tracker.update(MIN_INT32 + 10)
+        del stepper.requests[:]
+
+        tracker.set_target_position(MAX_INT32 + 100)
+
+        self.assertEqual(stepper.requests, [('set_target_position', MIN_INT32 + 99)])
+
+    def test_relative_target_beyond_int32(self):
+        stepper = FakeStepper(MAX_INT32 - 10)
+        tracker = PositionTracker(stepper)
+        del stepper.requests[:]
+
+        tracker.set_target_position(MAX_INT32 + 100)
+
+        self.assertEqual(stepper.requests, [('get_current_position',), ('set_steps', 110)])
+        self.assertFalse(tracker.next_segment())
+
+    def test_relative_target_in_segments(self):
+        stepper = FakeStepper(0)
+        tracker = PositionTracker(stepper)
+        del stepper.requests[:]
+
+        # the target is more than 2^31 steps away from the current position
+        tracker.set_target_position(-2 * MAX_SEGMENT_STEPS - 10)
+
+        while tracker.next_segment():
+            pass
+
+        steps = [request[1] for request in stepper.requests if request[0] == 'set_steps']
+
+        self.assertEqual(steps, [-MAX_SEGMENT_STEPS, -MAX_SEGMENT_STEPS, -10])
+
+    def test_prepare_reads_before_send(self):
+        stepper = FakeStepper(MAX_INT32 - 10)
+        tracker = PositionTracker(stepper)
+        del stepper.requests[:]
+
+        send = tracker.prepare_target_position(MAX_INT32 + 100)
+
+        self.assertEqual(stepper.requests, [('get_current_position',)])
+
+        del stepper.requests[:]
+        send()
+
+        self.assertEqual(stepper.requests, [('set_steps', 110)])
+
+    def test_stop_drops_remaining_segments(self):
+        stepper = FakeStepper(0)
+        tracker = PositionTracker(stepper)
+
+        tracker.set_target_position(2 * MAX_SEGMENT_STEPS + 10)
+        tracker.stop()
+
+        self.assertFalse(tracker.next_segment())
+        self.assertEqual(stepper.requests[-1], ('stop',))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+test_time_lapse.py: Tests for the Time Lapse Schedule
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from starter_kit_camera_slider_demo.time_lapse import TimeLapseSchedule, get_continuous_velocity
+
+class TimeLapseScheduleTest(unittest.TestCase):
+    def test_deadlines(self):
+        schedule = TimeLapseSchedule([0, 10, 20, 30], 2.0, initial_delay=1.0)
+
+        self.assertEqual(schedule.get_deadline(0), None)
+        self.assertEqual(schedule.get_remaining_time(), 1.0)
+
+        schedule.start(100.0)
+
+        self.assertEqual([schedule.get_deadline(i) for i in range(4)], [101.0, 103.0, 105.0, 107.0])
+        self.assertEqual(schedule.get_deadline(4), None)
+        self.assertEqual(schedule.get_delay(1, 102.5), 0.5)
+
+    def test_late_triggers_do_not_drift(self):
+        schedule = TimeLapseSchedule([0, 10, 20], 2.0)
+        schedule.start(100.0)
+
+        schedule.record_trigger(0, 100.3)
+        schedule.record_trigger(1, 102.1)
+
+        self.assertEqual(schedule.get_deadline(2), 104.0)
+        self.assertEqual(schedule.remaining_image_count, 1)
+
+        count, average, maximum = schedule.get_jitter_statistics()
+
+        self.assertEqual(count, 2)
+        self.assertAlmostEqual(average, 0.2)
+        self.assertAlmostEqual(maximum, 0.3)
+
+    def test_pause_resume(self):
+        schedule = TimeLapseSchedule([0, 10, 20, 30], 2.0)
+        schedule.start(100.0)
+        schedule.record_trigger(0, 100.0)
+        schedule.record_trigger(1, 102.0)
+
+        schedule.pause(103.0)
+
+        self.assertTrue(schedule.paused)
+        self.assertEqual(schedule.get_deadline(2), None)
+        self.assertEqual(schedule.get_remaining_time(150.0), 1.0)
+
+        # pausing twice keeps the first pause time
+        schedule.pause(104.0)
+        schedule.resume(113.0)
+
+        self.assertFalse(schedule.paused)
+        self.assertEqual(schedule.get_deadline(2), 114.0)
+        self.assertEqual(schedule.get_deadline(3), 116.0)
+
+        # a second pause adds up
+        schedule.pause(114.0)
+        schedule.resume(115.0)
+
+        self.assertEqual(schedule.get_deadline(2), 115.0)
+
+    def test_resume_without_pause(self):
+        schedule = TimeLapseSchedule([0, 10], 2.0)
+        schedule.start(100.0)
+        schedule.resume(150.0)
+
+        self.assertEqual(schedule.get_deadline(1), 102.0)
+
+    def test_done(self):
+        schedule = TimeLapseSchedule([0, 10], 2.0)
+        schedule.start(100.0)
+        schedule.record_trigger(0, 100.0, position=1)
+        schedule.record_trigger(1, 102.0, position=11)
+
+        self.assertTrue(schedule.done)
+        self.assertEqual(schedule.get_remaining_time(), 0.0)
+        self.assertEqual(list(schedule.actual_positions), [1, 11])
+
+class ContinuousVelocityTest(unittest.TestCase):
+    def test_velocity(self):
+        # 4 intervals of 2 s for 800 steps
+        self.assertEqual(get_continuous_velocity(0, 800, 5, 2.0), 100)
+        self.assertEqual(get_continuous_velocity(800, 0, 5, 2.0), 100)
+
+if __name__ == '__main__':
+    unittest.main()
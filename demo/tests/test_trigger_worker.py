@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Starter Kit: Camera Slider Demo
+Copyright (C) 2026 agent <agent@local>
+
+test_trigger_worker.py: Tests for the Trigger Worker
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+import os
+import sys
+import time
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from starter_kit_camera_slider_demo.time_lapse import get_timestamp
+from starter_kit_camera_slider_demo.trigger_worker import TriggerWorker, LatenessStatistics, get_percentile
+
+WAIT_TIMEOUT = 5.0
+
+class Recorder(object):
+    # an action that records when it was executed
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+        self.done = threading.Event()
+
+    def __call__(self, generation, lateness):
+        self.calls.append((self.name, get_timestamp(), lateness))
+        self.done.set()
+
+class TriggerWorkerTest(unittest.TestCase):
+    def setUp(self):
+        self.worker = TriggerWorker()
+        self.worker.start()
+        self.calls = []
+
+    def tearDown(self):
+        self.worker.stop()
+        self.worker.thread.join(WAIT_TIMEOUT)
+
+    def test_actions_run_in_order_at_deadlines(self):
+        now = get_timestamp()
+        deadlines = [now + 0.05, now + 0.1]
+        first = Recorder('first', self.calls)
+        second = Recorder('second', self.calls)
+
+        self.worker.submit(lambda: deadlines[0], first)
+        self.worker.submit(lambda: deadlines[1], second)
+
+        self.assertTrue(second.done.wait(WAIT_TIMEOUT))
+        self.assertEqual([call[0] for call in self.calls], ['first', 'second'])
+
+        for (_, timestamp, lateness), deadline in zip(self.calls, deadlines):
+            self.assertTrue(timestamp >= deadline)
+            self.assertTrue(lateness >= 0)
+
+        self.assertEqual(self.worker.statistics.get_summary()[0], 2)
+
+    def test_cancel_drops_pending_requests(self):
+        now = get_timestamp()
+        cancelled = Recorder('cancelled', self.calls)
+        current = Recorder('current', self.calls)
+
+        generation = self.worker.submit(lambda: now + 0.1, cancelled)
+        self.worker.cancel()
+        self.assertFalse(self.worker.is_current(generation))
+
+        self.worker.submit(lambda: now + 0.01, current)
+
+        self.assertTrue(current.done.wait(WAIT_TIMEOUT))
+        time.sleep(0.15)
+        self.assertEqual([call[0] for call in self.calls], ['current'])
+
+    def test_unknown_deadline_waits_for_wake(self):
+        deadline = [None]
+        recorder = Recorder('paused', self.calls)
+
+        self.worker.submit(lambda: deadline[0], recorder)
+        self.assertFalse(recorder.done.wait(0.05))
+
+        deadline[0] = get_timestamp()
+        self.worker.wake()
+
+        self.assertTrue(recorder.done.wait(WAIT_TIMEOUT))
+
+    def test_failing_action_does_not_stop_worker(self):
+        recorder = Recorder('after', self.calls)
+
+        def fail(generation, lateness):
+            raise ValueError('expected by the test')
+
+        stderr = sys.stderr
+        sys.stderr = open(os.devnull, 'w')
+
+        try:
+            self.worker.submit(get_timestamp, fail)
+            self.worker.submit(get_timestamp, recorder)
+
+            self.assertTrue(recorder.done.wait(WAIT_TIMEOUT))
+        finally:
+            sys.stderr.close()
+            sys.stderr = stderr
+
+class LatenessStatisticsTest(unittest.TestCase):
+    def test_summary(self):
+        statistics = LatenessStatistics()
+
+        self.assertEqual(statistics.get_summary(), (0, 0.0, 0.0, 0.0, 0.0))
+
+        for lateness in [0.003, 0.001, 0.002]:
+            statistics.add(lateness)
+
+        count, mean, p50, p99, maximum = statistics.get_summary()
+
+        self.assertEqual(count, 3)
+        self.assertAlmostEqual(mean, 0.002)
+        self.assertEqual(p50, 0.002)
+        self.assertEqual(p99, 0.003)
+        self.assertEqual(maximum, 0.003)
+
+    def test_percentile(self):
+        self.assertEqual(get_percentile([], 50), 0.0)
+        self.assertEqual(get_percentile([1, 2, 3, 4, 5], 50), 3)
+
+if __name__ == '__main__':
+    unittest.main()